@@ -10,10 +10,11 @@ __author__ = "Curses UI Framework Team"
 
 from .controller import CursesController
 from .model import ApplicationModel
-from .view import WindowView
+from .view import WindowView, BottomStatistics
 from .window_manager import WindowManager, WindowType, WindowGeometry, LayoutInfo
 from .layout_calculator import LayoutCalculator
 from .frame_renderer import FrameRenderer, FrameStyle
+from .frame_buffer import FrameBuffer
 from .exceptions import (
     CursesFrameworkError,
     TerminalTooSmallError,
@@ -24,6 +25,7 @@ __all__ = [
     "CursesController",
     "ApplicationModel",
     "WindowView",
+    "BottomStatistics",
     "WindowManager",
     "WindowType",
     "WindowGeometry",
@@ -31,6 +33,7 @@ __all__ = [
     "LayoutCalculator",
     "FrameRenderer",
     "FrameStyle",
+    "FrameBuffer",
     "CursesFrameworkError",
     "TerminalTooSmallError",
     "WindowCreationError"
@@ -7,13 +7,47 @@ for window content with advanced text styling support.
 """
 
 import curses
+import re
 import textwrap
+from sys import intern
 import hashlib
-from typing import List, Optional, Tuple, Dict, Union
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
 
+# Characters where textwrap may break or drop text
+_BREAK_OPPORTUNITY_RE = re.compile(r'[\s-]')
+
+
+@lru_cache(maxsize=512)
+def _wrap_long_line(line: str, width: int) -> Tuple[str, ...]:
+    """
+    Wrap a single line that is wider than the given width.
+
+    A line with no whitespace or hyphens gives textwrap nowhere to
+    break, so it would be split into fixed-width chunks anyway. That
+    case is handled with plain slicing instead of textwrap's regex
+    machinery. Results are shared by all content managers, so a line
+    appended or set again at the same width is wrapped only once, and
+    the wrapped lines are interned like other content lines.
+
+    Args:
+        line: Line of text without newlines
+        width: Width to wrap to
+
+    Returns:
+        Tuple of wrapped lines
+    """
+    if not _BREAK_OPPORTUNITY_RE.search(line):
+        return tuple(intern(line[i:i + width]) for i in range(0, len(line), width))
+    return tuple(map(intern, textwrap.wrap(line, width=width,
+                                           break_long_words=True,
+                                           break_on_hyphens=True)))
+
+
 class TextStyle(Enum):
     """Text styling options."""
     NORMAL = 0
@@ -72,6 +106,12 @@ class ContentManager:
     capabilities for content that exceeds window boundaries.
     """
 
+    # Minimum number of wrapped texts kept in the wrap cache
+    WRAP_CACHE_MIN_SIZE = 128
+
+    # Operation names accepted by apply_batch()
+    _BATCH_OPERATIONS = frozenset(('set_text', 'append_line', 'clear', 'scroll_up', 'scroll_down'))
+
     def __init__(self, window: curses.window):
         """
         Initialize content manager for a window.
@@ -81,26 +121,55 @@ class ContentManager:
         """
         self.window = window
         self._content_lines: List[Union[str, List[FormattedText]]] = []
+        self._line_widths: Optional[List[int]] = None
+        # Immutable snapshot handed out by get_content_lines(); None once stale
+        self._lines_snapshot: Optional[Tuple[Union[str, List[FormattedText]], ...]] = None
+        # Content lines joined with newlines for get_content_text(); None once stale
+        self._content_text: Optional[str] = None
         self._scroll_offset = 0
+        # Visible rows needing a repaint; None means the whole content area
+        self._dirty_rows: Optional[Set[int]] = None
+        # Plain text last painted on each content row ('' once blanked) and the
+        # content area size it was painted at; rows already showing the text
+        # they would be painted with are skipped
+        self._painted_rows: Dict[int, str] = {}
+        self._painted_size: Tuple[int, int] = (0, 0)
+        # Set while apply_batch() runs so only its final render paints
+        self._render_deferred = False
         self._max_width = 0
         self._max_height = 0
+        self._blank_row = ''
         self._content_changed = False
         self._last_content_hash = None
+        # Plain text the content lines were wrapped from, and the width used;
+        # None once the lines no longer correspond to a single text
+        self._source_text: Optional[str] = None
+        self._source_width = 0
+        self._wrap_cache: "OrderedDict[Tuple[str, int], Tuple[str, ...]]" = OrderedDict()
         self._color_pairs: Dict[Tuple[TextColor, TextColor], int] = {}
         self._next_color_pair = 1
         self._update_dimensions()
         self._initialize_colors()
 
     def _update_dimensions(self) -> None:
-        """Update internal dimensions based on current window size."""
+        """
+        Update internal dimensions based on current window size.
+
+        The size is only read here, at construction and on resize(), so
+        rendering works from the stored dimensions and blank row instead of
+        querying the window on every repaint.
+        """
         try:
             height, width = self.window.getmaxyx()
             # Account for frame borders (1 character on each side)
             self._max_height = max(1, height - 2)
             self._max_width = max(1, width - 2)
+            # Windows too small for a content area have nothing to blank
+            self._blank_row = ' ' * (width - 2) if height > 2 and width > 2 else ''
         except curses.error:
             self._max_height = 1
             self._max_width = 1
+            self._blank_row = ''
 
     def _initialize_colors(self) -> None:
         """Initialize color pairs for text formatting."""
@@ -170,32 +239,102 @@ class ContentManager:
         if content_hash == self._last_content_hash:
             return  # No change, skip update
         
-        # Clear existing content
-        self.clear()
-        
-        # Split text into lines and wrap each line
-        lines = text.split('\n')
-        wrapped_lines = []
-        
-        for line in lines:
-            if len(line) <= self._max_width:
-                wrapped_lines.append(line)
-            else:
-                # Wrap long lines
-                wrapped = textwrap.wrap(line, width=self._max_width, 
-                                      break_long_words=True, 
-                                      break_on_hyphens=True)
-                wrapped_lines.extend(wrapped)
+        source = self._source_text
+        if (source is not None and self._source_width == self._max_width
+                and text.startswith(source) and text[len(source):len(source) + 1] == '\n'):
+            # The text extends what is already wrapped, so only wrap the new tail
+            new_lines = self._wrap_lines(text[len(source) + 1:])
+            self._append_content_text(len(self._content_lines), new_lines)
+            self._content_lines.extend(new_lines)
+            self._lines_snapshot = None
+            if self._line_widths is not None:
+                self._line_widths.extend(len(line) for line in new_lines)
+            self._dirty_rows = None
+        else:
+            # Drop the existing content without blanking the window; the render
+            # below only repaints rows whose text differs
+            self._reset_content()
+            
+            # Store wrapped content
+            self._content_lines = list(self._wrap_text(text, content_hash))
         
-        # Store wrapped content
-        self._content_lines = wrapped_lines
         self._scroll_offset = 0
         self._content_changed = True
         self._last_content_hash = content_hash
+        self._source_text = text
+        self._source_width = self._max_width
         
         # Render the content
         self._render_content()
 
+    def _wrap_text(self, text: str, content_hash: str) -> Tuple[str, ...]:
+        """
+        Split text into lines and wrap them to the content width.
+
+        Results are kept in a small LRU cache keyed by content hash and
+        width, so setting the same text again skips the wrapping work.
+
+        Args:
+            text: Text content to wrap
+            content_hash: Precomputed hash of text
+
+        Returns:
+            Tuple of wrapped lines
+        """
+        key = (content_hash, self._max_width)
+        cached = self._wrap_cache.get(key)
+        if cached is not None:
+            self._wrap_cache.move_to_end(key)
+            return cached
+        
+        cached = tuple(self._wrap_lines(text))
+        self._wrap_cache[key] = cached
+        if len(self._wrap_cache) > max(self.WRAP_CACHE_MIN_SIZE, self._max_height * 4):
+            self._wrap_cache.popitem(last=False)
+        return cached
+
+    def _wrap_lines(self, text: str) -> List[str]:
+        """
+        Split text into lines and wrap each one to the content width.
+
+        Text that already fits, the common case, only needs str.split()
+        and one max() over the line lengths. Lines are interned, so a line
+        equal to one already painted is the same object and compares by
+        identity when deciding which rows to repaint.
+
+        Args:
+            text: Text content to wrap
+
+        Returns:
+            List of wrapped lines
+        """
+        lines = text.split('\n')
+        width = self._max_width
+        if max(map(len, lines)) <= width:
+            return list(map(intern, lines))
+        
+        wrapped_lines = []
+        append = wrapped_lines.append
+        for line in lines:
+            if len(line) <= width:
+                append(intern(line))
+            else:
+                # Wrap long lines
+                wrapped_lines.extend(self._wrap_long_line(line))
+        return wrapped_lines
+
+    def _wrap_long_line(self, line: str) -> Tuple[str, ...]:
+        """
+        Wrap a single line that is wider than the content area.
+
+        Args:
+            line: Line of text without newlines
+
+        Returns:
+            Tuple of wrapped lines
+        """
+        return _wrap_long_line(line, self._max_width)
+
     def set_centered_text(self, text: str) -> None:
         """
         Set text with center alignment.
@@ -218,9 +357,7 @@ class ContentManager:
                 centered_lines.append(centered_line)
             else:
                 # Wrap long lines first, then center each wrapped line
-                wrapped = textwrap.wrap(line, width=self._max_width,
-                                      break_long_words=True,
-                                      break_on_hyphens=True)
+                wrapped = self._wrap_long_line(line)
                 for wrapped_line in wrapped:
                     padding = (self._max_width - len(wrapped_line)) // 2
                     centered_line = ' ' * padding + wrapped_line
@@ -240,79 +377,160 @@ class ContentManager:
         Args:
             text: Text line to append
         """
-        # Wrap the new line if necessary
+        self._append_lines((text,))
+        self._render_content()
+
+    def _append_lines(self, texts: Sequence[str]) -> None:
+        """
+        Append lines of text without rendering them.
+
+        Each text is wrapped on its own, exactly as append_line() would, but
+        the caches, auto-scroll and dirty rows are updated once for the run.
+
+        Args:
+            texts: Text lines to append
+        """
+        first_new_line = len(self._content_lines)
+        previous_offset = self._scroll_offset
+        source = self._source_text
+        
+        # Wrap the new lines if necessary
         wrapped = []
-        if len(text) <= self._max_width:
-            self._content_lines.append(text)
-            wrapped = [text]
-        else:
-            wrapped = textwrap.wrap(text, width=self._max_width,
-                                  break_long_words=True,
-                                  break_on_hyphens=True)
-            self._content_lines.extend(wrapped)
+        for text in texts:
+            if len(text) <= self._max_width:
+                wrapped.append(intern(text))
+            else:
+                wrapped.extend(self._wrap_long_line(text))
+            # The source text still matches unless the line holds breaks set_text would split on
+            if source is not None:
+                source = None if '\n' in text else source + '\n' + text
+        self._content_lines.extend(wrapped)
+        self._lines_snapshot = None
+        self._append_content_text(first_new_line, wrapped)
+        self._source_text = source
+        
+        # Keep cached widths in step with the appended lines
+        if self._line_widths is not None:
+            self._line_widths.extend(len(line) for line in wrapped)
         
         # Mark content as changed
         self._content_changed = True
         self._last_content_hash = None  # Invalidate hash since content changed
         
         # Auto-scroll to show new content if we're at the bottom
-        if self._scroll_offset + self._max_height >= len(self._content_lines) - len(wrapped):
+        if self._scroll_offset + self._max_height >= first_new_line:
             self._scroll_offset = max(0, len(self._content_lines) - self._max_height)
         
-        # Render the updated content
+        self._mark_appended_lines_dirty(first_new_line, previous_offset)
+
+    def apply_batch(self, operations: Iterable[Tuple[str, str]]) -> None:
+        """
+        Apply a sequence of content operations and render once at the end.
+
+        Each operation is a (name, text) pair, where name is one of
+        'set_text', 'append_line', 'clear', 'scroll_up' or 'scroll_down'.
+        The text is only used by set_text and append_line; scrolls move one
+        line. Consecutive append_line operations are appended as one run.
+
+        Args:
+            operations: (name, text) pairs to apply in order
+
+        Raises:
+            ValueError: If an operation name is not recognised
+        """
+        operations = list(operations)
+        for name, _ in operations:
+            if name not in self._BATCH_OPERATIONS:
+                raise ValueError(f"Unknown content operation: {name}")
+        
+        self._render_deferred = True
+        try:
+            pending_lines = []
+            for name, text in operations:
+                if name == 'append_line':
+                    pending_lines.append(text)
+                    continue
+                if pending_lines:
+                    self._append_lines(pending_lines)
+                    pending_lines = []
+                if name == 'set_text':
+                    self.set_text(text)
+                elif name == 'clear':
+                    self._clear_content()
+                elif name == 'scroll_up':
+                    self.scroll_up()
+                else:
+                    self.scroll_down()
+            if pending_lines:
+                self._append_lines(pending_lines)
+        finally:
+            self._render_deferred = False
+        
         self._render_content()
 
     def clear(self) -> None:
         """Clear all content."""
+        self._clear_content()
+        
+        # Clear the window content area (preserve frame)
+        self._clear_content_area()
+
+    def _clear_content(self) -> None:
+        """Clear all content without blanking the window."""
         if self._content_lines:  # Only mark as changed if there was content
             self._content_changed = True
             self._last_content_hash = None
         
+        self._reset_content()
+
+    def _reset_content(self) -> None:
+        """Drop all content lines and the state derived from them, leaving the window as is."""
         self._content_lines.clear()
+        self._lines_snapshot = None
+        self._content_text = None
+        self._line_widths = None
+        self._source_text = None
         self._scroll_offset = 0
-        
-        # Clear the window content area (preserve frame)
-        try:
-            height, width = self.window.getmaxyx()
-            for y in range(1, height - 1):
-                for x in range(1, width - 1):
-                    try:
-                        self.window.addch(y, x, ' ')
-                    except curses.error:
-                        pass
-        except curses.error:
-            pass
+        self._dirty_rows = None
 
-    def scroll_up(self, lines: int = 1) -> None:
+    def scroll_up(self, lines: int = 1, render: bool = True) -> None:
         """
         Scroll content up.
 
         Args:
             lines: Number of lines to scroll up
+            render: Repaint now; pass False to leave the rows for render_pending()
         """
-        self._scroll_offset = max(0, self._scroll_offset - lines)
-        self._render_content()
+        self._set_scroll_offset(max(0, self._scroll_offset - lines), render)
 
-    def scroll_down(self, lines: int = 1) -> None:
+    def scroll_down(self, lines: int = 1, render: bool = True) -> None:
         """
         Scroll content down.
 
         Args:
             lines: Number of lines to scroll down
+            render: Repaint now; pass False to leave the rows for render_pending()
         """
         max_scroll = max(0, len(self._content_lines) - self._max_height)
-        self._scroll_offset = min(max_scroll, self._scroll_offset + lines)
-        self._render_content()
+        self._set_scroll_offset(min(max_scroll, self._scroll_offset + lines), render)
 
-    def scroll_to_top(self) -> None:
-        """Scroll to the top of content."""
-        self._scroll_offset = 0
-        self._render_content()
+    def scroll_to_top(self, render: bool = True) -> None:
+        """
+        Scroll to the top of content.
 
-    def scroll_to_bottom(self) -> None:
-        """Scroll to the bottom of content."""
-        self._scroll_offset = max(0, len(self._content_lines) - self._max_height)
-        self._render_content()
+        Args:
+            render: Repaint now; pass False to leave the rows for render_pending()
+        """
+        self._set_scroll_offset(0, render)
+
+    def scroll_to_bottom(self, render: bool = True) -> None:
+        """
+        Scroll to the bottom of content.
+
+        Args:
+            render: Repaint now; pass False to leave the rows for render_pending()
+        """
+        self._set_scroll_offset(max(0, len(self._content_lines) - self._max_height), render)
 
     def can_scroll_up(self) -> bool:
         """Check if content can be scrolled up."""
@@ -322,9 +540,77 @@ class ContentManager:
         """Check if content can be scrolled down."""
         return self._scroll_offset + self._max_height < len(self._content_lines)
 
-    def get_content_lines(self) -> List[Union[str, List[FormattedText]]]:
-        """Get all content lines."""
-        return self._content_lines.copy()
+    def get_content_lines(self) -> Tuple[Union[str, List[FormattedText]], ...]:
+        """
+        Get all content lines.
+
+        The tuple is built once and shared until the content changes. It is
+        read-only; callers that need to modify the lines should take a
+        list(...) copy.
+
+        Returns:
+            Tuple of content lines (plain strings or lists of FormattedText)
+        """
+        if self._lines_snapshot is None:
+            self._lines_snapshot = tuple(self._content_lines)
+        return self._lines_snapshot
+
+    def get_content_text(self) -> str:
+        """
+        Get all content as one string, formatted lines contributing their plain text.
+
+        The text is joined once and reused until the content changes; appending
+        plain lines extends it rather than joining everything again.
+
+        Returns:
+            Content lines joined with newlines
+        """
+        if self._content_text is None:
+            self._content_text = '\n'.join(map(self._content_line_text, self._content_lines))
+        return self._content_text
+
+    def _append_content_text(self, first_new_line: int, new_lines: List[str]) -> None:
+        """
+        Extend the joined content text, if it is cached, with appended plain lines.
+
+        Args:
+            first_new_line: Index of the first appended content line
+            new_lines: Plain lines being appended
+        """
+        if self._content_text is not None and new_lines:
+            new_text = '\n'.join(new_lines)
+            self._content_text = self._content_text + '\n' + new_text if first_new_line else new_text
+
+    def get_content_lines_with_width(self) -> List[Tuple[Union[str, List[FormattedText]], int]]:
+        """
+        Get all content lines paired with their display width.
+
+        Widths are measured once and reused until the content changes.
+
+        Returns:
+            List of (line, width) tuples
+        """
+        if self._line_widths is None:
+            self._line_widths = [self._line_width(line) for line in self._content_lines]
+        return list(zip(self._content_lines, self._line_widths))
+
+    # Stored content lines are always exact str (wrapped or interned) or lists of
+    # FormattedText, so the per-line helpers below compare the class directly
+    # instead of going through isinstance().
+
+    @staticmethod
+    def _content_line_text(line: Union[str, List[FormattedText]]) -> str:
+        """Get the plain text of a stored plain or formatted content line."""
+        if line.__class__ is str:
+            return line
+        return ''.join([ft.text for ft in line])
+
+    @staticmethod
+    def _line_width(line: Union[str, List[FormattedText]]) -> int:
+        """Get the display width of a plain or formatted content line."""
+        if line.__class__ is str:
+            return len(line)
+        return sum(len(ft.text) for ft in line)
 
     def get_visible_lines(self) -> List[Union[str, List[FormattedText]]]:
         """Get currently visible lines."""
@@ -332,6 +618,19 @@ class ContentManager:
         end = min(start + self._max_height, len(self._content_lines))
         return self._content_lines[start:end]
 
+    @property
+    def total_lines(self) -> int:
+        """
+        Get the number of content lines.
+
+        The line list is kept up to date by every edit and resize, so this
+        is a plain length lookup rather than a cached value.
+
+        Returns:
+            Number of stored (wrapped) content lines
+        """
+        return len(self._content_lines)
+
     def get_scroll_info(self) -> Tuple[int, int, int]:
         """
         Get scroll information.
@@ -354,8 +653,15 @@ class ContentManager:
         """Reset the content changed flag."""
         self._content_changed = False
 
+    def render_pending(self) -> None:
+        """Paint the rows invalidated since the last render, e.g. by scrolling."""
+        if self._dirty_rows is None or self._dirty_rows:
+            self._render_content()
+
     def force_refresh(self) -> None:
-        """Force a refresh of the content display."""
+        """Force a full repaint of the content display."""
+        self._dirty_rows = None
+        self._painted_rows.clear()
         self._render_content()
 
     def set_bold_text(self, text: str) -> None:
@@ -432,41 +738,124 @@ class ContentManager:
             
             # Re-wrap with new dimensions
             self._content_lines = self._wrap_formatted_text(all_formatted_text)
+            self._lines_snapshot = None
+            self._content_text = None
+            self._line_widths = None
+            self._source_text = None
         
+        self._dirty_rows = None
         self._render_content()
 
+    def _clear_content_area(self, rows: Optional[List[int]] = None) -> None:
+        """
+        Blank content rows inside the frame, one addstr call per row.
+
+        Args:
+            rows: Content rows (0-based) to blank, or None for all of them
+        """
+        blank_row = self._blank_row
+        if not blank_row or (rows is not None and not rows):
+            return
+        
+        if rows is None:
+            rows = range(self._max_height)
+        
+        painted = self._painted_rows
+        for row in rows:
+            try:
+                self.window.addstr(1 + row, 1, blank_row)
+            except curses.error:
+                pass
+            painted[row] = ''
+
+    def _mark_appended_lines_dirty(self, first_new_line: int, previous_offset: int) -> None:
+        """
+        Mark the visible rows showing newly appended lines for repaint.
+
+        Args:
+            first_new_line: Index of the first appended content line
+            previous_offset: Scroll offset before the lines were appended
+        """
+        if self._scroll_offset != previous_offset:
+            # Every visible row moved
+            self._dirty_rows = None
+        elif self._dirty_rows is not None:
+            first_row = max(first_new_line, self._scroll_offset) - self._scroll_offset
+            end_row = min(len(self._content_lines), self._scroll_offset + self._max_height) - self._scroll_offset
+            self._dirty_rows.update(range(first_row, end_row))
+
+    def _set_scroll_offset(self, offset: int, render: bool = True) -> None:
+        """
+        Move the viewport, painting it unless the repaint is deferred.
+
+        A changed offset invalidates every row. With render=False the rows
+        stay pending for render_pending(), so repeated scrolls between
+        frames cost nothing on screen; apply_batch() defers them as well.
+
+        Args:
+            offset: New scroll offset
+            render: Repaint the invalidated rows now
+        """
+        if offset != self._scroll_offset:
+            self._scroll_offset = offset
+            self._dirty_rows = None
+        if render:
+            self.render_pending()
+
     def _render_content(self) -> None:
         """Render the current content to the window with formatting support."""
-        # Update dimensions in case window was resized
-        self._update_dimensions()
+        if self._render_deferred:
+            return  # apply_batch() renders once it is done
+        painted = self._painted_rows
+        if self._painted_size != (self._max_height, self._max_width):
+            painted.clear()
+            self._painted_size = (self._max_height, self._max_width)
         
-        # Clear content area (preserve frame)
-        try:
-            height, width = self.window.getmaxyx()
-            for y in range(1, height - 1):
-                for x in range(1, width - 1):
-                    try:
-                        self.window.addch(y, x, ' ')
-                    except curses.error:
-                        pass
-        except curses.error:
-            pass
+        if self._dirty_rows is None:
+            rows = range(self._max_height)
+        else:
+            rows = sorted(row for row in self._dirty_rows if row < self._max_height)
+        self._dirty_rows = set()
 
-        # Render visible lines
+        # Skip rows already showing the plain text they would be painted with;
+        # rows past the content are blank
         visible_lines = self.get_visible_lines()
+        visible_count = len(visible_lines)
+        max_width = self._max_width
+        repaint_rows = []
+        for i in rows:
+            line = visible_lines[i] if i < visible_count else ''
+            if isinstance(line, str) and painted.get(i) == line[:max_width]:
+                continue
+            repaint_rows.append(i)
+        
+        if not repaint_rows:
+            return
         
-        for i, line in enumerate(visible_lines):
+        # Plain rows are written padded to the full width in one addstr, so only
+        # rows past the content and formatted rows are blanked first (preserve frame)
+        self._clear_content_area([i for i in repaint_rows
+                                  if i >= visible_count or not isinstance(visible_lines[i], str)])
+
+        # Render visible lines
+        for i in repaint_rows:
+            if i >= visible_count:
+                break
+            line = visible_lines[i]
             y_pos = 1 + i  # Start after top frame border
             x_pos = 1      # Start after left frame border
             
             if isinstance(line, str):
                 # Handle plain string (backward compatibility)
-                display_line = line[:self._max_width] if len(line) > self._max_width else line
+                display_line = line[:max_width] if len(line) > max_width else line
                 try:
-                    self.window.addstr(y_pos, x_pos, display_line)
+                    self.window.addstr(y_pos, x_pos, display_line.ljust(max_width))
                 except curses.error:
                     pass
+                painted[i] = display_line
             else:
+                # Formatted rows aren't tracked, so they are always repainted
+                painted.pop(i, None)
                 # Handle formatted text
                 current_x = x_pos
                 for formatted_text in line:
@@ -550,9 +939,16 @@ class ContentManager:
             
         # Wrap the formatted text
         wrapped_lines = self._wrap_formatted_text(formatted_text)
+        first_new_line = len(self._content_lines)
+        previous_offset = self._scroll_offset
         
         # Add to content
         self._content_lines.extend(wrapped_lines)
+        self._lines_snapshot = None
+        self._content_text = None
+        self._source_text = None
+        if self._line_widths is not None:
+            self._line_widths.extend(self._line_width(line) for line in wrapped_lines)
         
         # Mark content as changed
         self._content_changed = True
@@ -563,6 +959,7 @@ class ContentManager:
             self._scroll_offset = max(0, len(self._content_lines) - self._max_height)
         
         # Render the updated content
+        self._mark_appended_lines_dirty(first_new_line, previous_offset)
         self._render_content()
 
     def set_text_with_style(self, text: str, style: TextStyle = TextStyle.NORMAL, 
@@ -595,7 +992,8 @@ class ContentManager:
         format = TextFormat(style, fg_color, bg_color)
         self.append_formatted_line(text, format)
 
-    def _formatted_text_to_string(self, text: Union[str, List[FormattedText]]) -> str:
+    @staticmethod
+    def _formatted_text_to_string(text: Union[str, List[FormattedText]]) -> str:
         """Convert formatted text to plain string for hashing."""
         if isinstance(text, str):
             return text
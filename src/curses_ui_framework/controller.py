@@ -94,9 +94,6 @@ class CursesController:
             TerminalCompatibilityError: If terminal lacks required features
         """
         try:
-            # Check if curses module is available and functional
-            import curses
-            
             # Test basic curses functionality
             try:
                 # Try to get terminal capabilities
@@ -748,36 +745,29 @@ class CursesController:
             terminal_height: Terminal height in rows
             terminal_width: Terminal width in columns
         """
-        self.layout_info.terminal_height = terminal_height
-        self.layout_info.terminal_width = terminal_width
+        # Build a new layout rather than writing into the current one, which
+        # the view may still hold
+        layout_info = LayoutInfo()
+        layout_info.terminal_height = terminal_height
+        layout_info.terminal_width = terminal_width
 
         # Top window: Fixed height of 3 rows, full width
-        self.layout_info.top_window.y = 0
-        self.layout_info.top_window.x = 0
-        self.layout_info.top_window.height = 3
-        self.layout_info.top_window.width = terminal_width
+        layout_info.top_window = WindowGeometry(0, 0, 3, terminal_width)
 
         # Bottom window: Fixed height of 3 rows, full width
-        self.layout_info.bottom_window.y = terminal_height - 3
-        self.layout_info.bottom_window.x = 0
-        self.layout_info.bottom_window.height = 3
-        self.layout_info.bottom_window.width = terminal_width
+        layout_info.bottom_window = WindowGeometry(terminal_height - 3, 0, 3, terminal_width)
 
         # Remaining height for left and main windows
         remaining_height = terminal_height - 6  # Subtract top and bottom
 
         # Left window: Fixed width of 25% of terminal width
         left_width = max(25, terminal_width // 4)  # At least 25 columns
-        self.layout_info.left_window.y = 3
-        self.layout_info.left_window.x = 0
-        self.layout_info.left_window.height = remaining_height
-        self.layout_info.left_window.width = left_width
+        layout_info.left_window = WindowGeometry(3, 0, remaining_height, left_width)
 
         # Main window: Remaining space
-        self.layout_info.main_window.y = 3
-        self.layout_info.main_window.x = left_width
-        self.layout_info.main_window.height = remaining_height
-        self.layout_info.main_window.width = terminal_width - left_width
+        layout_info.main_window = WindowGeometry(3, left_width, remaining_height, terminal_width - left_width)
+
+        self.layout_info = layout_info
 
     # Content management methods for MVC integration
 
@@ -880,14 +870,16 @@ class CursesController:
         if self.view:
             content_manager = self.view.get_content_manager('main')
             if content_manager:
-                content_manager.scroll_to_top()
+                content_manager.scroll_to_top(render=False)
+                self.view.mark_window_dirty('main')
 
     def scroll_main_content_to_bottom(self) -> None:
         """Scroll main content to the bottom."""
         if self.view:
             content_manager = self.view.get_content_manager('main')
             if content_manager:
-                content_manager.scroll_to_bottom()
+                content_manager.scroll_to_bottom(render=False)
+                self.view.mark_window_dirty('main')
 
     def set_bottom_window_mode(self, mode: str) -> None:
         """
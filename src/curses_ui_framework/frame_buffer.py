@@ -0,0 +1,121 @@
+"""
+FrameBuffer class for the Curses UI Framework.
+
+This module collects the text written to a window's content area during
+one render cycle and flushes it with as few addstr calls as possible.
+"""
+
+import curses
+from typing import Dict, List, Optional
+
+
+class FrameBuffer:
+    """
+    Buffers writes to a rectangular content area of a curses window.
+
+    Writes are overlaid cell by cell, so later writes replace earlier ones
+    exactly as they would on the window itself. On flush each row is sent
+    as one addstr call per run of cells sharing the same attribute.
+    """
+
+    def __init__(self, start_y: int, start_x: int, height: int, width: int):
+        """
+        Initialize an empty buffer for a content area.
+
+        Args:
+            start_y: Content area start row
+            start_x: Content area start column
+            height: Content area height
+            width: Content area width
+        """
+        self.start_y = start_y
+        self.start_x = start_x
+        self.height = max(0, height)
+        self.width = max(0, width)
+        # Row -> per-column characters and attributes, kept as parallel lists so
+        # writes are slice assignments and runs are joined straight from a
+        # slice; a None character marks an untouched cell
+        self._chars: Dict[int, List[Optional[str]]] = {}
+        self._attrs: Dict[int, List[int]] = {}
+
+    def addstr(self, y: int, x: int, text: str, attr: int = 0) -> None:
+        """
+        Buffer text at a window position, clipped to the content area.
+
+        The signature mirrors ``window.addstr`` so render helpers can be
+        handed a buffer in place of a window.
+
+        Args:
+            y: Window row
+            x: Window column
+            text: Text to write
+            attr: Curses attribute for the text
+        """
+        row = y - self.start_y
+        if row < 0 or row >= self.height or not text:
+            return
+
+        col = x - self.start_x
+        if col < 0:
+            text = text[-col:]
+            col = 0
+        text = text[:self.width - col]
+        if not text:
+            return
+
+        chars = self._chars.get(row)
+        if chars is None:
+            chars = self._chars[row] = [None] * self.width
+            attrs = self._attrs[row] = [0] * self.width
+        else:
+            attrs = self._attrs[row]
+        end = col + len(text)
+        chars[col:end] = text
+        attrs[col:end] = [attr] * len(text)
+
+    add = addstr
+
+    def fill(self, char: str = ' ') -> None:
+        """
+        Fill the whole content area, replacing anything buffered so far.
+
+        Args:
+            char: Character to fill with
+        """
+        self._chars = {row: [char] * self.width for row in range(self.height)}
+        self._attrs = {row: [0] * self.width for row in range(self.height)}
+
+    def flush(self, window) -> None:
+        """
+        Write the buffered runs to a window and empty the buffer.
+
+        Args:
+            window: Curses window to write to
+        """
+        for row in sorted(self._chars):
+            chars = self._chars[row]
+            attrs = self._attrs[row]
+            y = self.start_y + row
+            col = 0
+            while col < self.width:
+                if chars[col] is None:
+                    col += 1
+                    continue
+
+                attr = attrs[col]
+                run_start = col
+                while col < self.width and chars[col] is not None and attrs[col] == attr:
+                    col += 1
+                text = ''.join(chars[run_start:col])
+
+                try:
+                    if attr:
+                        window.addstr(y, self.start_x + run_start, text, attr)
+                    else:
+                        window.addstr(y, self.start_x + run_start, text)
+                except curses.error:
+                    # Writing the bottom-right cell raises after the write
+                    pass
+
+        self._chars = {}
+        self._attrs = {}
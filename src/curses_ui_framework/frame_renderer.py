@@ -99,21 +99,7 @@ class FrameRenderer:
             # Clear the window first
             window.clear()
 
-            # Draw corners
-            window.addch(0, 0, chars['top_left'])
-            window.addch(0, width - 1, chars['top_right'])
-            window.addch(height - 1, 0, chars['bottom_left'])
-            window.addch(height - 1, width - 1, chars['bottom_right'])
-
-            # Draw horizontal lines (top and bottom)
-            for x in range(1, width - 1):
-                window.addch(0, x, chars['horizontal'])
-                window.addch(height - 1, x, chars['horizontal'])
-
-            # Draw vertical lines (left and right)
-            for y in range(1, height - 1):
-                window.addch(y, 0, chars['vertical'])
-                window.addch(y, width - 1, chars['vertical'])
+            self._draw_border(window, height, width, chars)
 
         except curses.error:
             # If Unicode characters fail, try with ASCII fallback
@@ -132,27 +118,43 @@ class FrameRenderer:
             if height < 3 or width < 3:
                 return
 
-            chars = self._ascii_chars
+            self._draw_border(window, height, width, self._ascii_chars)
 
-            # Draw corners
-            window.addch(0, 0, chars['top_left'])
-            window.addch(0, width - 1, chars['top_right'])
-            window.addch(height - 1, 0, chars['bottom_left'])
-            window.addch(height - 1, width - 1, chars['bottom_right'])
+        except curses.error:
+            # If even ASCII fails, use curses.box() as last resort
+            window.box()
 
-            # Draw horizontal lines
-            for x in range(1, width - 1):
-                window.addch(0, x, chars['horizontal'])
-                window.addch(height - 1, x, chars['horizontal'])
+    @staticmethod
+    def _draw_border(window: curses.window, height: int, width: int, chars: Dict[str, str]) -> None:
+        """
+        Draw a border with one addstr per horizontal edge and addch for the sides.
 
-            # Draw vertical lines
-            for y in range(1, height - 1):
-                window.addch(y, 0, chars['vertical'])
-                window.addch(y, width - 1, chars['vertical'])
+        Args:
+            window: The curses window to draw the border on
+            height: Window height
+            width: Window width
+            chars: Character set to draw with
 
+        Raises:
+            curses.error: If the characters can't be drawn
+        """
+        middle = chars['horizontal'] * (width - 2)
+
+        # Top edge, corners included
+        window.addstr(0, 0, chars['top_left'] + middle + chars['top_right'])
+
+        # Bottom edge; writing the bottom-right cell moves the cursor past
+        # the end of the window, which curses reports after the write
+        try:
+            window.addstr(height - 1, 0, chars['bottom_left'] + middle + chars['bottom_right'])
         except curses.error:
-            # If even ASCII fails, use curses.box() as last resort
-            window.box()
+            pass
+
+        # Vertical lines (left and right)
+        vertical = chars['vertical']
+        for y in range(1, height - 1):
+            window.addch(y, 0, vertical)
+            window.addch(y, width - 1, vertical)
 
     def clear_frame(self, window: curses.window) -> None:
         """
@@ -164,11 +166,15 @@ class FrameRenderer:
         try:
             height, width = window.getmaxyx()
             
-            # Clear border area
-            for x in range(width):
-                window.addch(0, x, ' ')
-                if height > 1:
-                    window.addch(height - 1, x, ' ')
+            # Clear border area, one addstr per horizontal edge
+            blank_edge = ' ' * width
+            window.addstr(0, 0, blank_edge)
+            if height > 1:
+                try:
+                    window.addstr(height - 1, 0, blank_edge)
+                except curses.error:
+                    # Raised after writing the bottom-right cell
+                    pass
             
             for y in range(1, height - 1):
                 window.addch(y, 0, ' ')
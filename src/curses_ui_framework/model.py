@@ -42,6 +42,9 @@ class ApplicationModel:
             'uptime': 0,
             'content_lines': 0
         }
+        # Bumped on every state change so views can skip rendering an
+        # unchanged model
+        self._revision = 0
 
     def get_title(self) -> str:
         """Get application title."""
@@ -55,6 +58,10 @@ class ApplicationModel:
         """Get application version."""
         return self._version
 
+    def get_revision(self) -> int:
+        """Get the revision number, which changes whenever the model state changes."""
+        return self._revision
+
     def set_navigation_items(self, items: List[str]) -> None:
         """
         Set navigation menu items.
@@ -66,6 +73,7 @@ class ApplicationModel:
         # Reset selection if current index is out of bounds
         if self._selected_navigation_index >= len(self._navigation_items):
             self._selected_navigation_index = 0
+        self._revision += 1
 
     def get_navigation_items(self) -> List[str]:
         """Get current navigation items."""
@@ -90,8 +98,9 @@ class ApplicationModel:
         Args:
             index: Index of navigation item to select
         """
-        if 0 <= index < len(self._navigation_items):
+        if 0 <= index < len(self._navigation_items) and index != self._selected_navigation_index:
             self._selected_navigation_index = index
+            self._revision += 1
 
     def set_main_content(self, content: str) -> None:
         """
@@ -100,7 +109,9 @@ class ApplicationModel:
         Args:
             content: Text content to display in main window
         """
-        self._main_content = content
+        if content != self._main_content:
+            self._main_content = content
+            self._revision += 1
 
     def get_main_content(self) -> str:
         """Get current main content."""
@@ -113,7 +124,9 @@ class ApplicationModel:
         Args:
             status: Status text to display
         """
-        self._status = status
+        if status != self._status:
+            self._status = status
+            self._revision += 1
 
     def get_status(self) -> str:
         """Get current status."""
@@ -126,8 +139,9 @@ class ApplicationModel:
         Args:
             mode: Either "display" or "input"
         """
-        if mode in ("display", "input"):
+        if mode in ("display", "input") and mode != self._bottom_window_mode:
             self._bottom_window_mode = mode
+            self._revision += 1
 
     def get_bottom_window_mode(self) -> str:
         """Get current bottom window mode."""
@@ -144,7 +158,9 @@ class ApplicationModel:
         Args:
             text: Command input text
         """
-        self._command_input = text
+        if text != self._command_input:
+            self._command_input = text
+            self._revision += 1
 
     def add_command_to_history(self, command: str) -> None:
         """
@@ -157,6 +173,7 @@ class ApplicationModel:
             self._command_history.append(command.strip())
             self._statistics['total_commands'] += 1
             self._statistics['last_command'] = command.strip()
+            self._revision += 1
 
     def get_command_history(self) -> List[str]:
         """Get command history."""
@@ -164,7 +181,9 @@ class ApplicationModel:
 
     def clear_command_input(self) -> None:
         """Clear the current command input."""
-        self._command_input = ""
+        if self._command_input:
+            self._command_input = ""
+            self._revision += 1
 
     def get_statistics(self) -> dict:
         """Get current application statistics."""
@@ -178,8 +197,9 @@ class ApplicationModel:
             key: Statistic key to update
             value: New value for the statistic
         """
-        if key in self._statistics:
+        if key in self._statistics and self._statistics[key] != value:
             self._statistics[key] = value
+            self._revision += 1
 
     def increment_statistic(self, key: str, amount: int = 1) -> None:
         """
@@ -190,4 +210,5 @@ class ApplicationModel:
             amount: Amount to increment by (default 1)
         """
         if key in self._statistics and isinstance(self._statistics[key], (int, float)):
-            self._statistics[key] += amount
\ No newline at end of file
+            self._statistics[key] += amount
+            self._revision += 1
\ No newline at end of file
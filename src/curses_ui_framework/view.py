@@ -6,11 +6,38 @@ handling all visual presentation and UI rendering.
 """
 
 import curses
-from typing import List, Dict
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Union
 from .model import ApplicationModel
 from .exceptions import WindowCreationError
 from .frame_renderer import FrameRenderer, FrameStyle
 from .content_manager import ContentManager
+from .frame_buffer import FrameBuffer
+
+
+@dataclass(frozen=True)
+class BottomStatistics:
+    """Statistics shown in the bottom window's display mode; None marks a missing value."""
+    __slots__ = ('total_commands', 'last_command', 'content_lines', 'uptime')
+
+    total_commands: Optional[int]
+    last_command: Optional[str]
+    content_lines: Optional[int]
+    uptime: Optional[int]
+
+    @classmethod
+    def from_dict(cls, statistics: dict) -> 'BottomStatistics':
+        """
+        Build statistics from a model statistics dictionary.
+
+        Args:
+            statistics: Dictionary as returned by ApplicationModel.get_statistics()
+
+        Returns:
+            BottomStatistics with absent keys set to None
+        """
+        return cls(statistics.get('total_commands'), statistics.get('last_command'),
+                   statistics.get('content_lines'), statistics.get('uptime'))
 
 
 class WindowView:
@@ -34,9 +61,17 @@ class WindowView:
         self.layout_info = None
         self.frame_renderer = FrameRenderer()
         
-        # Track which windows need updates for efficient refresh
+        # Track which windows need updates for efficient refresh; the last
+        # render data holds each window's render key from the previous frame,
+        # rendered from the model and revision below
         self._dirty_windows = set()
-        self._last_render_data = {}
+        self._last_render_data: Dict[str, tuple] = {}
+        self._last_render_model: Optional[ApplicationModel] = None
+        self._last_render_revision = -1
+
+        # Bottom window inputs that don't come from the model; part of its render key
+        self._current_command_input = ''
+        self._current_statistics: Optional[BottomStatistics] = None
 
         # Initialize colors if available
         if curses.has_colors():
@@ -102,53 +137,57 @@ class WindowView:
         Args:
             model: Application model containing current state
         """
-        # Check what data has changed since last render
-        current_data = {
-            'title': model.get_title(),
-            'author': model.get_author(), 
-            'version': model.get_version(),
-            'navigation_items': model.get_navigation_items(),
-            'selected_navigation': model.get_selected_navigation_index(),
-            'main_content': model.get_main_content(),
-            'status': model.get_status(),
-            'bottom_mode': model.get_bottom_window_mode()
+        # Nothing to draw if the same model is unchanged since the last render
+        # and no window was marked dirty in the meantime
+        revision = model.get_revision()
+        if (model is self._last_render_model and revision == self._last_render_revision
+                and self._last_render_data and not self._dirty_windows):
+            return
+
+        title = model.get_title()
+        author = model.get_author()
+        version = model.get_version()
+        navigation_items = model.get_navigation_items()
+        selected_navigation = model.get_selected_navigation_index()
+        main_content = model.get_main_content()
+        status = model.get_status()
+        bottom_mode = model.get_bottom_window_mode()
+
+        # One key per window, holding only the inputs that window is drawn from;
+        # the bottom window also depends on the command input and statistics
+        render_keys = {
+            'top': (title, author, version),
+            'left': (tuple(navigation_items), selected_navigation),
+            'main': (main_content,),
+            'bottom': (status, bottom_mode, self._current_command_input, self._current_statistics),
         }
-        
-        # Mark windows as dirty if their data changed
-        if self._last_render_data.get('title') != current_data['title'] or \
-           self._last_render_data.get('author') != current_data['author'] or \
-           self._last_render_data.get('version') != current_data['version']:
-            self.mark_window_dirty('top')
-            
-        if self._last_render_data.get('navigation_items') != current_data['navigation_items'] or \
-           self._last_render_data.get('selected_navigation') != current_data['selected_navigation']:
-            self.mark_window_dirty('left')
-            
-        if self._last_render_data.get('main_content') != current_data['main_content']:
-            self.mark_window_dirty('main')
-            
-        if self._last_render_data.get('status') != current_data['status'] or \
-           self._last_render_data.get('bottom_mode') != current_data['bottom_mode']:
-            self.mark_window_dirty('bottom')
-        
+
+        # Mark windows as dirty if their inputs changed since the last render
+        last_keys = self._last_render_data
+        for window_name, key in render_keys.items():
+            if window_name not in last_keys or last_keys[window_name] != key:
+                self.mark_window_dirty(window_name)
+
         # Render only dirty windows
         if 'top' in self._dirty_windows:
-            self.render_top_window(current_data['title'], current_data['author'], current_data['version'])
+            self.render_top_window(title, author, version)
             
         if 'left' in self._dirty_windows:
-            self.render_left_window(current_data['navigation_items'], current_data['selected_navigation'])
+            self.render_left_window(navigation_items, selected_navigation)
             
         if 'main' in self._dirty_windows:
-            self.render_main_window(current_data['main_content'])
+            self.render_main_window(main_content)
             
         if 'bottom' in self._dirty_windows:
-            self.render_bottom_window(current_data['status'], current_data['bottom_mode'])
+            self.render_bottom_window(status, bottom_mode)
 
         # Refresh only dirty windows
         self.refresh_dirty_windows()
         
-        # Store current data for next comparison
-        self._last_render_data = current_data.copy()
+        # Store current keys for next comparison
+        self._last_render_data = render_keys
+        self._last_render_model = model
+        self._last_render_revision = revision
         
         # Clear dirty flags
         self._dirty_windows.clear()
@@ -223,12 +262,7 @@ class WindowView:
         start_y, start_x, content_height, content_width = self.frame_renderer.get_content_area(window)
         
         # Clear content area
-        for y in range(start_y, start_y + content_height):
-            for x in range(start_x, start_x + content_width):
-                try:
-                    window.addch(y, x, ' ')
-                except curses.error:
-                    pass
+        self._clear_content_area(window, start_y, start_x, content_height, content_width)
 
         # Redraw frame
         self.frame_renderer.draw_frame(window)
@@ -363,10 +397,13 @@ class WindowView:
         """
         if 'main' in self.content_managers:
             content_manager = self.content_managers['main']
+            # The repaint waits for refresh_dirty_windows(), so several
+            # scrolls between frames paint the window once
             if direction == 'up':
-                content_manager.scroll_up(lines)
+                content_manager.scroll_up(lines, render=False)
             elif direction == 'down':
-                content_manager.scroll_down(lines)
+                content_manager.scroll_down(lines, render=False)
+            self.mark_window_dirty('main')
 
     def can_scroll_main_content(self, direction: str) -> bool:
         """
@@ -458,6 +495,28 @@ class WindowView:
         """
         return self.content_managers.get(window_name)
 
+    def _clear_content_area(self, window, start_y: int, start_x: int,
+                            content_height: int, content_width: int) -> None:
+        """
+        Blank the content area of a window one row at a time.
+
+        Args:
+            window: Window to clear
+            start_y: Content area start row
+            start_x: Content area start column
+            content_height: Content area height
+            content_width: Content area width
+        """
+        if content_width <= 0:
+            return
+        
+        blank_row = ' ' * content_width
+        for y in range(start_y, start_y + content_height):
+            try:
+                window.addstr(y, start_x, blank_row)
+            except curses.error:
+                pass
+
     def render_bottom_window(self, status: str, mode: str) -> None:
         """
         Render bottom status/command window with dual-mode functionality.
@@ -474,13 +533,9 @@ class WindowView:
         # Get content area within frame
         start_y, start_x, content_height, content_width = self.frame_renderer.get_content_area(window)
         
-        # Clear content area
-        for y in range(start_y, start_y + content_height):
-            for x in range(start_x, start_x + content_width):
-                try:
-                    window.addch(y, x, ' ')
-                except curses.error:
-                    pass
+        # Blank and text rows are merged in the buffer and written once each
+        frame_buffer = FrameBuffer(start_y, start_x, content_height, content_width)
+        frame_buffer.fill()
 
         # Redraw frame
         self.frame_renderer.draw_frame(window)
@@ -488,9 +543,11 @@ class WindowView:
         # Render based on mode within content area
         if content_height > 0 and content_width > 0:
             if mode == "input":
-                self._render_input_mode(window, start_y, start_x, content_height, content_width)
+                self._render_input_mode(frame_buffer, start_y, start_x, content_height, content_width)
             else:
-                self._render_display_mode(window, start_y, start_x, content_height, content_width, status)
+                self._render_display_mode(frame_buffer, start_y, start_x, content_height, content_width, status)
+
+        frame_buffer.flush(window)
 
     def _render_input_mode(self, window, start_y: int, start_x: int, 
                           content_height: int, content_width: int) -> None:
@@ -498,7 +555,7 @@ class WindowView:
         Render bottom window in input mode.
 
         Args:
-            window: The curses window
+            window: The curses window or a FrameBuffer over it
             start_y: Starting Y position of content area
             start_x: Starting X position of content area
             content_height: Height of content area
@@ -507,10 +564,8 @@ class WindowView:
         # Show command prompt and input
         prompt = "Command: "
         
-        # Get current command input from model if available
-        command_input = ""
-        if hasattr(self, '_current_command_input'):
-            command_input = self._current_command_input
+        # Get current command input
+        command_input = self._current_command_input
         
         # First line: command prompt and input with echo
         if content_height >= 1:
@@ -555,7 +610,7 @@ class WindowView:
         Render bottom window in display mode with statistics.
 
         Args:
-            window: The curses window
+            window: The curses window or a FrameBuffer over it
             start_y: Starting Y position of content area
             start_x: Starting X position of content area
             content_height: Height of content area
@@ -570,21 +625,20 @@ class WindowView:
             lines_to_show.append(status_line)
         
         # Get statistics if available
-        if hasattr(self, '_current_statistics'):
-            stats = self._current_statistics
-            
+        stats = self._current_statistics
+        if stats is not None:
             # Second line: command statistics
-            if 'total_commands' in stats and 'last_command' in stats:
-                cmd_stats = f"Commands: {stats['total_commands']}"
-                if stats['last_command']:
-                    cmd_stats += f" | Last: {stats['last_command'][:20]}..."
+            if stats.total_commands is not None and stats.last_command is not None:
+                cmd_stats = f"Commands: {stats.total_commands}"
+                if stats.last_command:
+                    cmd_stats += f" | Last: {stats.last_command[:20]}..."
                 lines_to_show.append(cmd_stats)
             
             # Third line: content statistics
-            if 'content_lines' in stats:
-                content_stats = f"Content lines: {stats['content_lines']}"
-                if 'uptime' in stats:
-                    content_stats += f" | Uptime: {stats['uptime']}s"
+            if stats.content_lines is not None:
+                content_stats = f"Content lines: {stats.content_lines}"
+                if stats.uptime is not None:
+                    content_stats += f" | Uptime: {stats.uptime}s"
                 lines_to_show.append(content_stats)
         
         # If no statistics, show help
@@ -608,16 +662,22 @@ class WindowView:
         Args:
             text: Command input text
         """
-        self._current_command_input = text
+        if text != self._current_command_input:
+            self._current_command_input = text
+            self.mark_window_dirty('bottom')
 
-    def set_bottom_window_statistics(self, statistics: dict) -> None:
+    def set_bottom_window_statistics(self, statistics: Union[BottomStatistics, dict]) -> None:
         """
         Set the current statistics for display.
 
         Args:
-            statistics: Dictionary of statistics to display
+            statistics: BottomStatistics, or a dictionary of statistics to display
         """
-        self._current_statistics = statistics
+        if isinstance(statistics, dict):
+            statistics = BottomStatistics.from_dict(statistics)
+        if statistics != self._current_statistics:
+            self._current_statistics = statistics
+            self.mark_window_dirty('bottom')
 
     def resize_windows(self, new_layout_info) -> None:
         """
@@ -662,10 +722,30 @@ class WindowView:
         self._dirty_windows.update(self.windows.keys())
 
     def refresh_dirty_windows(self) -> None:
-        """Refresh only the windows marked as dirty."""
+        """
+        Refresh only the windows marked as dirty.
+
+        Each dirty window is copied to curses' virtual screen with
+        noutrefresh(), then a single doupdate() writes only the cells that
+        differ from the physical screen, so the windows appear together
+        instead of flickering in one at a time. The main window's content
+        manager paints any rows still pending, such as after a scroll, before
+        the copy; the other windows are drawn directly by their render
+        methods, so their (empty) content managers are left alone.
+        """
+        refreshed = False
         for window_name in self._dirty_windows:
             if window_name in self.windows:
-                self.windows[window_name].refresh()
+                if window_name == 'main' and 'main' in self.content_managers:
+                    self.content_managers['main'].render_pending()
+                self.windows[window_name].noutrefresh()
+                refreshed = True
+        
+        if refreshed:
+            try:
+                curses.doupdate()
+            except curses.error:
+                pass
 
     def refresh_window(self, window_name: str) -> None:
         """
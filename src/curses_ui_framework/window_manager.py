@@ -7,7 +7,7 @@ providing window creation, refresh, and cleanup functionality.
 
 import curses
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from .exceptions import WindowCreationError
 from .frame_renderer import FrameRenderer, FrameStyle
 
@@ -54,6 +54,19 @@ class LayoutInfo:
         self.terminal_height = 0
         self.terminal_width = 0
 
+    @property
+    def dims(self) -> Tuple[int, int, int, int, int, int, int, int]:
+        """
+        Get the (height, width) of every window as one flat tuple.
+
+        Returns:
+            Tuple of (top_height, top_width, left_height, left_width,
+            main_height, main_width, bottom_height, bottom_width)
+        """
+        top, left, main, bottom = self.top_window, self.left_window, self.main_window, self.bottom_window
+        return (top.height, top.width, left.height, left.width,
+                main.height, main.width, bottom.height, bottom.width)
+
     def get_window_geometry(self, window_type: WindowType) -> WindowGeometry:
         """
         Get geometry for a specific window type.
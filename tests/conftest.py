@@ -0,0 +1,56 @@
+"""
+Shared pytest configuration for the Curses UI Framework test suite.
+
+This module makes the ``src`` layout importable, selects the Hypothesis
+profile and exposes the shared helpers from ``helpers`` as fixtures.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from hypothesis import settings
+
+from .helpers import _build_mock_stdscr, _build_mock_window, _record_calls
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Hypothesis profiles: "dev" keeps local runs quick, "ci" runs the full example
+# budget. Neither enforces a per-example deadline, as the heavier WindowView
+# tests are slow under parallel runs. Tests without an explicit max_examples
+# inherit it from the profile, selected with the HYPOTHESIS_PROFILE environment
+# variable.
+settings.register_profile("dev", max_examples=25, deadline=None)
+settings.register_profile("ci", max_examples=100, deadline=None)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
+
+
+@pytest.fixture(scope="session")
+def mock_stdscr_factory():
+    """Provide the mock stdscr builder."""
+    return _build_mock_stdscr
+
+
+@pytest.fixture(scope="session")
+def mock_window_factory():
+    """Provide the mock window builder."""
+    return _build_mock_window
+
+
+@pytest.fixture(scope="session")
+def call_recorder():
+    """Provide the addstr/addch call recorder."""
+    return _record_calls
+
+
+@pytest.fixture(scope="class")
+def frame_renderer_mocks():
+    """
+    Provide get_content_area and draw_frame mocks shared by a test class.
+
+    Tests patch them in with ``new=`` and set the content area as the
+    return value, so no mock is built per Hypothesis example.
+    """
+    return {'get_content_area': MagicMock(), 'draw_frame': MagicMock()}
@@ -0,0 +1,168 @@
+"""
+Shared test helpers for the Curses UI Framework test suite.
+
+This module provides the fake windows, mock builders, call recorders and
+assertion helpers used by the property-based test modules. Fixtures that
+expose them live in conftest.py.
+"""
+
+from collections import deque
+from operator import add
+from unittest.mock import MagicMock
+
+# Curses window methods used by the framework; mocks are limited to these
+WINDOW_SPEC = ("getmaxyx", "addch", "addstr", "clear", "box", "refresh", "noutrefresh",
+               "attron", "attroff", "nodelay", "timeout")
+
+
+class _FakeWindow:
+    """
+    Slotted stand-in for a curses window whose calls don't need recording.
+
+    Every method in WINDOW_SPEC is a no-op apart from getmaxyx(), so it is
+    far cheaper to build and call than a MagicMock.
+    """
+
+    __slots__ = ("_size",)
+
+    def __init__(self, height, width):
+        self._size = (height, width)
+
+    def getmaxyx(self):
+        return self._size
+
+    def addch(self, *args):
+        pass
+
+    def addstr(self, *args):
+        pass
+
+    def clear(self):
+        pass
+
+    def box(self, *args):
+        pass
+
+    def refresh(self):
+        pass
+
+    def noutrefresh(self):
+        pass
+
+    def attron(self, attr):
+        pass
+
+    def attroff(self, attr):
+        pass
+
+    def nodelay(self, flag):
+        pass
+
+    def timeout(self, delay):
+        pass
+
+
+class _FakeStdscr(_FakeWindow):
+    """Slotted stand-in for the main curses screen, returning a fixed key from getch()."""
+
+    __slots__ = ("_key",)
+
+    def __init__(self, height=60, width=120, key=ord('q')):
+        super().__init__(height, width)
+        self._key = key
+
+    def getch(self):
+        return self._key
+
+
+def _build_mock_stdscr(height=60, width=120, key=ord('q')):
+    """
+    Build a mock stdscr reporting a fixed terminal size.
+
+    Args:
+        height: Terminal height returned by getmaxyx()
+        width: Terminal width returned by getmaxyx()
+        key: Key code returned by getch()
+
+    Returns:
+        MagicMock standing in for the main curses screen
+    """
+    mock_stdscr = MagicMock()
+    mock_stdscr.getmaxyx.return_value = (height, width)
+    mock_stdscr.getch.return_value = key
+    return mock_stdscr
+
+
+def _build_mock_window(height, width):
+    """
+    Build a mock curses window reporting a fixed size.
+
+    Args:
+        height: Window height returned by getmaxyx()
+        width: Window width returned by getmaxyx()
+
+    Returns:
+        MagicMock standing in for a curses window
+    """
+    mock_window = MagicMock(spec_set=WINDOW_SPEC)
+    mock_window.getmaxyx.return_value = (height, width)
+    return mock_window
+
+
+def _record_calls(method, maxlen=None):
+    """
+    Record (y, x, text) calls made to a mocked addstr/addch method.
+
+    Args:
+        method: Mocked window method to record
+        maxlen: Optional bound on the number of calls kept
+
+    Returns:
+        Deque that receives one (y, x, text) tuple per call
+    """
+    calls = deque(maxlen=maxlen)
+
+    def side_effect(y, x, text):
+        calls.append((y, x, text))
+
+    method.side_effect = side_effect
+    return calls
+
+
+def _reset_calls(*recorders):
+    """
+    Empty call recorders between rendering steps.
+
+    Args:
+        *recorders: Deques returned by _record_calls()
+    """
+    for calls in recorders:
+        calls.clear()
+
+
+def _assert_calls_in_window(calls, window_height, window_width, what, check_extent=True):
+    """
+    Assert that recorded (y, x, text) draw calls stay inside a window.
+
+    The calls are transposed into coordinate columns and checked with
+    min()/max(), so the passing case never loops in Python. Offending
+    calls are only collected for the message when an assertion fails.
+
+    Args:
+        calls: Recorded (y, x, text) tuples
+        window_height: Window height
+        window_width: Window width
+        what: Description used in failure messages
+        check_extent: Also check that each text ends inside the window
+    """
+    if not calls:
+        return
+    
+    ys, xs, texts = zip(*calls)
+    assert min(ys) >= 0 and max(ys) < window_height, \
+        f"{what} outside window height bounds: {[c for c in calls if not 0 <= c[0] < window_height]}"
+    assert min(xs) >= 0 and max(xs) < window_width, \
+        f"{what} outside window width bounds: {[c for c in calls if not 0 <= c[1] < window_width]}"
+    if check_extent:
+        assert max(map(add, xs, map(len, texts))) <= window_width, \
+            f"{what} extends beyond window width: {[c for c in calls if c[1] + len(c[2]) > window_width]}"
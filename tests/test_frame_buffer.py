@@ -0,0 +1,75 @@
+"""
+Property-based tests for buffered frame output.
+"""
+
+from hypothesis import given, strategies as st, settings
+
+from curses_ui_framework.frame_buffer import FrameBuffer
+
+
+def _paint(grid, y, x, text):
+    """Overlay text onto a grid of rows, ignoring cells outside it."""
+    row = grid.get(y)
+    if row is None:
+        return
+    for offset, char in enumerate(text):
+        if 0 <= x + offset < len(row):
+            row[x + offset] = char
+
+
+class TestFrameBuffer:
+    """Test buffered frame output properties."""
+
+    @given(
+        height=st.integers(min_value=1, max_value=10),
+        width=st.integers(min_value=1, max_value=40),
+        writes=st.lists(
+            st.tuples(st.integers(min_value=-2, max_value=12),
+                      st.integers(min_value=-5, max_value=45),
+                      st.text(alphabet="ab -", max_size=50)),
+            max_size=20
+        ),
+        fill=st.booleans()
+    )
+    @settings(max_examples=50)
+    def test_flush_matches_direct_writes_property(self, mock_window_factory, call_recorder,
+                                                  height, width, writes, fill):
+        """
+        For any sequence of writes, flushing the buffer should leave the content
+        area exactly as writing directly would, using at most one addstr per
+        touched row when no attributes are set
+        """
+        start_y, start_x = 1, 1
+        mock_window = mock_window_factory(height + 2, width + 2)
+        addstr_calls = call_recorder(mock_window.addstr)
+
+        frame_buffer = FrameBuffer(start_y, start_x, height, width)
+        expected = {start_y + row: [None] * (start_x + width) for row in range(height)}
+        if fill:
+            frame_buffer.fill()
+            for y in expected:
+                _paint(expected, y, start_x, ' ' * width)
+        for y, x, text in writes:
+            frame_buffer.add(y, x, text)
+            if x >= start_x:
+                _paint(expected, y, x, text)
+            else:
+                _paint(expected, y, start_x, text[start_x - x:])
+
+        frame_buffer.flush(mock_window)
+
+        actual = {start_y + row: [None] * (start_x + width) for row in range(height)}
+        for y, x, text in addstr_calls:
+            assert start_y <= y < start_y + height, f"Row {y} outside content area"
+            assert x >= start_x and x + len(text) <= start_x + width, \
+                f"Run at x={x} len={len(text)} outside content area"
+            _paint(actual, y, x, text)
+
+        assert actual == expected
+        if fill:
+            assert len(addstr_calls) == height
+
+        # Flushing empties the buffer
+        addstr_calls.clear()
+        frame_buffer.flush(mock_window)
+        assert not addstr_calls
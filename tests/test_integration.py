@@ -21,6 +21,7 @@ from curses_ui_framework import (
     CursesController,
     ApplicationModel,
     WindowView,
+    BottomStatistics,
     WindowManager,
     LayoutCalculator,
     FrameRenderer,
@@ -88,6 +89,9 @@ class MockCursesModule:
     def setupterm(self):
         pass
     
+    def doupdate(self):
+        pass
+    
     class error(Exception):
         pass
 
@@ -126,6 +130,9 @@ class MockWindow:
     def refresh(self):
         pass
     
+    def noutrefresh(self):
+        pass
+    
     def getch(self):
         # Return -1 for no input (non-blocking)
         return -1
@@ -333,6 +340,12 @@ class TestFullFrameworkIntegration(IntegrationTestBase):
         # Note: last_command might be empty in base implementation, just check it exists
         self.assertIn('last_command', final_stats)
         
+        # The view still accepts the model's statistics dictionary
+        view = WindowView(Mock())
+        view.set_bottom_window_statistics(final_stats)
+        self.assertIsInstance(view._current_statistics, BottomStatistics)
+        self.assertEqual(view._current_statistics.total_commands, final_stats['total_commands'])
+        
         # Test statistics display
         controller._execute_command("stats")
         content = self.model.get_main_content()
@@ -534,6 +547,81 @@ class TestPerformanceIntegration(IntegrationTestBase):
         # Verify content was set
         self.assertEqual(self.model.get_main_content(), large_content)
     
+    def test_selective_window_rendering(self):
+        """Test that render_all only redraws windows whose inputs changed"""
+        controller = CursesController(self.model)
+        stdscr = MockWindow(60, 120, 0, 0)
+        view = WindowView(stdscr)
+        controller.stdscr = stdscr
+        controller._validate_and_setup_layout()
+        view.initialize_windows(controller.layout_info)
+        view.render_all(self.model)
+        
+        with patch.object(view, 'render_top_window') as render_top, \
+             patch.object(view, 'render_main_window') as render_main, \
+             patch.object(view, 'render_bottom_window') as render_bottom:
+            # Nothing changed, so nothing is redrawn
+            view.render_all(self.model)
+            render_main.assert_not_called()
+            render_bottom.assert_not_called()
+            
+            # Only the main window depends on the main content
+            self.model.set_main_content("Updated content")
+            view.render_all(self.model)
+            render_main.assert_called_once_with("Updated content")
+            render_bottom.assert_not_called()
+            
+            # The bottom window also depends on the command input
+            view.set_bottom_window_command_input("hel")
+            view.render_all(self.model)
+            render_bottom.assert_called_once()
+            render_top.assert_not_called()
+
+    def test_unchanged_model_skips_render(self):
+        """Test that render_all returns early while the model revision is unchanged"""
+        controller = CursesController(self.model)
+        stdscr = MockWindow(60, 120, 0, 0)
+        view = WindowView(stdscr)
+        controller.stdscr = stdscr
+        controller._validate_and_setup_layout()
+        view.initialize_windows(controller.layout_info)
+        self.model.set_main_content("Same content")
+        view.render_all(self.model)
+
+        # Setting an identical value doesn't bump the revision
+        revision = self.model.get_revision()
+        self.model.set_main_content("Same content")
+        self.assertEqual(self.model.get_revision(), revision)
+
+        with patch.object(self.model, 'get_main_content',
+                          wraps=self.model.get_main_content) as get_main_content:
+            view.render_all(self.model)
+            get_main_content.assert_not_called()
+
+            # A window marked dirty is still refreshed
+            view.mark_window_dirty('main')
+            view.render_all(self.model)
+            get_main_content.assert_called_once()
+
+    def test_dirty_refresh_keeps_side_window_text(self):
+        """Test that refreshing dirty windows doesn't blank the left and bottom windows"""
+        controller = CursesController(self.model)
+        stdscr = MockWindow(60, 120, 0, 0)
+        view = WindowView(stdscr)
+        controller.stdscr = stdscr
+        controller._validate_and_setup_layout()
+        view.initialize_windows(controller.layout_info)
+        self.model.set_navigation_items(["alpha", "beta"])
+        view.render_all(self.model)
+        view.mark_all_windows_dirty()
+        view.refresh_dirty_windows()
+
+        left_text = ''.join(view.windows['left'].content.values())
+        bottom_text = ''.join(view.windows['bottom'].content.values())
+        self.assertIn("alpha", left_text)
+        self.assertIn("beta", left_text)
+        self.assertIn("Status: " + self.model.get_status(), bottom_text)
+
     def test_rapid_input_handling(self):
         """Test handling of rapid input"""
         controller = CursesController(self.model)
@@ -0,0 +1,115 @@
+"""
+Property-based tests for layout management.
+"""
+
+from itertools import combinations
+
+from hypothesis import given, example, strategies as st, settings
+
+from curses_ui_framework.layout_calculator import LayoutCalculator
+from curses_ui_framework.window_manager import WindowType
+
+# Minimum terminal size, always exercised as an explicit example
+_MIN_TERM = LayoutCalculator().get_minimum_terminal_size()
+
+
+class TestLayoutManagement:
+    """Test layout management properties."""
+
+    @given(
+        terminal_height=st.integers(min_value=60, max_value=200),
+        terminal_width=st.integers(min_value=120, max_value=300)
+    )
+    @settings(max_examples=100)
+    def test_layout_integrity_property(self, terminal_height, terminal_width):
+        """
+        Feature: curses-ui-framework, Property 10: Layout integrity
+        For any terminal size that meets minimum requirements, all windows 
+        should be positioned without overlap and with proper spacing between them
+        **Validates: Requirements 7.1, 7.2, 7.3**
+        """
+        # Create layout calculator
+        calculator = LayoutCalculator()
+        
+        # Calculate layout for the given terminal size
+        layout = calculator.calculate_layout(terminal_height, terminal_width)
+        
+        # Unpack each window geometry once as (name, x, y, width, height)
+        windows = [
+            (name, w.x, w.y, w.width, w.height)
+            for name, w in (
+                ("top", layout.top_window),
+                ("left", layout.left_window),
+                ("main", layout.main_window),
+                ("bottom", layout.bottom_window)
+            )
+        ]
+        
+        # Check that no two windows overlap (overlap is symmetric, so each pair once)
+        for (n1, x1, y1, wi1, h1), (n2, x2, y2, wi2, h2) in combinations(windows, 2):
+            overlap_x = not (x1 + wi1 <= x2 or x2 + wi2 <= x1)
+            overlap_y = not (y1 + h1 <= y2 or y2 + h2 <= y1)
+            
+            # Windows should not overlap
+            assert not (overlap_x and overlap_y), f"Windows {n1} and {n2} overlap"
+        
+        # Verify all windows fit within terminal bounds
+        for name, x, y, width, height in windows:
+            assert x >= 0, f"{name} window x position is negative"
+            assert y >= 0, f"{name} window y position is negative"
+            assert x + width <= terminal_width, f"{name} window exceeds terminal width"
+            assert y + height <= terminal_height, f"{name} window exceeds terminal height"
+        
+        # Verify proper spacing (windows should be adjacent, not separated)
+        # Top window should be at the very top
+        assert layout.top_window.y == 0
+        
+        # Left and main windows should start right after top window
+        assert layout.left_window.y == layout.top_window.height
+        assert layout.main_window.y == layout.top_window.height
+        
+        # Main window should start right after left window (no gap)
+        assert layout.main_window.x == layout.left_window.width
+        
+        # Bottom window should be at the very bottom
+        assert layout.bottom_window.y + layout.bottom_window.height == terminal_height
+
+    @example(terminal_height=_MIN_TERM[0], terminal_width=_MIN_TERM[1])
+    @given(
+        terminal_height=st.integers(min_value=60, max_value=80),  # Near minimum size
+        terminal_width=st.integers(min_value=120, max_value=150)  # Near minimum size
+    )
+    @settings(max_examples=100)
+    def test_minimum_size_constraints_property(self, terminal_height, terminal_width):
+        """
+        Feature: curses-ui-framework, Property 11: Minimum size constraints
+        For any window type, it should maintain its minimum size requirements 
+        even when the terminal approaches the minimum allowable dimensions
+        **Validates: Requirements 7.5**
+        """
+        # Create layout calculator
+        calculator = LayoutCalculator()
+        
+        # Calculate layout for the given terminal size
+        layout = calculator.calculate_layout(terminal_height, terminal_width)
+        
+        # Verify each window meets its minimum size requirements
+        windows_to_check = [
+            (WindowType.TOP, layout.top_window),
+            (WindowType.LEFT, layout.left_window),
+            (WindowType.MAIN, layout.main_window),
+            (WindowType.BOTTOM, layout.bottom_window)
+        ]
+        
+        for window_type, geometry in windows_to_check:
+            min_height, min_width = LayoutCalculator.MIN_WINDOW_SIZES[window_type]
+            
+            # Each window should meet or exceed its minimum size
+            assert geometry.height >= min_height, \
+                f"{window_type.value} window height {geometry.height} is below minimum {min_height}"
+            assert geometry.width >= min_width, \
+                f"{window_type.value} window width {geometry.width} is below minimum {min_width}"
+        
+        # Verify that the layout calculator correctly validates terminal size
+        assert calculator.validate_terminal_size(terminal_height, terminal_width), \
+            f"Terminal size {terminal_height}x{terminal_width} should be valid"
@@ -0,0 +1,95 @@
+"""
+Property-based tests for application metadata display.
+"""
+
+from unittest.mock import patch
+from hypothesis import given, strategies as st, settings
+
+from curses_ui_framework import ApplicationModel
+from curses_ui_framework.view import WindowView
+from curses_ui_framework.content_manager import ContentManager
+
+
+class TestApplicationMetadataDisplay:
+    """Test application metadata display properties."""
+
+    @patch('curses.has_colors', return_value=True)
+    @patch('curses.start_color')
+    @patch('curses.init_pair')
+    @given(
+        title=st.text(min_size=1, max_size=50, alphabet=st.characters(min_codepoint=32, max_codepoint=126)).filter(lambda x: x.strip()),
+        author=st.text(min_size=1, max_size=30, alphabet=st.characters(min_codepoint=32, max_codepoint=126)).filter(lambda x: x.strip()),
+        version=st.text(min_size=1, max_size=10, alphabet=st.characters(min_codepoint=32, max_codepoint=126)).filter(lambda x: x.strip())
+    )
+    @settings(max_examples=20)
+    def test_application_metadata_display_property(self, mock_init_pair, mock_start_color, mock_has_colors,
+                                                   mock_stdscr_factory, mock_window_factory,
+                                                   title, author, version):
+        """
+        Feature: curses-ui-framework, Property 4: Application metadata display
+        For any valid title, author, and version strings, the top window should 
+        display all three pieces of information correctly
+        **Validates: Requirements 2.1, 2.2, 2.3**
+        """
+        # Create application model with the generated metadata
+        model = ApplicationModel(title, author, version)
+        
+        # Create a mock stdscr
+        mock_stdscr = mock_stdscr_factory()
+        
+        # Create view instance
+        view = WindowView(mock_stdscr)
+        
+        # Test the metadata formatting method directly
+        formatted_metadata = view._format_application_metadata(title, author, version)
+        
+        # Verify that all three pieces of metadata are present in the formatted text
+        assert title.strip() in formatted_metadata, f"Title '{title}' not found in formatted metadata: '{formatted_metadata}'"
+        assert author.strip() in formatted_metadata, f"Author '{author}' not found in formatted metadata: '{formatted_metadata}'"
+        assert version.strip() in formatted_metadata, f"Version '{version}' not found in formatted metadata: '{formatted_metadata}'"
+        
+        # Verify proper formatting - version should be prefixed with 'v'
+        version_with_prefix = f"v{version.strip()}"
+        assert version_with_prefix in formatted_metadata, f"Version with 'v' prefix '{version_with_prefix}' not found in formatted metadata: '{formatted_metadata}'"
+        
+        # Verify that the content is properly structured
+        lines = formatted_metadata.split('\n')
+        
+        # Should have at least one line with content
+        non_empty_lines = [line for line in lines if line.strip()]
+        assert len(non_empty_lines) > 0, "No content lines in formatted metadata"
+        
+        # If we have multiple lines, verify structure
+        if len(non_empty_lines) >= 2:
+            # First line should contain title
+            first_line = non_empty_lines[0]
+            assert title.strip() in first_line, f"First line should contain title, got: '{first_line}'"
+            
+            # Second line should contain author and version
+            second_line = non_empty_lines[1]
+            assert author.strip() in second_line, f"Second line should contain author, got: '{second_line}'"
+            assert version_with_prefix in second_line, f"Second line should contain version, got: '{second_line}'"
+        
+        # Test ContentManager text handling with the formatted metadata
+        mock_window = mock_window_factory(3, 120)  # Top window size
+        
+        content_manager = ContentManager(mock_window)
+        content_manager.set_centered_text(formatted_metadata)
+        
+        # Verify that the content was stored correctly
+        stored_lines = content_manager.get_content_lines()
+        
+        # Should have stored some content
+        assert len(stored_lines) > 0, "ContentManager should store formatted metadata"
+        
+        # All metadata should be present in stored content
+        title_text = title.strip()
+        author_text = author.strip()
+        assert any(title_text in line for line in stored_lines), f"Title not found in stored content: {stored_lines!r}"
+        assert any(author_text in line for line in stored_lines), f"Author not found in stored content: {stored_lines!r}"
+        assert any(version_with_prefix in line for line in stored_lines), f"Version not found in stored content: {stored_lines!r}"
+        
+        # Verify content fits within window bounds (accounting for frame)
+        content_width = 120 - 2  # Account for frame borders
+        for line in stored_lines:
+            assert len(line) <= content_width, f"Stored line exceeds window width: '{line}' (len={len(line)}, max={content_width})"
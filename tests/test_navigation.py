@@ -0,0 +1,194 @@
+"""
+Property-based tests for left window navigation support.
+"""
+
+import re
+from unittest.mock import patch
+from hypothesis import given, strategies as st, settings
+
+from curses_ui_framework.view import WindowView
+from curses_ui_framework.frame_renderer import FrameRenderer
+
+# Numbered list entry: "1. item" or " 1. item" when unselected, "> . item"
+# when the selection indicator replaces the number
+_NUMBERED_RE = re.compile(r' ?[0-9]\. |> \. ')
+
+# ASCII digit class; re compiles it to a bitmap, so each character is a
+# table lookup rather than a Unicode category query
+_ITEM_DIGIT_RE = re.compile(r'[0-9]')
+
+
+class TestLeftWindowNavigationSupport:
+    """Test left window navigation support properties."""
+
+    @patch('curses.has_colors', return_value=True)
+    @patch('curses.start_color')
+    @patch('curses.init_pair')
+    @patch('curses.color_pair', return_value=2)
+    @given(
+        navigation_items=st.lists(
+            st.text(min_size=1, max_size=30, alphabet=st.characters(min_codepoint=32, max_codepoint=126)).filter(lambda x: x.strip()),
+            min_size=1, max_size=20
+        ),
+        selected_index=st.integers(min_value=0, max_value=19),
+        window_height=st.integers(min_value=5, max_value=30),
+        window_width=st.integers(min_value=25, max_value=50)
+    )
+    @settings(max_examples=100)
+    def test_left_window_navigation_support_property(self, mock_color_pair, mock_init_pair, mock_start_color,
+                                                     mock_has_colors, mock_stdscr_factory, mock_window_factory,
+                                                     call_recorder, frame_renderer_mocks, navigation_items, selected_index,
+                                                     window_height, window_width):
+        """
+        Feature: curses-ui-framework, Property 6: Left window navigation support
+        For any list of navigation items added to the left window, they should be 
+        displayed in list format with proper highlighting support for selection
+        **Validates: Requirements 3.4, 3.5**
+        """
+        # Ensure selected_index is within bounds
+        if selected_index >= len(navigation_items):
+            selected_index = len(navigation_items) - 1
+
+        # Create a mock window with the specified dimensions
+        mock_window = mock_window_factory(window_height, window_width)
+        
+        # Track addstr calls to verify navigation item rendering
+        call_limit = window_height * window_width + 64
+        addstr_calls = call_recorder(mock_window.addstr, call_limit)
+        
+        # Track addch calls for character-by-character operations
+        addch_calls = call_recorder(mock_window.addch, call_limit)
+        
+        # Track attribute changes for highlighting
+        attron_calls = []
+        attroff_calls = []
+        
+        def attron_side_effect(attr):
+            attron_calls.append(attr)
+            
+        def attroff_side_effect(attr):
+            attroff_calls.append(attr)
+            
+        mock_window.attron.side_effect = attron_side_effect
+        mock_window.attroff.side_effect = attroff_side_effect
+        
+        # Create WindowView and render left window
+        mock_stdscr = mock_stdscr_factory()
+        view = WindowView(mock_stdscr)
+        view.frame_renderer = FrameRenderer()
+        
+        # Set up the left window in the view
+        view.windows = {'left': mock_window}
+        
+        # Mock the get_content_area method to return predictable values
+        content_start_y = 1
+        content_start_x = 1
+        content_height = max(1, window_height - 2)
+        content_width = max(1, window_width - 2)
+        get_content_area = frame_renderer_mocks['get_content_area']
+        get_content_area.return_value = (content_start_y, content_start_x, content_height, content_width)
+        
+        # Patch in the class-wide mocks for get_content_area and draw_frame
+        with patch.object(view.frame_renderer, 'get_content_area', new=get_content_area), \
+             patch.object(view.frame_renderer, 'draw_frame', new=frame_renderer_mocks['draw_frame']):
+            
+            # Render the left window with navigation items
+            view.render_left_window(navigation_items, selected_index)
+    
+        # Calculate expected visible items based on content area
+        visible_item_count = min(len(navigation_items), content_height) if content_height > 0 else 0
+        
+        # Verify that navigation items are displayed in list format
+        if navigation_items and content_height > 0 and content_width > 0:
+            
+            # Should have some rendering calls (either addstr or addch for clearing/content)
+            total_calls = len(addstr_calls) + len(addch_calls)
+            assert total_calls > 0, f"No rendering calls made for navigation items"
+            
+            # Walk the addstr calls once, collecting everything the checks below need
+            rendered_texts = []
+            numbered_patterns_found = 0
+            selection_indicator_count = 0
+            navigation_related_count = 0
+            out_of_bounds_calls = []
+            content_end_y = content_start_y + content_height
+            for call in addstr_calls:
+                y, x, text = call
+                rendered_texts.append(text)
+                
+                # Numbered entries look like "1. item" (or "> . item" when selected)
+                is_numbered = _NUMBERED_RE.match(text) is not None
+                if is_numbered:
+                    numbered_patterns_found += 1
+                
+                # Selection indicators and anything that looks like an item line;
+                # numbered entries already qualify, so the digit scan is skipped
+                is_selected = text.startswith('>')
+                if is_selected:
+                    selection_indicator_count += 1
+                if (is_numbered or is_selected or _ITEM_DIGIT_RE.search(text, 0, 5)
+                        or 'No items' in text):
+                    navigation_related_count += 1
+                
+                # Items must stay inside the content area and fit its fixed width
+                if not (content_start_y <= y < content_end_y and x >= content_start_x
+                        and len(text) <= content_width):
+                    out_of_bounds_calls.append(call)
+            
+            # Should find at least some numbered items (accounting for possible truncation/scrolling)
+            expected_numbered_items = min(visible_item_count, len(navigation_items))
+            if expected_numbered_items > 0:
+                assert numbered_patterns_found > 0, \
+                    f"Navigation items should be displayed with numbering in list format. " \
+                    f"Expected some numbered items, found {numbered_patterns_found}. " \
+                    f"Rendered texts: {rendered_texts}"
+            
+            # Verify that navigation items are rendered within content bounds and fixed width
+            assert not out_of_bounds_calls, \
+                f"Navigation items rendered outside the {content_height}x{content_width} content area: " \
+                f"{out_of_bounds_calls}"
+            
+            # Verify proper highlighting support for selection
+            if selected_index < len(navigation_items) and visible_item_count > 0:
+                # Check for visual selection indicators (like "> " prefix or highlighting)
+                highlighting_used = len(attron_calls) > 0 and len(attroff_calls) > 0
+                
+                # Should have either visual indicators OR highlighting (or both)
+                assert selection_indicator_count > 0 or highlighting_used, \
+                    f"Selected item should be visually distinguished with indicators or highlighting. " \
+                    f"Selection indicators: {selection_indicator_count}, Highlighting: {highlighting_used}"
+            
+            # Should not render more items than can fit in the visible area
+            assert navigation_related_count <= max(1, content_height), \
+                f"Too many navigation items rendered: {navigation_related_count} > {content_height} (content height)"
+            
+            # Test that long navigation item names are handled (truncated or wrapped)
+            for item in navigation_items:
+                # Account for numbering format "XX. " (up to 4 characters)
+                available_space = content_width - 4
+                if len(item) > available_space and available_space > 0:
+                    # Should find some representation of the item (truncated or partial)
+                    item_prefix = item[:min(10, available_space)]
+                    item_found = any(item_prefix in text for text in rendered_texts)
+                    # If not found by prefix, check if any part of the item appears
+                    if not item_found and len(item) > 3:
+                        item_found = any(item[:3] in text for text in rendered_texts)
+                    
+                    # It's acceptable if very long items are not rendered due to space constraints
+                    # The important thing is that the system doesn't crash
+                    assert True  # Long items are handled gracefully
+        
+        # Test empty navigation items case
+        elif not navigation_items:
+            # Should handle empty list gracefully - either show placeholder or render nothing
+            if len(addstr_calls) > 0:
+                rendered_texts = [text for y, x, text in addstr_calls]
+                # If something is rendered, it should be a placeholder
+                placeholder_found = any("No items" in text for text in rendered_texts)
+                # Placeholder is optional - empty rendering is also acceptable
+                assert True  # Empty case is handled gracefully
+        
+        # Test very small content area case
+        elif content_height <= 0 or content_width <= 0:
+            # Should handle gracefully without crashing
+            assert True  # Graceful handling of impossible content area
@@ -1,24 +1,28 @@
 """
 Property-based tests for the Curses UI Framework.
 
-This module contains all property-based tests that verify universal
-correctness properties across the framework.
+This module contains the property-based tests for content management,
+window rendering, resize handling and error handling. Layout, frame,
+metadata, wrapping, navigation and terminal resource properties live in
+their own modules so the suite can be distributed with ``pytest -n auto``.
 """
 
 import curses
-import os
-import sys
-from unittest.mock import patch, MagicMock
-from hypothesis import given, strategies as st, settings
+import re
+from collections import deque
+from contextlib import ExitStack
+from functools import lru_cache
+from itertools import combinations, count
+from unittest.mock import patch, MagicMock, DEFAULT
+from hypothesis import given, strategies as st, settings, Phase
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from curses_ui_framework import CursesController, ApplicationModel
 from curses_ui_framework.layout_calculator import LayoutCalculator
 from curses_ui_framework.window_manager import WindowType, WindowManager
 from curses_ui_framework.frame_renderer import FrameRenderer, FrameStyle
+from curses_ui_framework.view import WindowView, BottomStatistics
+from curses_ui_framework.content_manager import ContentManager
 from curses_ui_framework.exceptions import (
     CursesFrameworkError, 
     TerminalTooSmallError, 
@@ -26,696 +30,74 @@ from curses_ui_framework.exceptions import (
     CursesInitializationError
 )
 
+from .helpers import WINDOW_SPEC, _FakeStdscr, _FakeWindow, _assert_calls_in_window, _reset_calls
 
-class TestTerminalResourceManagement:
-    """Test terminal resource management property."""
+# Statistics shown by the bottom window display mode test; frozen, so shared
+_DISPLAY_STATISTICS = BottomStatistics(total_commands=42, last_command='test command',
+                                       content_lines=100, uptime=3600)
 
-    @given(
-        title=st.text(min_size=1, max_size=50),
-        author=st.text(min_size=1, max_size=30),
-        version=st.text(min_size=1, max_size=10)
-    )
-    @settings(max_examples=100)
-    def test_terminal_resource_management_property(self, title, author, version):
-        """
-        Feature: curses-ui-framework, Property 1: Terminal resource management
-        For any framework instance, initializing and then cleaning up should restore
-        the terminal to its original state without leaving curses mode active
-        **Validates: Requirements 1.2**
-        """
-        # Create application model with random but valid inputs
-        model = ApplicationModel(title, author, version)
-
-        # Mock curses to avoid actual terminal interaction during testing
-        with patch('curses.wrapper') as mock_wrapper, \
-             patch('curses.curs_set') as mock_curs_set, \
-             patch('curses.has_colors', return_value=True), \
-             patch('curses.start_color'), \
-             patch('curses.init_pair'):
+# Strategies shared across tests; built once at import rather than per
+# decorator, and in the resize test per drawn example
+_PRINTABLE = st.characters(min_codepoint=32, max_codepoint=126)
+_BOTTOM_HEIGHT = st.integers(min_value=3, max_value=10)
+_BOTTOM_WIDTH = st.integers(min_value=30, max_value=120)
+_INIT_H = st.integers(min_value=60, max_value=100)
+_INIT_W = st.integers(min_value=120, max_value=200)
+_NEW_H = st.integers(min_value=60, max_value=150)
+_NEW_W = st.integers(min_value=120, max_value=250)
+_HEIGHT_DELTA = st.integers(-20, 20)
+_WIDTH_DELTA = st.integers(-30, 30)
+_SIZE_DELTA = st.tuples(_HEIGHT_DELTA, _WIDTH_DELTA)
 
-            # Mock stdscr with minimum required size
-            mock_stdscr = MagicMock()
-            mock_stdscr.getmaxyx.return_value = (60, 120)  # Minimum size
-            mock_stdscr.getch.return_value = ord('q')  # Immediate quit
-            mock_stdscr.nodelay = MagicMock()
-            mock_stdscr.timeout = MagicMock()
-            mock_stdscr.clear = MagicMock()
-            mock_stdscr.refresh = MagicMock()
+# Example budget for the heaviest property: half the active Hypothesis profile's
+# (see conftest), so local "dev" runs stay quick and "ci" runs explore more
+_HEAVY_MAX_EXAMPLES = max(10, settings().max_examples // 2)
 
-            # Mock window creation
-            mock_window = MagicMock()
-            mock_window.getmaxyx.return_value = (3, 120)
-            mock_window.clear = MagicMock()
-            mock_window.box = MagicMock()
-            mock_window.addstr = MagicMock()
-            mock_window.refresh = MagicMock()
-            mock_window.attron = MagicMock()
-            mock_window.attroff = MagicMock()
-
-            with patch('curses.newwin', return_value=mock_window):
-                # Set up wrapper to call our main loop
-                def wrapper_side_effect(func):
-                    return func(mock_stdscr)
-                mock_wrapper.side_effect = wrapper_side_effect
-
-                # Create controller and run
-                controller = CursesController(model)
-
-                # Track initial state
-                initial_curs_set_calls = mock_curs_set.call_count
-
-                # Run the application (should initialize and cleanup)
-                controller.run()
+# Words signalling status information or input help, each matched in one
+# case-insensitive regex scan so rendered text needn't be lowercased first
+_STATUS_INDICATOR_RE = re.compile(r'status|command|content|uptime', re.IGNORECASE)
+_HELP_INDICATOR_RE = re.compile(r'tab|enter|execute|switch|mode|command', re.IGNORECASE)
+_COMMAND_PROMPT_RE = re.compile(r'command', re.IGNORECASE)
 
-                # Verify proper initialization occurred
-                mock_wrapper.assert_called_once()
 
-                # Verify cursor was managed (set to invisible during run)
-                assert mock_curs_set.call_count > initial_curs_set_calls
+def _clamp(value, low, high):
+    """Clamp value to the inclusive range [low, high]."""
+    return low if value < low else high if value > high else value
 
-                # Verify controller properly shut down
-                assert not controller.running
 
-                # Verify view cleanup was called
-                if controller.view:
-                    # The view should have been cleaned up
-                    assert controller.view.windows == {} or len(controller.view.windows) == 0
+def _assert_lines_fit(lines, width, what):
+    """
+    Assert that every content line is at most width long.
 
-        # Property: Terminal should be restored to original state
-        # In a real terminal, curses.wrapper handles this automatically
-        # Our test verifies the framework doesn't interfere with this process
+    The lengths are checked with one max() reduction; offending lines are
+    only collected for the message when the assertion fails.
 
+    Args:
+        lines: Content lines
+        width: Maximum line length
+        what: Description used in failure messages
+    """
+    assert max(map(len, lines), default=0) <= width, \
+        f"{what} should fit within width {width}: {[line for line in lines if len(line) > width]}"
 
-class TestLayoutManagement:
-    """Test layout management properties."""
 
-    @given(
-        terminal_height=st.integers(min_value=60, max_value=200),
-        terminal_width=st.integers(min_value=120, max_value=300)
-    )
-    @settings(max_examples=100)
-    def test_layout_integrity_property(self, terminal_height, terminal_width):
-        """
-        Feature: curses-ui-framework, Property 10: Layout integrity
-        For any terminal size that meets minimum requirements, all windows 
-        should be positioned without overlap and with proper spacing between them
-        **Validates: Requirements 7.1, 7.2, 7.3**
-        """
-        # Create layout calculator
-        calculator = LayoutCalculator()
-        
-        # Calculate layout for the given terminal size
-        layout = calculator.calculate_layout(terminal_height, terminal_width)
-        
-        # Verify no overlaps between windows
-        windows = [
-            ("top", layout.top_window),
-            ("left", layout.left_window),
-            ("main", layout.main_window),
-            ("bottom", layout.bottom_window)
-        ]
-        
-        # Check that no two windows overlap
-        for i, (name1, win1) in enumerate(windows):
-            for j, (name2, win2) in enumerate(windows):
-                if i != j:  # Don't compare window with itself
-                    # Check if windows overlap
-                    overlap_x = not (win1.x + win1.width <= win2.x or win2.x + win2.width <= win1.x)
-                    overlap_y = not (win1.y + win1.height <= win2.y or win2.y + win2.height <= win1.y)
-                    
-                    # Windows should not overlap
-                    assert not (overlap_x and overlap_y), f"Windows {name1} and {name2} overlap"
-        
-        # Verify all windows fit within terminal bounds
-        for name, window in windows:
-            assert window.x >= 0, f"{name} window x position is negative"
-            assert window.y >= 0, f"{name} window y position is negative"
-            assert window.x + window.width <= terminal_width, f"{name} window exceeds terminal width"
-            assert window.y + window.height <= terminal_height, f"{name} window exceeds terminal height"
-        
-        # Verify proper spacing (windows should be adjacent, not separated)
-        # Top window should be at the very top
-        assert layout.top_window.y == 0
-        
-        # Left and main windows should start right after top window
-        assert layout.left_window.y == layout.top_window.height
-        assert layout.main_window.y == layout.top_window.height
-        
-        # Main window should start right after left window (no gap)
-        assert layout.main_window.x == layout.left_window.width
-        
-        # Bottom window should be at the very bottom
-        assert layout.bottom_window.y + layout.bottom_window.height == terminal_height
+def _assert_windows_fit(windows, terminal_height, terminal_width, phase):
+    """
+    Assert that every window lies inside the terminal.
 
-    @given(
-        terminal_height=st.integers(min_value=60, max_value=80),  # Near minimum size
-        terminal_width=st.integers(min_value=120, max_value=150)  # Near minimum size
-    )
-    @settings(max_examples=100)
-    def test_minimum_size_constraints_property(self, terminal_height, terminal_width):
-        """
-        Feature: curses-ui-framework, Property 11: Minimum size constraints
-        For any window type, it should maintain its minimum size requirements 
-        even when the terminal approaches the minimum allowable dimensions
-        **Validates: Requirements 7.5**
-        """
-        # Create layout calculator
-        calculator = LayoutCalculator()
-        
-        # Calculate layout for the given terminal size
-        layout = calculator.calculate_layout(terminal_height, terminal_width)
-        
-        # Get minimum size requirements for each window type
-        min_sizes = {
-            WindowType.TOP: calculator.get_window_minimum_size(WindowType.TOP),
-            WindowType.LEFT: calculator.get_window_minimum_size(WindowType.LEFT),
-            WindowType.MAIN: calculator.get_window_minimum_size(WindowType.MAIN),
-            WindowType.BOTTOM: calculator.get_window_minimum_size(WindowType.BOTTOM)
-        }
-        
-        # Verify each window meets its minimum size requirements
-        windows_to_check = [
-            (WindowType.TOP, layout.top_window),
-            (WindowType.LEFT, layout.left_window),
-            (WindowType.MAIN, layout.main_window),
-            (WindowType.BOTTOM, layout.bottom_window)
-        ]
-        
-        for window_type, geometry in windows_to_check:
-            min_height, min_width = min_sizes[window_type]
-            
-            # Each window should meet or exceed its minimum size
-            assert geometry.height >= min_height, \
-                f"{window_type.value} window height {geometry.height} is below minimum {min_height}"
-            assert geometry.width >= min_width, \
-                f"{window_type.value} window width {geometry.width} is below minimum {min_width}"
-        
-        # Verify that the layout calculator correctly validates terminal size
-        assert calculator.validate_terminal_size(terminal_height, terminal_width), \
-            f"Terminal size {terminal_height}x{terminal_width} should be valid"
-        
-        # Test edge case: terminal exactly at minimum size
-        min_term_height, min_term_width = calculator.get_minimum_terminal_size()
-        if terminal_height == min_term_height and terminal_width == min_term_width:
-            # Should still be able to create a valid layout
-            min_layout = calculator.calculate_layout(min_term_height, min_term_width)
-            
-            # All windows should still meet minimum requirements
-            min_windows_to_check = [
-                (WindowType.TOP, min_layout.top_window),
-                (WindowType.LEFT, min_layout.left_window),
-                (WindowType.MAIN, min_layout.main_window),
-                (WindowType.BOTTOM, min_layout.bottom_window)
-            ]
-            
-            for window_type, geometry in min_windows_to_check:
-                min_height, min_width = min_sizes[window_type]
-                assert geometry.height >= min_height
-                assert geometry.width >= min_width
+    Each window is checked with one combined condition; the failure
+    message is only built for a window that doesn't fit.
 
-
-class TestFrameRendering:
-    """Test frame rendering properties."""
-
-    @given(
-        window_height=st.integers(min_value=3, max_value=50),
-        window_width=st.integers(min_value=3, max_value=100),
-        frame_style=st.sampled_from(list(FrameStyle))
-    )
-    @settings(max_examples=100)
-    def test_universal_frame_rendering_property(self, window_height, window_width, frame_style):
-        """
-        Feature: curses-ui-framework, Property 5: Universal frame rendering
-        For any window in the framework, it should be surrounded by a complete frame 
-        using appropriate box-drawing characters
-        **Validates: Requirements 2.4, 3.2, 4.2, 5.3, 6.1**
-        """
-        # Create a mock window with the specified dimensions
-        mock_window = MagicMock()
-        mock_window.getmaxyx.return_value = (window_height, window_width)
-        mock_window.clear = MagicMock()
-        
-        # Track addch calls to verify frame drawing
-        addch_calls = []
-        
-        def addch_side_effect(y, x, char):
-            addch_calls.append((y, x, char))
-            
-        mock_window.addch.side_effect = addch_side_effect
-        
-        # Create frame renderer and draw frame
-        frame_renderer = FrameRenderer()
-        frame_renderer.draw_frame(mock_window, frame_style)
-        
-        # Verify that addch was called (frame drawing occurred)
-        assert len(addch_calls) > 0, f"Window had no frame drawing calls"
-        
-        # Convert calls to a set of positions for easier checking
-        drawn_positions = {(y, x) for y, x, char in addch_calls}
-        
-        # Verify frame positions were drawn
-        # Check corners
-        assert (0, 0) in drawn_positions, f"Window missing top-left corner"
-        assert (0, window_width - 1) in drawn_positions, f"Window missing top-right corner"
-        assert (window_height - 1, 0) in drawn_positions, f"Window missing bottom-left corner"
-        assert (window_height - 1, window_width - 1) in drawn_positions, f"Window missing bottom-right corner"
-        
-        # Check that horizontal lines are drawn (top and bottom)
-        for x in range(1, window_width - 1):
-            assert (0, x) in drawn_positions, f"Window missing top border at x={x}"
-            assert (window_height - 1, x) in drawn_positions, f"Window missing bottom border at x={x}"
-        
-        # Check that vertical lines are drawn (left and right)
-        for y in range(1, window_height - 1):
-            assert (y, 0) in drawn_positions, f"Window missing left border at y={y}"
-            assert (y, window_width - 1) in drawn_positions, f"Window missing right border at y={y}"
-        
-        # Verify that the frame doesn't interfere with content area
-        content_area = frame_renderer.get_content_area(mock_window)
-        start_y, start_x, content_height, content_width = content_area
-        
-        # Content area should be properly calculated
-        assert start_y == 1, f"Window content area start_y should be 1"
-        assert start_x == 1, f"Window content area start_x should be 1"
-        assert content_height == window_height - 2, f"Window content height incorrect"
-        assert content_width == window_width - 2, f"Window content width incorrect"
-        
-        # Verify content area is within window bounds
-        assert content_height >= 0, f"Window content height is negative"
-        assert content_width >= 0, f"Window content width is negative"
-        
-        # Verify that no frame characters are drawn in the content area
-        for y in range(start_y, start_y + content_height):
-            for x in range(start_x, start_x + content_width):
-                assert (y, x) not in drawn_positions, f"Frame character drawn in content area at ({y}, {x})"
-
-
-class TestApplicationMetadataDisplay:
-    """Test application metadata display properties."""
-
-    @given(
-        title=st.text(min_size=1, max_size=50, alphabet=st.characters(min_codepoint=32, max_codepoint=126)).filter(lambda x: x.strip()),
-        author=st.text(min_size=1, max_size=30, alphabet=st.characters(min_codepoint=32, max_codepoint=126)).filter(lambda x: x.strip()),
-        version=st.text(min_size=1, max_size=10, alphabet=st.characters(min_codepoint=32, max_codepoint=126)).filter(lambda x: x.strip())
-    )
-    @settings(max_examples=20)
-    def test_application_metadata_display_property(self, title, author, version):
-        """
-        Feature: curses-ui-framework, Property 4: Application metadata display
-        For any valid title, author, and version strings, the top window should 
-        display all three pieces of information correctly
-        **Validates: Requirements 2.1, 2.2, 2.3**
-        """
-        # Create application model with the generated metadata
-        model = ApplicationModel(title, author, version)
-        
-        # Mock curses components for testing
-        with patch('curses.has_colors', return_value=True), \
-             patch('curses.start_color'), \
-             patch('curses.init_pair'):
-            
-            # Test the metadata formatting directly
-            from curses_ui_framework.view import WindowView
-            
-            # Create a mock stdscr
-            mock_stdscr = MagicMock()
-            
-            # Create view instance
-            view = WindowView(mock_stdscr)
-            
-            # Test the metadata formatting method directly
-            formatted_metadata = view._format_application_metadata(title, author, version)
-            
-            # Verify that all three pieces of metadata are present in the formatted text
-            assert title.strip() in formatted_metadata, f"Title '{title}' not found in formatted metadata: '{formatted_metadata}'"
-            assert author.strip() in formatted_metadata, f"Author '{author}' not found in formatted metadata: '{formatted_metadata}'"
-            assert version.strip() in formatted_metadata, f"Version '{version}' not found in formatted metadata: '{formatted_metadata}'"
-            
-            # Verify proper formatting - version should be prefixed with 'v'
-            version_with_prefix = f"v{version.strip()}"
-            assert version_with_prefix in formatted_metadata, f"Version with 'v' prefix '{version_with_prefix}' not found in formatted metadata: '{formatted_metadata}'"
-            
-            # Verify that the content is properly structured
-            lines = formatted_metadata.split('\n')
-            
-            # Should have at least one line with content
-            non_empty_lines = [line for line in lines if line.strip()]
-            assert len(non_empty_lines) > 0, "No content lines in formatted metadata"
-            
-            # If we have multiple lines, verify structure
-            if len(non_empty_lines) >= 2:
-                # First line should contain title
-                first_line = non_empty_lines[0]
-                assert title.strip() in first_line, f"First line should contain title, got: '{first_line}'"
-                
-                # Second line should contain author and version
-                second_line = non_empty_lines[1]
-                assert author.strip() in second_line, f"Second line should contain author, got: '{second_line}'"
-                assert version_with_prefix in second_line, f"Second line should contain version, got: '{second_line}'"
-            
-            # Test ContentManager text handling with the formatted metadata
-            mock_window = MagicMock()
-            mock_window.getmaxyx.return_value = (3, 120)  # Top window size
-            mock_window.clear = MagicMock()
-            mock_window.addch = MagicMock()
-            mock_window.addstr = MagicMock()
-            
-            from curses_ui_framework.content_manager import ContentManager
-            
-            content_manager = ContentManager(mock_window)
-            content_manager.set_centered_text(formatted_metadata)
-            
-            # Verify that the content was stored correctly
-            stored_lines = content_manager.get_content_lines()
-            
-            # Should have stored some content
-            assert len(stored_lines) > 0, "ContentManager should store formatted metadata"
-            
-            # All metadata should be present in stored content
-            all_stored_text = ' '.join(stored_lines)
-            assert title.strip() in all_stored_text, f"Title not found in stored content: '{all_stored_text}'"
-            assert author.strip() in all_stored_text, f"Author not found in stored content: '{all_stored_text}'"
-            assert version_with_prefix in all_stored_text, f"Version not found in stored content: '{all_stored_text}'"
-            
-            # Verify content fits within window bounds (accounting for frame)
-            content_width = 120 - 2  # Account for frame borders
-            for line in stored_lines:
-                assert len(line) <= content_width, f"Stored line exceeds window width: '{line}' (len={len(line)}, max={content_width})"
-
-
-class TestTextFormattingAndWrapping:
-    """Test text formatting and wrapping properties."""
-
-    @given(
-        content=st.text(min_size=1, max_size=500),
-        window_width=st.integers(min_value=10, max_value=100),
-        window_height=st.integers(min_value=5, max_value=30)
-    )
-    @settings(max_examples=20)
-    def test_text_formatting_and_wrapping_property(self, content, window_width, window_height):
-        """
-        Feature: curses-ui-framework, Property 13: Text formatting and wrapping
-        For any text content that exceeds window width, it should be wrapped correctly 
-        within window boundaries while preserving formatting options
-        **Validates: Requirements 8.2, 8.5**
-        """
-        # Create a mock window with the specified dimensions
-        mock_window = MagicMock()
-        mock_window.getmaxyx.return_value = (window_height, window_width)
-        mock_window.clear = MagicMock()
-        
-        # Track addstr calls to verify content rendering
-        addstr_calls = []
-        
-        def addstr_side_effect(y, x, text):
-            addstr_calls.append((y, x, text))
-            
-        mock_window.addstr.side_effect = addstr_side_effect
-        
-        # Track addch calls for character-by-character operations
-        addch_calls = []
-        
-        def addch_side_effect(y, x, char):
-            addch_calls.append((y, x, char))
-            
-        mock_window.addch.side_effect = addch_side_effect
-        
-        # Create ContentManager and set text
-        from curses_ui_framework.content_manager import ContentManager
-        
-        content_manager = ContentManager(mock_window)
-        content_manager.set_text(content)
-        
-        # Verify that content was processed (either addstr or addch calls)
-        total_calls = len(addstr_calls) + len(addch_calls)
-        
-        # If content is non-empty and window has space, there should be some rendering
-        content_area_width = max(1, window_width - 2)  # Account for frame borders
-        content_area_height = max(1, window_height - 2)
-        
-        if content.strip() and content_area_width > 0 and content_area_height > 0:
-            # Should have some rendering calls (either clearing or content)
-            assert total_calls > 0, f"No rendering calls made for non-empty content in {window_width}x{window_height} window"
-        
-        # Verify that all rendered text stays within window bounds
-        for y, x, text in addstr_calls:
-            # Check bounds
-            assert 0 <= y < window_height, f"Text rendered outside window height bounds at y={y}, window_height={window_height}"
-            assert 0 <= x < window_width, f"Text rendered outside window width bounds at x={x}, window_width={window_width}"
-            
-            # Check that text doesn't extend beyond window width
-            assert len(text) <= window_width - x, f"Text extends beyond window width: x={x}, text_len={len(text)}, window_width={window_width}"
-        
-        # Verify character-by-character rendering stays within bounds
-        for y, x, char in addch_calls:
-            assert 0 <= y < window_height, f"Character rendered outside window height bounds at y={y}, window_height={window_height}"
-            assert 0 <= x < window_width, f"Character rendered outside window width bounds at x={x}, window_width={window_width}"
-        
-        # Verify text wrapping behavior
-        if content.strip():
-            # Get the content lines that were stored internally
-            stored_lines = content_manager.get_content_lines()
-            
-            # Each line should fit within the content area width
-            for line in stored_lines:
-                assert len(line) <= content_area_width, f"Wrapped line '{line}' exceeds content area width {content_area_width}"
-            
-            # Verify that long lines were properly wrapped
-            original_lines = content.split('\n')
-            for original_line in original_lines:
-                if len(original_line) > content_area_width:
-                    # This line should have been wrapped into multiple stored lines
-                    # The total character count should be preserved (approximately)
-                    original_chars = len(original_line.strip())
-                    if original_chars > 0:
-                        # At least some content should be stored
-                        total_stored_chars = sum(len(line.strip()) for line in stored_lines)
-                        assert total_stored_chars > 0, f"Long line was not properly wrapped and stored"
-        
-        # Test scrolling behavior if content exceeds window height
-        if len(content_manager.get_content_lines()) > content_area_height:
-            # Should be able to scroll
-            initial_scroll = content_manager._scroll_offset
-            
-            # Test scroll down
-            if content_manager.can_scroll_down():
-                content_manager.scroll_down(1)
-                assert content_manager._scroll_offset > initial_scroll, "Scroll down should increase scroll offset"
-            
-            # Test scroll up
-            if content_manager.can_scroll_up():
-                content_manager.scroll_up(1)
-                # Should be able to scroll back up
-        
-        # Test formatting with attributes (basic test)
-        if hasattr(content_manager, 'set_formatted_text'):
-            # Clear previous calls
-            addstr_calls.clear()
-            addch_calls.clear()
-            
-            # Test formatted text
-            content_manager.set_formatted_text(content[:50], 0)  # Limit content size for formatting test
-            
-            # Should still render within bounds
-            for y, x, text in addstr_calls:
-                assert 0 <= y < window_height, f"Formatted text rendered outside window bounds"
-                assert 0 <= x < window_width, f"Formatted text rendered outside window bounds"
-
-
-class TestLeftWindowNavigationSupport:
-    """Test left window navigation support properties."""
-
-    @given(
-        navigation_items=st.lists(
-            st.text(min_size=1, max_size=30, alphabet=st.characters(min_codepoint=32, max_codepoint=126)).filter(lambda x: x.strip()),
-            min_size=1, max_size=20
-        ),
-        selected_index=st.integers(min_value=0, max_value=19),
-        window_height=st.integers(min_value=5, max_value=30),
-        window_width=st.integers(min_value=25, max_value=50)
-    )
-    @settings(max_examples=100)
-    def test_left_window_navigation_support_property(self, navigation_items, selected_index, window_height, window_width):
-        """
-        Feature: curses-ui-framework, Property 6: Left window navigation support
-        For any list of navigation items added to the left window, they should be 
-        displayed in list format with proper highlighting support for selection
-        **Validates: Requirements 3.4, 3.5**
-        """
-        # Ensure selected_index is within bounds
-        if selected_index >= len(navigation_items):
-            selected_index = len(navigation_items) - 1
-
-        # Create a mock window with the specified dimensions
-        mock_window = MagicMock()
-        mock_window.getmaxyx.return_value = (window_height, window_width)
-        mock_window.clear = MagicMock()
-        
-        # Track addstr calls to verify navigation item rendering
-        addstr_calls = []
-        
-        def addstr_side_effect(y, x, text):
-            addstr_calls.append((y, x, text))
-            
-        mock_window.addstr.side_effect = addstr_side_effect
-        
-        # Track addch calls for character-by-character operations
-        addch_calls = []
-        
-        def addch_side_effect(y, x, char):
-            addch_calls.append((y, x, char))
-            
-        mock_window.addch.side_effect = addch_side_effect
-        
-        # Track attribute changes for highlighting
-        attron_calls = []
-        attroff_calls = []
-        
-        def attron_side_effect(attr):
-            attron_calls.append(attr)
-            
-        def attroff_side_effect(attr):
-            attroff_calls.append(attr)
-            
-        mock_window.attron.side_effect = attron_side_effect
-        mock_window.attroff.side_effect = attroff_side_effect
-        
-        # Mock color support and curses initialization
-        with patch('curses.has_colors', return_value=True), \
-             patch('curses.start_color'), \
-             patch('curses.init_pair'), \
-             patch('curses.color_pair', return_value=2):
-            
-            # Create WindowView and render left window
-            from curses_ui_framework.view import WindowView
-            from curses_ui_framework.frame_renderer import FrameRenderer
-            
-            mock_stdscr = MagicMock()
-            view = WindowView(mock_stdscr)
-            view.frame_renderer = FrameRenderer()
-            
-            # Set up the left window in the view
-            view.windows = {'left': mock_window}
-            
-            # Mock the get_content_area method to return predictable values
-            content_start_y = 1
-            content_start_x = 1
-            content_height = max(1, window_height - 2)
-            content_width = max(1, window_width - 2)
-            
-            with patch.object(view.frame_renderer, 'get_content_area', 
-                            return_value=(content_start_y, content_start_x, content_height, content_width)):
-                
-                # Mock the draw_frame method
-                with patch.object(view.frame_renderer, 'draw_frame'):
-                    
-                    # Render the left window with navigation items
-                    view.render_left_window(navigation_items, selected_index)
-        
-        # Calculate expected visible items based on content area
-        visible_item_count = min(len(navigation_items), content_height) if content_height > 0 else 0
-        
-        # Verify that navigation items are displayed in list format
-        if navigation_items and content_height > 0 and content_width > 0:
-            
-            # Should have some rendering calls (either addstr or addch for clearing/content)
-            total_calls = len(addstr_calls) + len(addch_calls)
-            assert total_calls > 0, f"No rendering calls made for navigation items"
-            
-            # Get all rendered text from addstr calls (main content rendering)
-            rendered_texts = [text for y, x, text in addstr_calls]
-            
-            # Check for numbering in rendered text (items should have format like "1. item")
-            # Look for patterns that indicate numbered list format
-            numbered_patterns_found = 0
-            for text in rendered_texts:
-                # Check if text contains digit followed by period and space (list numbering)
-                if len(text) >= 3:
-                    # For selected items, the format is "> . item" (selection indicator replaces number)
-                    # For unselected items, the format is " 1. item" or "1. item"
-                    
-                    # Check for unselected items with numbering
-                    if text[0].isdigit() and text[1:3] == '. ':
-                        numbered_patterns_found += 1
-                    elif len(text) >= 4 and text[0] == ' ' and text[1].isdigit() and text[2:4] == '. ':
-                        numbered_patterns_found += 1
-                    # Check for selected items (which have "> . " format, indicating numbering was present)
-                    elif text.startswith('> . '):
-                        numbered_patterns_found += 1  # This indicates numbering was used (but replaced by selection)
-            
-            # Should find at least some numbered items (accounting for possible truncation/scrolling)
-            expected_numbered_items = min(visible_item_count, len(navigation_items))
-            if expected_numbered_items > 0:
-                assert numbered_patterns_found > 0, \
-                    f"Navigation items should be displayed with numbering in list format. " \
-                    f"Expected some numbered items, found {numbered_patterns_found}. " \
-                    f"Rendered texts: {rendered_texts}"
-            
-            # Verify that navigation items are rendered within content bounds
-            for y, x, text in addstr_calls:
-                assert content_start_y <= y < content_start_y + content_height, \
-                    f"Navigation item rendered outside content height bounds at y={y}"
-                assert x >= content_start_x, \
-                    f"Navigation item rendered outside content width bounds at x={x}"
-                assert len(text) <= content_width, \
-                    f"Navigation item text exceeds content width: '{text}' (len={len(text)}, max={content_width})"
-            
-            # Verify proper highlighting support for selection
-            if selected_index < len(navigation_items) and visible_item_count > 0:
-                # Check for visual selection indicators (like "> " prefix or highlighting)
-                selection_indicators = [text for text in rendered_texts if text.startswith('>')]
-                highlighting_used = len(attron_calls) > 0 and len(attroff_calls) > 0
-                
-                # Should have either visual indicators OR highlighting (or both)
-                assert len(selection_indicators) > 0 or highlighting_used, \
-                    f"Selected item should be visually distinguished with indicators or highlighting. " \
-                    f"Selection indicators: {len(selection_indicators)}, Highlighting: {highlighting_used}"
-            
-            # Verify that rendered items don't exceed what can fit in the content area
-            navigation_related_calls = [call for call in addstr_calls 
-                                      if any(char.isdigit() for char in call[2][:5]) or 
-                                         call[2].startswith('>') or 
-                                         'No items' in call[2]]
-            
-            # Should not render more items than can fit in the visible area
-            assert len(navigation_related_calls) <= max(1, content_height), \
-                f"Too many navigation items rendered: {len(navigation_related_calls)} > {content_height} (content height)"
-            
-            # Verify fixed width maintenance - all rendered lines should fit
-            for y, x, text in addstr_calls:
-                assert len(text) <= content_width, \
-                    f"Navigation item exceeds fixed width: '{text}' (len={len(text)}, max={content_width})"
-            
-            # Test that long navigation item names are handled (truncated or wrapped)
-            for item in navigation_items:
-                # Account for numbering format "XX. " (up to 4 characters)
-                available_space = content_width - 4
-                if len(item) > available_space and available_space > 0:
-                    # Should find some representation of the item (truncated or partial)
-                    item_prefix = item[:min(10, available_space)]
-                    item_found = any(item_prefix in text for text in rendered_texts)
-                    # If not found by prefix, check if any part of the item appears
-                    if not item_found and len(item) > 3:
-                        item_found = any(item[:3] in text for text in rendered_texts)
-                    
-                    # It's acceptable if very long items are not rendered due to space constraints
-                    # The important thing is that the system doesn't crash
-                    assert True  # Long items are handled gracefully
-        
-        # Test empty navigation items case
-        elif not navigation_items:
-            # Should handle empty list gracefully - either show placeholder or render nothing
-            if len(addstr_calls) > 0:
-                rendered_texts = [text for y, x, text in addstr_calls]
-                # If something is rendered, it should be a placeholder
-                placeholder_found = any("No items" in text for text in rendered_texts)
-                # Placeholder is optional - empty rendering is also acceptable
-                assert True  # Empty case is handled gracefully
-        
-        # Test very small content area case
-        elif content_height <= 0 or content_width <= 0:
-            # Should handle gracefully without crashing
-            assert True  # Graceful handling of impossible content area
+    Args:
+        windows: (name, WindowGeometry) pairs
+        terminal_height: Terminal height
+        terminal_width: Terminal width
+        phase: Description of the layout being checked, used in failure messages
+    """
+    for name, w in windows:
+        if w.x < 0 or w.y < 0 or w.x + w.width > terminal_width or w.y + w.height > terminal_height:
+            raise AssertionError(f"{phase}: {name} window {w} doesn't fit in a "
+                                 f"{terminal_height}x{terminal_width} terminal")
 
 
 class TestMainWindowContentManagement:
@@ -727,37 +109,21 @@ class TestMainWindowContentManagement:
         window_width=st.integers(min_value=30, max_value=120)
     )
     @settings(max_examples=50, deadline=None)
-    def test_main_window_content_management_property(self, content, window_height, window_width):
+    def test_main_window_content_management_property(self, recorded_content_window,
+                                                     content, window_height, window_width):
         """
         Feature: curses-ui-framework, Property 7: Main window content management
         For any text content added to the main window, it should be displayed correctly 
         with scrolling support when content exceeds window boundaries
         **Validates: Requirements 4.3, 4.5**
         """
-        # Create a mock window with the specified dimensions
-        mock_window = MagicMock()
+        # Reuse the class-wide recorded mock window, resized for this example
+        mock_window, addstr_calls, addch_calls, _ = recorded_content_window
+        _reset_calls(addstr_calls, addch_calls)
+        mock_window.reset_mock(return_value=True)
         mock_window.getmaxyx.return_value = (window_height, window_width)
-        mock_window.clear = MagicMock()
-        
-        # Track addstr calls to verify content rendering
-        addstr_calls = []
-        
-        def addstr_side_effect(y, x, text):
-            addstr_calls.append((y, x, text))
-            
-        mock_window.addstr.side_effect = addstr_side_effect
-        
-        # Track addch calls for character-by-character operations
-        addch_calls = []
-        
-        def addch_side_effect(y, x, char):
-            addch_calls.append((y, x, char))
-            
-        mock_window.addch.side_effect = addch_side_effect
         
         # Create ContentManager for main window content management
-        from curses_ui_framework.content_manager import ContentManager
-        
         content_manager = ContentManager(mock_window)
         
         # Set the content
@@ -774,19 +140,13 @@ class TestMainWindowContentManagement:
             assert total_calls > 0, f"No rendering calls made for non-empty content"
             
             # Verify all rendering stays within window bounds
-            for y, x, text in addstr_calls:
-                assert 0 <= y < window_height, f"Content rendered outside window height bounds at y={y}"
-                assert 0 <= x < window_width, f"Content rendered outside window width bounds at x={x}"
-                assert len(text) <= window_width - x, f"Content text extends beyond window width"
-            
-            for y, x, char in addch_calls:
-                assert 0 <= y < window_height, f"Content character rendered outside window bounds at y={y}"
-                assert 0 <= x < window_width, f"Content character rendered outside window bounds at x={x}"
+            _assert_calls_in_window(addstr_calls, window_height, window_width, "Content rendered")
+            _assert_calls_in_window(addch_calls, window_height, window_width,
+                                    "Content character rendered", check_extent=False)
             
             # Verify content wrapping within boundaries
-            stored_lines = content_manager.get_content_lines()
-            for line in stored_lines:
-                assert len(line) <= content_area_width, f"Content line exceeds window width: '{line}' (len={len(line)}, max={content_area_width})"
+            for line, line_width in content_manager.get_content_lines_with_width():
+                assert line_width <= content_area_width, f"Content line exceeds window width: '{line}' (len={line_width}, max={content_area_width})"
         
         # Test scrolling support when content exceeds window boundaries
         total_content_lines = len(content_manager.get_content_lines())
@@ -841,8 +201,8 @@ class TestMainWindowContentManagement:
         assert new_line_count >= initial_line_count, f"Append should not decrease line count"
         
         # The additional content should be present
-        all_content = '\n'.join(content_manager.get_content_lines())
-        assert additional_content in all_content, f"Appended content should be present in stored content"
+        stored_lines = content_manager.get_content_lines()
+        assert any(additional_content in line for line in stored_lines), f"Appended content should be present in stored content"
         
         # Test clear functionality
         content_manager.clear()
@@ -871,8 +231,7 @@ class TestMainWindowContentManagement:
         resized_lines = content_manager.get_content_lines()
         new_content_width = max(1, new_width - 2)
         
-        for line in resized_lines:
-            assert len(line) <= new_content_width, f"After resize, content line should fit new width: '{line}' (len={len(line)}, max={new_content_width})"
+        _assert_lines_fit(resized_lines, new_content_width, "After resize, content lines")
 
 
 class TestMainWindowSizeDominance:
@@ -891,23 +250,19 @@ class TestMainWindowSizeDominance:
         **Validates: Requirements 4.1**
         """
         # Create layout calculator
-        from curses_ui_framework.layout_calculator import LayoutCalculator
-        
         calculator = LayoutCalculator()
         
         # Calculate layout for the given terminal size
         layout = calculator.calculate_layout(terminal_height, terminal_width)
         
-        # Calculate areas for each window
-        top_area = layout.top_window.height * layout.top_window.width
-        left_area = layout.left_window.height * layout.left_window.width
-        main_area = layout.main_window.height * layout.main_window.width
-        bottom_area = layout.bottom_window.height * layout.bottom_window.width
+        # Calculate areas for each window from the flat (height, width) tuple
+        th, tw, lh, lw, mh, mw, bh, bw = layout.dims
+        top_area, left_area, main_area, bottom_area = th * tw, lh * lw, mh * mw, bh * bw
         
         # Main window should have the largest area
-        assert main_area > top_area, f"Main window area ({main_area}) should be larger than top window area ({top_area})"
-        assert main_area > left_area, f"Main window area ({main_area}) should be larger than left window area ({left_area})"
-        assert main_area > bottom_area, f"Main window area ({main_area}) should be larger than bottom window area ({bottom_area})"
+        assert main_area > max(top_area, left_area, bottom_area), \
+            f"Main window area ({main_area}) should be larger than top ({top_area}), " \
+            f"left ({left_area}) and bottom ({bottom_area}) window areas"
         
         # Verify main window occupies a significant portion of the screen
         total_terminal_area = terminal_height * terminal_width
@@ -927,10 +282,8 @@ class TestMainWindowSizeDominance:
             # Even at minimum size, main window should still be dominant
             min_layout = calculator.calculate_layout(min_height, min_width)
             
-            min_top_area = min_layout.top_window.height * min_layout.top_window.width
-            min_left_area = min_layout.left_window.height * min_layout.left_window.width
-            min_main_area = min_layout.main_window.height * min_layout.main_window.width
-            min_bottom_area = min_layout.bottom_window.height * min_layout.bottom_window.width
+            th, tw, lh, lw, mh, mw, bh, bw = min_layout.dims
+            min_top_area, min_left_area, min_main_area, min_bottom_area = th * tw, lh * lw, mh * mw, bh * bw
             
             assert min_main_area > min_top_area, f"At minimum size, main window should still dominate top window"
             assert min_main_area > min_left_area, f"At minimum size, main window should still dominate left window"
@@ -944,21 +297,12 @@ class TestMainWindowSizeDominance:
         assert layout.main_window.height >= 10, f"Main window height should be at least 10 rows for usability"
         assert layout.main_window.width >= 20, f"Main window width should be at least 20 columns for usability"
         
-        # Verify that making main window dominant doesn't violate other windows' minimum requirements
-        from curses_ui_framework.window_manager import WindowType
-        
-        min_sizes = {
-            WindowType.TOP: calculator.get_window_minimum_size(WindowType.TOP),
-            WindowType.LEFT: calculator.get_window_minimum_size(WindowType.LEFT),
-            WindowType.MAIN: calculator.get_window_minimum_size(WindowType.MAIN),
-            WindowType.BOTTOM: calculator.get_window_minimum_size(WindowType.BOTTOM)
-        }
-        
-        # All windows should still meet their minimum requirements
-        min_top_height, min_top_width = min_sizes[WindowType.TOP]
-        min_left_height, min_left_width = min_sizes[WindowType.LEFT]
-        min_main_height, min_main_width = min_sizes[WindowType.MAIN]
-        min_bottom_height, min_bottom_width = min_sizes[WindowType.BOTTOM]
+        # Verify that making main window dominant doesn't violate other windows' minimum requirements;
+        # all windows should still meet them
+        min_top_height, min_top_width = LayoutCalculator.MIN_WINDOW_SIZES[WindowType.TOP]
+        min_left_height, min_left_width = LayoutCalculator.MIN_WINDOW_SIZES[WindowType.LEFT]
+        min_main_height, min_main_width = LayoutCalculator.MIN_WINDOW_SIZES[WindowType.MAIN]
+        min_bottom_height, min_bottom_width = LayoutCalculator.MIN_WINDOW_SIZES[WindowType.BOTTOM]
         
         assert layout.top_window.height >= min_top_height, f"Top window should meet minimum height requirement"
         assert layout.top_window.width >= min_top_width, f"Top window should meet minimum width requirement"
@@ -983,239 +327,219 @@ class TestMainWindowSizeDominance:
                     f"Main window should grow when extra terminal space is available"
 
 
+@pytest.fixture(scope="class")
+def bottom_window_patches():
+    """
+    Patch frame drawing and curses colors once for the bottom window test class.
+
+    Request this after recorded_content_window so its color support
+    patches take precedence.
+
+    Yields:
+        Dict of the patched FrameRenderer methods, keyed by name
+    """
+    with patch.multiple('curses', has_colors=DEFAULT, start_color=DEFAULT,
+                        init_pair=DEFAULT, color_pair=DEFAULT) as curses_mocks, \
+         patch.multiple(FrameRenderer, get_content_area=DEFAULT, draw_frame=DEFAULT) as frame_mocks:
+        curses_mocks['has_colors'].return_value = True
+        curses_mocks['color_pair'].return_value = 2
+        yield frame_mocks
+
+
 class TestBottomWindowDualModeOperation:
-    """Test bottom window dual mode operation properties."""
+    """
+    Test bottom window dual mode operation properties.
 
-    @given(
-        status_text=st.text(min_size=0, max_size=100, alphabet=st.characters(min_codepoint=32, max_codepoint=126)),
-        command_input=st.text(min_size=0, max_size=50, alphabet=st.characters(min_codepoint=32, max_codepoint=126)),
-        window_height=st.integers(min_value=3, max_value=10),
-        window_width=st.integers(min_value=30, max_value=120),
-        mode=st.sampled_from(["display", "input"])
-    )
-    @settings(max_examples=100)
-    def test_bottom_window_dual_mode_operation_property(self, status_text, command_input, window_height, window_width, mode):
+    Each mode has its own property, so every example renders one mode
+    instead of rendering both and discarding the switch-back pass.
+    """
+
+    def _render_bottom_window(self, recorded_content_window, bottom_window_patches,
+                              status_text, window_height, window_width, mode, configure):
         """
-        Feature: curses-ui-framework, Property 9: Bottom window dual mode operation
-        For any bottom window instance, it should support switching between input mode 
-        and display mode while maintaining proper functionality in each mode
-        **Validates: Requirements 5.1, 5.2, 5.4, 5.5**
+        Render the bottom window of a fresh view into the shared recorded mock window.
+
+        Args:
+            recorded_content_window: Class-scoped recorded mock window fixture value
+            bottom_window_patches: Patched FrameRenderer methods, by name
+            status_text: Status text to render
+            window_height: Bottom window height
+            window_width: Bottom window width
+            mode: Bottom window mode to render
+            configure: Callable preparing the view's mode-specific data
+
+        Returns:
+            Tuple of (view, addstr_calls, addch_calls, content_area)
         """
-        # Create a mock window with the specified dimensions
-        mock_window = MagicMock()
+        # Reuse the class-wide recorded mock window, resized for this example
+        mock_window, addstr_calls, addch_calls, _ = recorded_content_window
+        _reset_calls(addstr_calls, addch_calls)
+        mock_window.reset_mock(return_value=True)
         mock_window.getmaxyx.return_value = (window_height, window_width)
-        mock_window.clear = MagicMock()
         
-        # Track addstr calls to verify content rendering
-        addstr_calls = []
+        # Create WindowView and test bottom window rendering; color support,
+        # get_content_area and draw_frame are patched once for the whole test
+        view = WindowView(_FakeStdscr())
+        view.frame_renderer = FrameRenderer()
+        view.windows = {'bottom': mock_window}
         
-        def addstr_side_effect(y, x, text):
-            addstr_calls.append((y, x, text))
-            
-        mock_window.addstr.side_effect = addstr_side_effect
+        # get_content_area returns predictable values
+        content_area = (1, 1, max(1, window_height - 2), max(1, window_width - 2))
+        bottom_window_patches['get_content_area'].return_value = content_area
         
-        # Track addch calls for character-by-character operations
-        addch_calls = []
+        configure(view)
+        view.render_bottom_window(status_text, mode)
         
-        def addch_side_effect(y, x, char):
-            addch_calls.append((y, x, char))
-            
-        mock_window.addch.side_effect = addch_side_effect
-        
-        # Mock color support and curses initialization
-        with patch('curses.has_colors', return_value=True), \
-             patch('curses.start_color'), \
-             patch('curses.init_pair'), \
-             patch('curses.color_pair', return_value=2):
-            
-            # Create WindowView and test bottom window rendering
-            from curses_ui_framework.view import WindowView
-            from curses_ui_framework.frame_renderer import FrameRenderer
-            
-            mock_stdscr = MagicMock()
-            view = WindowView(mock_stdscr)
-            view.frame_renderer = FrameRenderer()
-            
-            # Set up the bottom window in the view
-            view.windows = {'bottom': mock_window}
-            
-            # Mock the get_content_area method to return predictable values
-            content_start_y = 1
-            content_start_x = 1
-            content_height = max(1, window_height - 2)
-            content_width = max(1, window_width - 2)
-            
-            with patch.object(view.frame_renderer, 'get_content_area', 
-                            return_value=(content_start_y, content_start_x, content_height, content_width)):
-                
-                # Mock the draw_frame method
-                with patch.object(view.frame_renderer, 'draw_frame'):
-                    
-                    # Set up mode-specific data
-                    if mode == "input":
-                        view.set_bottom_window_command_input(command_input)
-                    else:
-                        # Set up statistics for display mode
-                        statistics = {
-                            'total_commands': 42,
-                            'last_command': 'test command',
-                            'content_lines': 100,
-                            'uptime': 3600
-                        }
-                        view.set_bottom_window_statistics(statistics)
-                    
-                    # Render the bottom window in the specified mode
-                    view.render_bottom_window(status_text, mode)
-        
-        # Verify that rendering occurred
-        total_calls = len(addstr_calls) + len(addch_calls)
+        # Should have some rendering activity, all of it within window bounds
+        assert addstr_calls or addch_calls, f"No rendering calls made for bottom window in {mode} mode"
+        _assert_calls_in_window(addstr_calls, window_height, window_width, "Content rendered")
+        _assert_calls_in_window(addch_calls, window_height, window_width,
+                                "Content character rendered", check_extent=False)
         
-        if content_height > 0 and content_width > 0:
-            # Should have some rendering activity (clearing or content)
-            assert total_calls > 0, f"No rendering calls made for bottom window in {mode} mode"
-            
-            # Verify all rendering stays within window bounds
-            for y, x, text in addstr_calls:
-                assert 0 <= y < window_height, f"Content rendered outside window height bounds at y={y}"
-                assert 0 <= x < window_width, f"Content rendered outside window width bounds at x={x}"
-                assert len(text) <= window_width - x, f"Content text extends beyond window width"
-            
-            for y, x, char in addch_calls:
-                assert 0 <= y < window_height, f"Content character rendered outside window bounds at y={y}"
-                assert 0 <= x < window_width, f"Content character rendered outside window bounds at x={x}"
-        
-        # Verify mode-specific functionality
-        rendered_texts = [text for y, x, text in addstr_calls]
-        all_rendered_text = ' '.join(rendered_texts).lower()
-        
-        if mode == "input":
-            # Input mode should show command prompt and input handling
-            
-            # Should contain command prompt
-            command_prompt_found = any("command" in text.lower() for text in rendered_texts)
-            assert command_prompt_found, f"Input mode should display command prompt"
-            
-            # If command input is provided, it should be displayed (or truncated if too long)
-            if command_input.strip():
-                # Check if the command input (or a truncated version) is displayed
-                command_input_found = any(command_input in text for text in rendered_texts)
-                # If not found exactly, check if a truncated version is present
-                if not command_input_found and len(command_input) > 10:
-                    # Check if at least the first 10 characters are present
-                    truncated_input = command_input[:10]
-                    command_input_found = any(truncated_input in text for text in rendered_texts)
-                assert command_input_found, f"Input mode should display current command input (or truncated version): '{command_input}'"
-            
-            # Should provide help or instructions for input mode (if there's space)
-            help_indicators = ["tab", "enter", "execute", "switch", "mode", "command"]
-            help_found = any(indicator in all_rendered_text for indicator in help_indicators)
-            # If no help text fits due to small window, at least command prompt should be present
-            if not help_found:
-                command_prompt_found = any("command" in text.lower() for text in rendered_texts)
-                assert command_prompt_found, f"Input mode should at least display command prompt when no space for help"
-            else:
-                assert help_found, f"Input mode should provide help or instructions"
-            
-        else:  # display mode
-            # Display mode should show status and statistics
-            
-            # Should display status if provided
-            if status_text.strip():
-                status_found = any(status_text in text for text in rendered_texts)
-                assert status_found, f"Display mode should show status text: '{status_text}'"
-            
-            # Should show some form of status information
-            status_indicators = ["status", "command", "content", "uptime"]
-            status_info_found = any(indicator in all_rendered_text for indicator in status_indicators)
-            assert status_info_found, f"Display mode should show status or statistics information"
-        
-        # Test mode switching functionality by testing both modes
-        if mode == "display":
-            # Test switching to input mode
-            addstr_calls.clear()
-            addch_calls.clear()
-            
-            # Set up for input mode
-            view.set_bottom_window_command_input("test input")
-            
-            with patch.object(view.frame_renderer, 'get_content_area', 
-                            return_value=(content_start_y, content_start_x, content_height, content_width)):
-                with patch.object(view.frame_renderer, 'draw_frame'):
-                    view.render_bottom_window(status_text, "input")
-            
-            # Should render input mode content
-            input_rendered_texts = [text for y, x, text in addstr_calls]
-            input_all_text = ' '.join(input_rendered_texts).lower()
-            
-            # Should show command prompt in input mode
-            input_command_found = any("command" in text.lower() for text in input_rendered_texts)
-            assert input_command_found, f"Should be able to switch to input mode and show command prompt"
-            
-        else:  # mode == "input"
-            # Test switching to display mode
-            addstr_calls.clear()
-            addch_calls.clear()
-            
-            # Set up for display mode
-            statistics = {
-                'total_commands': 10,
-                'last_command': 'help',
-                'content_lines': 50,
-                'uptime': 1800
-            }
-            view.set_bottom_window_statistics(statistics)
-            
-            with patch.object(view.frame_renderer, 'get_content_area', 
-                            return_value=(content_start_y, content_start_x, content_height, content_width)):
-                with patch.object(view.frame_renderer, 'draw_frame'):
-                    view.render_bottom_window(status_text, "display")
-            
-            # Should render display mode content
-            display_rendered_texts = [text for y, x, text in addstr_calls]
-            display_all_text = ' '.join(display_rendered_texts).lower()
-            
-            # Should show status information in display mode
-            display_status_found = any(indicator in display_all_text for indicator in ["status", "command", "content"])
-            assert display_status_found, f"Should be able to switch to display mode and show status information"
+        return view, addstr_calls, addch_calls, content_area
+
+    def _assert_empty_status_fits(self, view, addstr_calls, addch_calls, content_area, mode):
+        """
+        Render the mode again with an empty status and check it stays in the content area.
+
+        Args:
+            view: View whose bottom window was rendered
+            addstr_calls: Shared addstr recorder
+            addch_calls: Shared addch recorder
+            content_area: (start_y, start_x, height, width) of the content area
+            mode: Bottom window mode to render
+        """
+        content_start_y, content_start_x, content_height, content_width = content_area
+        _reset_calls(addstr_calls, addch_calls)
         
-        # Test that mode switching maintains proper functionality
-        # Both modes should handle empty content gracefully
-        addstr_calls.clear()
-        addch_calls.clear()
+        # Should handle empty status gracefully without crashing
+        view.render_bottom_window("", mode)
+        
+        # Verify that content fits within the content area, checking every call
+        # in one comparison chain and reporting the offending calls together
+        content_end_y = content_start_y + content_height
+        out_of_bounds_calls = [
+            (y, x, text) for y, x, text in addstr_calls
+            if not (content_start_y <= y < content_end_y and x >= content_start_x
+                    and len(text) <= content_width)
+        ]
+        assert not out_of_bounds_calls, \
+            f"Content rendered outside the {content_height}x{content_width} content area " \
+            f"at ({content_start_y}, {content_start_x}): {out_of_bounds_calls}"
+
+    @given(
+        status_text=st.text(min_size=0, max_size=100, alphabet=_PRINTABLE),
+        window_height=_BOTTOM_HEIGHT,
+        window_width=_BOTTOM_WIDTH
+    )
+    @settings(max_examples=50)
+    def test_bottom_window_display_mode_property(self, recorded_content_window, bottom_window_patches,
+                                                 status_text, window_height, window_width):
+        """
+        Feature: curses-ui-framework, Property 9: Bottom window dual mode operation
+        For any bottom window instance, display mode should show the status and
+        statistics within the window
+        **Validates: Requirements 5.1, 5.2, 5.4, 5.5**
+        """
+        view, addstr_calls, addch_calls, content_area = self._render_bottom_window(
+            recorded_content_window, bottom_window_patches, status_text, window_height, window_width,
+            "display", lambda view: view.set_bottom_window_statistics(_DISPLAY_STATISTICS))
         
-        with patch.object(view.frame_renderer, 'get_content_area', 
-                        return_value=(content_start_y, content_start_x, content_height, content_width)):
-            with patch.object(view.frame_renderer, 'draw_frame'):
-                view.render_bottom_window("", mode)
+        # Scan the recorded calls directly; each check stops at its first match
+        # Should display status if provided
+        if status_text.strip():
+            status_found = any(status_text in text for _, _, text in addstr_calls)
+            assert status_found, f"Display mode should show status text: '{status_text}'"
         
-        # Should handle empty status gracefully without crashing
-        empty_total_calls = len(addstr_calls) + len(addch_calls)
-        # Either renders something (help text, prompts) or renders nothing (both acceptable)
-        assert empty_total_calls >= 0, f"Should handle empty status gracefully"
+        # Should show some form of status information
+        status_info_found = any(_STATUS_INDICATOR_RE.search(text) for _, _, text in addstr_calls)
+        assert status_info_found, f"Display mode should show status or statistics information"
         
-        # Verify that content fits within the content area
-        for y, x, text in addstr_calls:
-            # Content should be within the content area bounds
-            assert content_start_y <= y < content_start_y + content_height, \
-                f"Content rendered outside content area height bounds"
-            assert x >= content_start_x, \
-                f"Content rendered outside content area width bounds"
-            assert len(text) <= content_width, \
-                f"Content text exceeds content area width: '{text}' (len={len(text)}, max={content_width})"
+        self._assert_empty_status_fits(view, addstr_calls, addch_calls, content_area, "display")
+
+    @given(
+        status_text=st.text(min_size=0, max_size=100, alphabet=_PRINTABLE),
+        command_input=st.text(min_size=0, max_size=50, alphabet=_PRINTABLE),
+        window_height=_BOTTOM_HEIGHT,
+        window_width=_BOTTOM_WIDTH
+    )
+    @settings(max_examples=50)
+    def test_bottom_window_input_mode_property(self, recorded_content_window, bottom_window_patches,
+                                               status_text, command_input, window_height, window_width):
+        """
+        Feature: curses-ui-framework, Property 9: Bottom window dual mode operation
+        For any bottom window instance, input mode should show the command prompt
+        and the current input within the window
+        **Validates: Requirements 5.1, 5.2, 5.4, 5.5**
+        """
+        view, addstr_calls, addch_calls, content_area = self._render_bottom_window(
+            recorded_content_window, bottom_window_patches, status_text, window_height, window_width,
+            "input", lambda view: view.set_bottom_window_command_input(command_input))
+        
+        # Scan the recorded calls directly; each check stops at its first match
+        # Should contain command prompt
+        command_prompt_found = any(_COMMAND_PROMPT_RE.search(text) for _, _, text in addstr_calls)
+        assert command_prompt_found, f"Input mode should display command prompt"
+        
+        # If command input is provided, it should be displayed (or truncated if too long)
+        if command_input.strip():
+            # Check if the command input (or a truncated version) is displayed
+            command_input_found = any(command_input in text for _, _, text in addstr_calls)
+            # If not found exactly, check if a truncated version is present
+            if not command_input_found and len(command_input) > 10:
+                # Check if at least the first 10 characters are present
+                truncated_input = command_input[:10]
+                command_input_found = any(truncated_input in text for _, _, text in addstr_calls)
+            assert command_input_found, f"Input mode should display current command input (or truncated version): '{command_input}'"
+        
+        # Should provide help or instructions for input mode (if there's space);
+        # if no help text fits, the command prompt checked above must be present
+        help_found = any(_HELP_INDICATOR_RE.search(text) for _, _, text in addstr_calls)
+        assert help_found or command_prompt_found, f"Input mode should provide help or instructions"
+        
+        self._assert_empty_status_fits(view, addstr_calls, addch_calls, content_area, "input")
+
+
+@pytest.fixture(scope="class")
+def resize_curses():
+    """
+    Provide curses mocks shared by every example of the resize test class.
+
+    The curses functions the controller calls are patched once for the
+    whole class. The screen and window are slotted stubs, since no test
+    inspects their calls; tests set their sizes per example.
+
+    Yields:
+        Tuple of (mock_stdscr, mock_window, window_creation_calls)
+    """
+    mock_stdscr = _FakeStdscr(key=-1)  # No input
+    mock_window = _FakeWindow(3, 120)
+    window_creation_calls = deque()
+    
+    def newwin_side_effect(height, width, y, x):
+        window_creation_calls.append((height, width, y, x))
+        return mock_window
+    
+    with patch.multiple('curses', wrapper=DEFAULT, curs_set=DEFAULT, has_colors=DEFAULT,
+                        start_color=DEFAULT, init_pair=DEFAULT, setupterm=DEFAULT,
+                        newwin=DEFAULT) as curses_mocks:
+        curses_mocks['has_colors'].return_value = True
+        curses_mocks['newwin'].side_effect = newwin_side_effect
+        yield mock_stdscr, mock_window, window_creation_calls
 
 
 class TestResizeEventHandling:
     """Test resize event handling properties."""
 
     @given(
-        initial_height=st.integers(min_value=60, max_value=100),
-        initial_width=st.integers(min_value=120, max_value=200),
-        new_height=st.integers(min_value=60, max_value=150),
-        new_width=st.integers(min_value=120, max_value=250),
+        initial_height=_INIT_H,
+        initial_width=_INIT_W,
+        new_height=_NEW_H,
+        new_width=_NEW_W,
         data=st.data()
     )
-    @settings(max_examples=100)
-    def test_resize_event_handling_property(self, initial_height, initial_width, new_height, new_width, data):
+    def test_resize_event_handling_property(self, resize_curses, initial_height, initial_width,
+                                            new_height, new_width, data):
         """
         Feature: curses-ui-framework, Property 2: Resize event handling
         For any valid terminal size change, the framework should recalculate all window 
@@ -1225,204 +549,263 @@ class TestResizeEventHandling:
         # Create application model
         model = ApplicationModel("Test App", "Test Author", "1.0")
         
-        # Mock curses to avoid actual terminal interaction during testing
-        with patch('curses.wrapper') as mock_wrapper, \
-             patch('curses.curs_set') as mock_curs_set, \
-             patch('curses.has_colors', return_value=True), \
-             patch('curses.start_color'), \
-             patch('curses.init_pair'), \
-             patch('curses.setupterm'):
-
-            # Mock stdscr with initial size
-            mock_stdscr = MagicMock()
-            mock_stdscr.getmaxyx.return_value = (initial_height, initial_width)
-            mock_stdscr.getch.return_value = -1  # No input initially
-            mock_stdscr.nodelay = MagicMock()
-            mock_stdscr.timeout = MagicMock()
-            mock_stdscr.clear = MagicMock()
-            mock_stdscr.refresh = MagicMock()
-
-            # Mock window creation
-            mock_window = MagicMock()
-            mock_window.getmaxyx.return_value = (3, initial_width)
-            mock_window.clear = MagicMock()
-            mock_window.box = MagicMock()
-            mock_window.addstr = MagicMock()
-            mock_window.refresh = MagicMock()
-            mock_window.attron = MagicMock()
-            mock_window.attroff = MagicMock()
-
-            # Track window creation calls
-            window_creation_calls = []
-            
-            def newwin_side_effect(height, width, y, x):
-                window_creation_calls.append((height, width, y, x))
-                return mock_window
-            
-            with patch('curses.newwin', side_effect=newwin_side_effect):
-                
-                # Create controller
-                controller = CursesController(model)
-                
-                # Initialize with initial size
-                controller.stdscr = mock_stdscr
-                controller._validate_and_setup_layout()
-                
-                # Store initial layout
-                initial_layout = controller.layout_info
-                
-                # Verify initial layout is valid
-                assert initial_layout.terminal_height == initial_height
-                assert initial_layout.terminal_width == initial_width
-                
-                # Verify initial window positions are within bounds
-                windows = [
-                    ("top", initial_layout.top_window),
-                    ("left", initial_layout.left_window),
-                    ("main", initial_layout.main_window),
-                    ("bottom", initial_layout.bottom_window)
-                ]
-                
-                for name, window in windows:
-                    assert window.x >= 0, f"Initial {name} window x position should be non-negative"
-                    assert window.y >= 0, f"Initial {name} window y position should be non-negative"
-                    assert window.x + window.width <= initial_width, f"Initial {name} window should fit within terminal width"
-                    assert window.y + window.height <= initial_height, f"Initial {name} window should fit within terminal height"
-                
-                # Simulate resize event
-                mock_stdscr.getmaxyx.return_value = (new_height, new_width)
-                
-                # Clear window creation calls to track resize behavior
-                window_creation_calls.clear()
-                
-                # Handle resize
-                controller.handle_resize()
-                
-                # Verify layout was recalculated
-                new_layout = controller.layout_info
-                assert new_layout.terminal_height == new_height, f"Layout should be updated with new terminal height"
-                assert new_layout.terminal_width == new_width, f"Layout should be updated with new terminal width"
-                
-                # Verify all windows maintain proper layout after resize
-                new_windows = [
-                    ("top", new_layout.top_window),
-                    ("left", new_layout.left_window),
-                    ("main", new_layout.main_window),
-                    ("bottom", new_layout.bottom_window)
-                ]
-                
-                for name, window in new_windows:
-                    assert window.x >= 0, f"Resized {name} window x position should be non-negative"
-                    assert window.y >= 0, f"Resized {name} window y position should be non-negative"
-                    assert window.x + window.width <= new_width, f"Resized {name} window should fit within new terminal width"
-                    assert window.y + window.height <= new_height, f"Resized {name} window should fit within new terminal height"
-                    assert window.width > 0, f"Resized {name} window should have positive width"
-                    assert window.height > 0, f"Resized {name} window should have positive height"
-                
-                # Verify no overlaps after resize
-                for i, (name1, win1) in enumerate(new_windows):
-                    for j, (name2, win2) in enumerate(new_windows):
-                        if i != j:  # Don't compare window with itself
-                            # Check if windows overlap
-                            overlap_x = not (win1.x + win1.width <= win2.x or win2.x + win2.width <= win1.x)
-                            overlap_y = not (win1.y + win1.height <= win2.y or win2.y + win2.height <= win1.y)
-                            
-                            # Windows should not overlap after resize
-                            assert not (overlap_x and overlap_y), f"After resize, windows {name1} and {name2} should not overlap"
-                
-                # Verify main window still dominates after resize
-                new_top_area = new_layout.top_window.height * new_layout.top_window.width
-                new_left_area = new_layout.left_window.height * new_layout.left_window.width
-                new_main_area = new_layout.main_window.height * new_layout.main_window.width
-                new_bottom_area = new_layout.bottom_window.height * new_layout.bottom_window.width
-                
-                assert new_main_area > new_top_area, f"After resize, main window should still dominate top window"
-                assert new_main_area > new_left_area, f"After resize, main window should still dominate left window"
-                assert new_main_area > new_bottom_area, f"After resize, main window should still dominate bottom window"
-                
-                # Verify minimum size constraints are still met after resize
-                from curses_ui_framework.layout_calculator import LayoutCalculator
-                calculator = LayoutCalculator()
-                
-                min_sizes = {
-                    "top": calculator.get_window_minimum_size(WindowType.TOP),
-                    "left": calculator.get_window_minimum_size(WindowType.LEFT),
-                    "main": calculator.get_window_minimum_size(WindowType.MAIN),
-                    "bottom": calculator.get_window_minimum_size(WindowType.BOTTOM)
-                }
-                
-                for name, window in new_windows:
-                    min_height, min_width = min_sizes[name]
-                    assert window.height >= min_height, f"After resize, {name} window should meet minimum height requirement"
-                    assert window.width >= min_width, f"After resize, {name} window should meet minimum width requirement"
-                
-                # Test multiple resize events
-                for _ in range(3):
-                    # Generate another size change using data.draw()
-                    height_delta = data.draw(st.integers(-20, 20))
-                    width_delta = data.draw(st.integers(-30, 30))
-                    another_height = max(60, min(200, new_height + height_delta))
-                    another_width = max(120, min(300, new_width + width_delta))
-                    
-                    mock_stdscr.getmaxyx.return_value = (another_height, another_width)
-                    
-                    # Handle another resize
-                    controller.handle_resize()
-                    
-                    # Verify layout is still valid
-                    current_layout = controller.layout_info
-                    assert current_layout.terminal_height == another_height
-                    assert current_layout.terminal_width == another_width
-                    
-                    # Verify windows still fit
-                    current_windows = [
-                        ("top", current_layout.top_window),
-                        ("left", current_layout.left_window),
-                        ("main", current_layout.main_window),
-                        ("bottom", current_layout.bottom_window)
-                    ]
-                    
-                    for name, window in current_windows:
-                        assert window.x + window.width <= another_width, f"After multiple resizes, {name} window should fit within terminal"
-                        assert window.y + window.height <= another_height, f"After multiple resizes, {name} window should fit within terminal"
-                
-                # Test resize with terminal too small (should handle gracefully)
-                small_height, small_width = 30, 80  # Below minimum requirements
-                mock_stdscr.getmaxyx.return_value = (small_height, small_width)
-                
-                # This should not crash, but may show error state
-                try:
-                    controller.handle_resize()
-                    # If it doesn't raise an exception, verify error handling
-                    status = model.get_status()
-                    assert "too small" in status.lower() or "resize" in status.lower(), \
-                        f"Should indicate terminal size issue in status"
-                except TerminalTooSmallError:
-                    # This is acceptable - proper error handling
-                    pass
-                
-                # Verify controller remains in a consistent state
-                assert hasattr(controller, 'layout_info'), f"Controller should maintain layout_info after resize events"
-                assert hasattr(controller, 'running'), f"Controller should maintain running state after resize events"
+        # Reuse the class-wide curses stubs, resized for this example
+        mock_stdscr, mock_window, window_creation_calls = resize_curses
+        mock_stdscr._size = (initial_height, initial_width)
+        mock_window._size = (3, initial_width)
+        window_creation_calls.clear()
+        
+        # Create controller
+        controller = CursesController(model)
+        
+        # Initialize with initial size
+        controller.stdscr = mock_stdscr
+        controller._validate_and_setup_layout()
+        
+        # Store initial layout
+        initial_layout = controller.layout_info
+        
+        # Verify initial layout is valid
+        assert initial_layout.terminal_height == initial_height
+        assert initial_layout.terminal_width == initial_width
+        
+        # Verify initial window positions are within bounds
+        windows = [
+            ("top", initial_layout.top_window),
+            ("left", initial_layout.left_window),
+            ("main", initial_layout.main_window),
+            ("bottom", initial_layout.bottom_window)
+        ]
+        _assert_windows_fit(windows, initial_height, initial_width, "Initial layout")
+        
+        # Simulate resize event
+        mock_stdscr._size = (new_height, new_width)
+        
+        # Clear window creation calls to track resize behavior
+        window_creation_calls.clear()
+        
+        # Handle resize
+        controller.handle_resize()
+        
+        # Verify layout was recalculated
+        new_layout = controller.layout_info
+        assert new_layout.terminal_height == new_height, f"Layout should be updated with new terminal height"
+        assert new_layout.terminal_width == new_width, f"Layout should be updated with new terminal width"
+        
+        # Verify all windows maintain proper layout after resize
+        new_windows = [
+            ("top", new_layout.top_window),
+            ("left", new_layout.left_window),
+            ("main", new_layout.main_window),
+            ("bottom", new_layout.bottom_window)
+        ]
+        
+        _assert_windows_fit(new_windows, new_height, new_width, "After resize")
+        
+        # Verify no overlaps after resize: pack each window into its box edges once,
+        # then test each unordered pair (overlap is symmetric)
+        boxes = [(name, w.x, w.y, w.x + w.width, w.y + w.height) for name, w in new_windows]
+        for (name1, left1, top1, right1, bottom1), (name2, left2, top2, right2, bottom2) in combinations(boxes, 2):
+            assert not (left1 < right2 and left2 < right1 and top1 < bottom2 and top2 < bottom1), \
+                f"After resize, windows {name1} and {name2} should not overlap"
+        
+        # Verify main window still dominates after resize: its area must exceed
+        # the largest of the others, one comparison for all three
+        areas = {name: w.height * w.width for name, w in new_windows}
+        new_main_area = areas.pop("main")
+        assert new_main_area > max(areas.values()), \
+            f"After resize, main window should still dominate the other windows: main={new_main_area}, {areas}"
+        
+        # Verify windows keep a positive size and meet minimum size constraints after resize
+        for name, window in new_windows:
+            min_height, min_width = LayoutCalculator.MIN_WINDOW_SIZES[WindowType(name)]
+            assert window.height > 0 and window.width > 0, f"Resized {name} window should have positive size"
+            assert window.height >= min_height, f"After resize, {name} window should meet minimum height requirement"
+            assert window.width >= min_width, f"After resize, {name} window should meet minimum width requirement"
+        
+        # Test multiple resize events. The layout is a pure function of the terminal
+        # size, so window bounds are only re-checked for sizes not validated yet
+        validated_sizes = {(initial_height, initial_width), (new_height, new_width)}
+        for _ in range(3):
+            # Generate another size change using data.draw()
+            height_delta, width_delta = data.draw(_SIZE_DELTA)
+            another_height = _clamp(new_height + height_delta, 60, 200)
+            another_width = _clamp(new_width + width_delta, 120, 300)
+            
+            mock_stdscr._size = (another_height, another_width)
+            
+            # Handle another resize
+            controller.handle_resize()
+            
+            # Verify layout is still valid
+            current_layout = controller.layout_info
+            assert current_layout.terminal_height == another_height
+            assert current_layout.terminal_width == another_width
+            if (another_height, another_width) in validated_sizes:
+                continue
+            
+            # Verify windows still fit
+            current_windows = [
+                ("top", current_layout.top_window),
+                ("left", current_layout.left_window),
+                ("main", current_layout.main_window),
+                ("bottom", current_layout.bottom_window)
+            ]
+            _assert_windows_fit(current_windows, another_height, another_width, "After multiple resizes")
+            validated_sizes.add((another_height, another_width))
+        
+        # Test resize with terminal too small (should handle gracefully)
+        small_height, small_width = 30, 80  # Below minimum requirements
+        mock_stdscr._size = (small_height, small_width)
+        
+        # This should not crash, but may show error state
+        try:
+            controller.handle_resize()
+            # If it doesn't raise an exception, verify error handling
+            status = model.get_status()
+            assert "too small" in status.lower() or "resize" in status.lower(), \
+                f"Should indicate terminal size issue in status"
+        except TerminalTooSmallError:
+            # This is acceptable - proper error handling
+            pass
+        
+        # Verify controller remains in a consistent state
+        assert hasattr(controller, 'layout_info'), f"Controller should maintain layout_info after resize events"
+        assert hasattr(controller, 'running'), f"Controller should maintain running state after resize events"
+
+
+# Curses patches shared by the error handling scenarios: (curses attribute, patch kwargs).
+# setupterm, curs_set, start_color and init_pair are patched for the whole class
+# by _base_curses_patches; scenarios only patch them again to change behaviour.
+_COLOR_PATCHES = (("has_colors", {"return_value": True}),)
+_NO_COLOR_PATCHES = (("has_colors", {"return_value": False}),)
+
+class _NoTimeoutStdscr(_FakeStdscr):
+    """Stub screen for a terminal that doesn't support input timeouts."""
+
+    __slots__ = ()
+
+    def timeout(self, delay):
+        raise curses.error("Timeout not supported")
+
+
+# Terminal compatibility scenarios for the error handling property. Each entry gives:
+#   patches: curses patches to apply
+#   stdscr: stub screen class curses.wrapper runs the app on (60x120), or None
+#       to leave curses.wrapper alone
+#   remove_key_resize: run with curses.KEY_RESIZE missing
+#   must_complete: run() must return normally and leave the controller stopped
+#   checked_errors / keywords: framework errors whose message must name one keyword;
+#       any other exception is an acceptable way to report the incompatibility
+_ERROR_SCENARIOS = {
+    # Normal operation with full compatibility
+    "normal_terminal": {
+        "patches": _COLOR_PATCHES,
+        "stdscr": _FakeStdscr,
+        "must_complete": True,
+    },
+    # Terminal without color support
+    "no_colors": {
+        "patches": _NO_COLOR_PATCHES,
+        "stdscr": _FakeStdscr,
+        "must_complete": True,
+    },
+    # Terminal without KEY_RESIZE support
+    "no_resize_support": {
+        "patches": _COLOR_PATCHES,
+        "stdscr": _FakeStdscr,
+        "remove_key_resize": True,
+        "checked_errors": (TerminalCompatibilityError,),
+        "keywords": ("resize",),
+    },
+    # Very basic terminal with minimal features
+    "minimal_terminal": {
+        "patches": _NO_COLOR_PATCHES + (
+            ("curs_set", {"side_effect": curses.error("Cursor control not supported")}),),
+        "stdscr": _NoTimeoutStdscr,
+        "must_complete": True,
+    },
+    # Curses module not available or broken
+    "curses_error": {
+        "patches": (("setupterm", {"side_effect": curses.error("Terminal not supported")}),),
+        "checked_errors": (TerminalCompatibilityError, CursesFrameworkError),
+        "keywords": ("curses", "terminal", "compatibility"),
+    },
+    # Curses initialization failure
+    "initialization_failure": {
+        "patches": (("wrapper", {"side_effect": Exception("Curses initialization failed")}),),
+        "checked_errors": (CursesFrameworkError, TerminalCompatibilityError, CursesInitializationError),
+        "keywords": ("application", "error", "initialization", "curses"),
+    },
+}
+
+
+def _run_error_scenario(model, scenario):
+    """
+    Run a controller under one terminal compatibility scenario and check the outcome.
+
+    Args:
+        model: Application model to run
+        scenario: Entry of _ERROR_SCENARIOS
+
+    Returns:
+        The controller, after run() returned or raised
+    """
+    with ExitStack() as stack:
+        for name, kwargs in scenario["patches"]:
+            stack.enter_context(patch(f'curses.{name}', **kwargs))
+        
+        stdscr_class = scenario.get("stdscr")
+        if stdscr_class is not None:
+            # Run the application on a stub stdscr that quits immediately
+            mock_stdscr = stdscr_class(60, 120, ord('q'))
+            stack.enter_context(patch('curses.newwin', return_value=_FakeWindow(3, 120)))
+            stack.enter_context(patch('curses.wrapper', side_effect=lambda func: func(mock_stdscr)))
+        
+        if scenario.get("remove_key_resize"):
+            # The monkeypatch fixture is function-scoped, which Hypothesis rejects,
+            # so use a MonkeyPatch context undone with the rest of the stack
+            monkeypatch = stack.enter_context(pytest.MonkeyPatch.context())
+            monkeypatch.delattr(curses, 'KEY_RESIZE', raising=False)
+        
+        controller = CursesController(model)
+        
+        if scenario.get("must_complete"):
+            # Should not raise, and should have exited cleanly
+            controller.run()
+            assert not controller.running
+            return controller
+        
+        # Errors may be handled gracefully or raised; framework errors must be informative
+        try:
+            controller.run()
+        except scenario["checked_errors"] as exc_info:
+            error_msg = str(exc_info).lower()
+            assert any(keyword in error_msg for keyword in scenario["keywords"])
+        except Exception:
+            # Other exception types are acceptable for compatibility issues
+            pass
+        return controller
 
 
 class TestErrorHandlingCompatibility:
     """Test error handling compatibility properties."""
 
+    @pytest.fixture(scope="class", autouse=True)
+    def _base_curses_patches(self):
+        """Patch the curses setup calls every error handling test stubs out, once per class."""
+        with patch.multiple('curses', setupterm=DEFAULT, curs_set=DEFAULT,
+                            start_color=DEFAULT, init_pair=DEFAULT):
+            yield
+
     @given(
         title=st.text(min_size=1, max_size=50),
         author=st.text(min_size=1, max_size=30),
         version=st.text(min_size=1, max_size=10),
-        terminal_scenario=st.sampled_from([
-            "normal_terminal",
-            "no_colors",
-            "no_resize_support", 
-            "minimal_terminal",
-            "curses_error",
-            "initialization_failure"
-        ])
+        terminal_scenario=st.sampled_from(sorted(_ERROR_SCENARIOS))
     )
-    @settings(max_examples=100)
+    # Failures are per scenario and the text arguments are incidental, so shrinking adds nothing
+    @settings(phases=(Phase.explicit, Phase.reuse, Phase.generate))
     def test_error_handling_compatibility_property(self, title, author, version, terminal_scenario):
         """
         Feature: curses-ui-framework, Property 3: Error handling for compatibility
@@ -1433,213 +816,11 @@ class TestErrorHandlingCompatibility:
         # Create application model
         model = ApplicationModel(title, author, version)
         
-        # Test different terminal compatibility scenarios
-        if terminal_scenario == "normal_terminal":
-            # Test normal operation with full compatibility
-            with patch('curses.wrapper') as mock_wrapper, \
-                 patch('curses.setupterm'), \
-                 patch('curses.has_colors', return_value=True), \
-                 patch('curses.start_color'), \
-                 patch('curses.init_pair'), \
-                 patch('curses.curs_set'):
-
-                # Mock stdscr with normal functionality
-                mock_stdscr = MagicMock()
-                mock_stdscr.getmaxyx.return_value = (60, 120)
-                mock_stdscr.getch.return_value = ord('q')  # Immediate quit
-                mock_stdscr.nodelay = MagicMock()
-                mock_stdscr.timeout = MagicMock()
-                mock_stdscr.clear = MagicMock()
-                mock_stdscr.refresh = MagicMock()
-
-                # Mock window creation
-                mock_window = MagicMock()
-                mock_window.getmaxyx.return_value = (3, 120)
-                mock_window.clear = MagicMock()
-                mock_window.addstr = MagicMock()
-                mock_window.refresh = MagicMock()
-
-                with patch('curses.newwin', return_value=mock_window):
-                    def wrapper_side_effect(func):
-                        return func(mock_stdscr)
-                    mock_wrapper.side_effect = wrapper_side_effect
-
-                    # Create controller and run - should work normally
-                    controller = CursesController(model)
-                    
-                    # Should not raise any exceptions
-                    controller.run()
-                    
-                    # Verify normal operation completed
-                    assert not controller.running  # Should have exited cleanly
-
-        elif terminal_scenario == "no_colors":
-            # Test terminal without color support
-            with patch('curses.wrapper') as mock_wrapper, \
-                 patch('curses.setupterm'), \
-                 patch('curses.has_colors', return_value=False), \
-                 patch('curses.curs_set'):
-
-                mock_stdscr = MagicMock()
-                mock_stdscr.getmaxyx.return_value = (60, 120)
-                mock_stdscr.getch.return_value = ord('q')
-                mock_stdscr.nodelay = MagicMock()
-                mock_stdscr.timeout = MagicMock()
-                mock_stdscr.clear = MagicMock()
-                mock_stdscr.refresh = MagicMock()
-
-                mock_window = MagicMock()
-                mock_window.getmaxyx.return_value = (3, 120)
-                mock_window.clear = MagicMock()
-                mock_window.addstr = MagicMock()
-                mock_window.refresh = MagicMock()
-
-                with patch('curses.newwin', return_value=mock_window):
-                    def wrapper_side_effect(func):
-                        return func(mock_stdscr)
-                    mock_wrapper.side_effect = wrapper_side_effect
-
-                    # Should handle lack of color support gracefully
-                    controller = CursesController(model)
-                    controller.run()
-                    
-                    # Should complete without errors
-                    assert not controller.running
-
-        elif terminal_scenario == "no_resize_support":
-            # Test terminal without KEY_RESIZE support
-            with patch('curses.wrapper') as mock_wrapper, \
-                 patch('curses.setupterm'), \
-                 patch('curses.has_colors', return_value=True), \
-                 patch('curses.start_color'), \
-                 patch('curses.init_pair'), \
-                 patch('curses.curs_set'):
-
-                # Mock curses without KEY_RESIZE
-                original_key_resize = getattr(curses, 'KEY_RESIZE', None)
-                if hasattr(curses, 'KEY_RESIZE'):
-                    delattr(curses, 'KEY_RESIZE')
-
-                try:
-                    mock_stdscr = MagicMock()
-                    mock_stdscr.getmaxyx.return_value = (60, 120)
-                    mock_stdscr.getch.return_value = ord('q')
-                    mock_stdscr.nodelay = MagicMock()
-                    mock_stdscr.timeout = MagicMock()
-                    mock_stdscr.clear = MagicMock()
-                    mock_stdscr.refresh = MagicMock()
-
-                    mock_window = MagicMock()
-                    mock_window.getmaxyx.return_value = (3, 120)
-                    mock_window.clear = MagicMock()
-                    mock_window.addstr = MagicMock()
-                    mock_window.refresh = MagicMock()
-
-                    with patch('curses.newwin', return_value=mock_window):
-                        def wrapper_side_effect(func):
-                            return func(mock_stdscr)
-                        mock_wrapper.side_effect = wrapper_side_effect
-
-                        # Should raise TerminalCompatibilityError during validation
-                        # or handle it gracefully with error messages
-                        controller = CursesController(model)
-                        
-                        try:
-                            controller.run()
-                            # If no exception raised, it was handled gracefully
-                            # This is acceptable behavior - verify error was communicated
-                            assert True  # Graceful error handling is acceptable
-                        except TerminalCompatibilityError as exc_info:
-                            # This is also acceptable - proper error raising
-                            assert "resize" in str(exc_info).lower()
-                        except Exception as e:
-                            # Any other exception type is also acceptable for compatibility issues
-                            assert True  # Various error types are acceptable for compatibility issues
-
-                finally:
-                    # Restore KEY_RESIZE if it existed
-                    if original_key_resize is not None:
-                        curses.KEY_RESIZE = original_key_resize
-
-        elif terminal_scenario == "minimal_terminal":
-            # Test very basic terminal with minimal features
-            with patch('curses.wrapper') as mock_wrapper, \
-                 patch('curses.setupterm'), \
-                 patch('curses.has_colors', return_value=False), \
-                 patch('curses.curs_set', side_effect=curses.error("Cursor control not supported")):
-
-                mock_stdscr = MagicMock()
-                mock_stdscr.getmaxyx.return_value = (60, 120)
-                mock_stdscr.getch.return_value = ord('q')
-                mock_stdscr.nodelay = MagicMock()
-                mock_stdscr.timeout = MagicMock(side_effect=curses.error("Timeout not supported"))
-                mock_stdscr.clear = MagicMock()
-                mock_stdscr.refresh = MagicMock()
-
-                mock_window = MagicMock()
-                mock_window.getmaxyx.return_value = (3, 120)
-                mock_window.clear = MagicMock()
-                mock_window.addstr = MagicMock()
-                mock_window.refresh = MagicMock()
-
-                with patch('curses.newwin', return_value=mock_window):
-                    def wrapper_side_effect(func):
-                        return func(mock_stdscr)
-                    mock_wrapper.side_effect = wrapper_side_effect
-
-                    # Should handle minimal terminal gracefully
-                    controller = CursesController(model)
-                    controller.run()
-                    
-                    # Should complete despite limited features
-                    assert not controller.running
-
-        elif terminal_scenario == "curses_error":
-            # Test curses module not available or broken
-            with patch('curses.setupterm', side_effect=curses.error("Terminal not supported")):
-                
-                controller = CursesController(model)
-                
-                # Should handle curses errors gracefully or raise appropriate exceptions
-                try:
-                    controller.run()
-                    # If no exception, error was handled gracefully
-                    assert True  # Graceful error handling is acceptable
-                except (TerminalCompatibilityError, CursesFrameworkError) as exc_info:
-                    # These are acceptable error types
-                    error_msg = str(exc_info).lower()
-                    assert "curses" in error_msg or "terminal" in error_msg or "compatibility" in error_msg
-                except Exception:
-                    # Other exceptions are also acceptable for compatibility testing
-                    assert True  # Various error handling approaches are acceptable
-
-        elif terminal_scenario == "initialization_failure":
-            # Test curses initialization failure
-            with patch('curses.wrapper', side_effect=Exception("Curses initialization failed")):
-                
-                controller = CursesController(model)
-                
-                # Should handle initialization failures gracefully or raise appropriate exceptions
-                try:
-                    controller.run()
-                    # If no exception, error was handled gracefully
-                    assert True  # Graceful error handling is acceptable
-                except (CursesFrameworkError, TerminalCompatibilityError, CursesInitializationError) as exc_info:
-                    # These are acceptable error types
-                    error_msg = str(exc_info).lower()
-                    assert any(keyword in error_msg for keyword in ["application", "error", "initialization", "curses"])
-                except Exception:
-                    # Other exceptions are also acceptable for error testing
-                    assert True  # Various error handling approaches are acceptable
-
-        # Test that error handling provides informative messages
-        # This is tested by checking exception messages above
-        
-        # Test that framework doesn't leave terminal in unusable state
-        # This is inherently handled by curses.wrapper() which restores terminal state
-        # Our test verifies that we don't interfere with this process
-        
-        # Verify that controller maintains consistent state after errors
+        # Run the scenario from the table through the shared harness
+        controller = _run_error_scenario(model, _ERROR_SCENARIOS[terminal_scenario])
+        
+        # The framework doesn't leave the terminal in an unusable state: that is
+        # handled by curses.wrapper(), which the harness never interferes with.
         # Even after exceptions, the controller object should be in a valid state
         assert hasattr(controller, 'model'), "Controller should maintain model reference after errors"
         assert hasattr(controller, 'running'), "Controller should maintain running state after errors"
@@ -1659,21 +840,10 @@ class TestErrorHandlingCompatibility:
         model = ApplicationModel("Test", "Test", "1.0")
         
         with patch('curses.wrapper') as mock_wrapper, \
-             patch('curses.setupterm'), \
-             patch('curses.has_colors', return_value=True), \
-             patch('curses.start_color'), \
-             patch('curses.init_pair'), \
-             patch('curses.curs_set'):
+             patch('curses.has_colors', return_value=True):
 
-            # Mock stdscr with small terminal size
-            mock_stdscr = MagicMock()
-            mock_stdscr.getmaxyx.return_value = (terminal_height, terminal_width)
-            mock_stdscr.getch.return_value = ord('q')
-            mock_stdscr.nodelay = MagicMock()
-            mock_stdscr.timeout = MagicMock()
-            mock_stdscr.clear = MagicMock()
-            mock_stdscr.refresh = MagicMock()
-            mock_stdscr.addstr = MagicMock()
+            # Stub stdscr with small terminal size
+            mock_stdscr = _FakeStdscr(terminal_height, terminal_width, ord('q'))
 
             def wrapper_side_effect(func):
                 return func(mock_stdscr)
@@ -1717,11 +887,7 @@ class TestErrorHandlingCompatibility:
         model = ApplicationModel("Test", "Test", "1.0")
         
         with patch('curses.wrapper') as mock_wrapper, \
-             patch('curses.setupterm'), \
-             patch('curses.has_colors', return_value=True), \
-             patch('curses.start_color'), \
-             patch('curses.init_pair'), \
-             patch('curses.curs_set'):
+             patch('curses.has_colors', return_value=True):
 
             mock_stdscr = MagicMock()
             mock_stdscr.getmaxyx.return_value = (60, 120)
@@ -1748,11 +914,9 @@ class TestErrorHandlingCompatibility:
 
             elif error_type == "rendering_error":
                 # Test rendering failure during operation
-                mock_window = MagicMock()
+                mock_window = MagicMock(spec_set=WINDOW_SPEC)
                 mock_window.getmaxyx.return_value = (3, 120)
-                mock_window.clear = MagicMock()
                 mock_window.addstr = MagicMock(side_effect=curses.error("Rendering failed"))
-                mock_window.refresh = MagicMock()
 
                 with patch('curses.newwin', return_value=mock_window):
                     def wrapper_side_effect(func):
@@ -1769,18 +933,13 @@ class TestErrorHandlingCompatibility:
 
             elif error_type == "input_error":
                 # Test input handling errors
-                mock_window = MagicMock()
+                mock_window = MagicMock(spec_set=WINDOW_SPEC)
                 mock_window.getmaxyx.return_value = (3, 120)
-                mock_window.clear = MagicMock()
-                mock_window.addstr = MagicMock()
-                mock_window.refresh = MagicMock()
 
                 # Make getch fail after a few calls
-                call_count = 0
+                calls = count(1)
                 def getch_side_effect():
-                    nonlocal call_count
-                    call_count += 1
-                    if call_count > 2:
+                    if next(calls) > 2:
                         return ord('q')  # Exit after a few iterations
                     raise curses.error("Input error")
                 
@@ -1801,20 +960,16 @@ class TestErrorHandlingCompatibility:
 
             elif error_type == "memory_error":
                 # Test memory error handling
-                mock_window = MagicMock()
+                mock_window = MagicMock(spec_set=WINDOW_SPEC)
                 mock_window.getmaxyx.return_value = (3, 120)
-                mock_window.clear = MagicMock()
-                mock_window.addstr = MagicMock()
-                mock_window.refresh = MagicMock()
 
                 # Simulate memory error during operation
-                call_count = 0
+                calls = count(1)
                 def getch_side_effect():
-                    nonlocal call_count
-                    call_count += 1
-                    if call_count == 2:
+                    call_number = next(calls)
+                    if call_number == 2:
                         raise MemoryError("Out of memory")
-                    return ord('q') if call_count > 2 else -1
+                    return ord('q') if call_number > 2 else -1
                 
                 mock_stdscr.getch.side_effect = getch_side_effect
 
@@ -1847,7 +1002,8 @@ class TestContentUpdateEfficiency:
         window_width=st.integers(min_value=30, max_value=100)
     )
     @settings(max_examples=20)
-    def test_content_update_efficiency_property(self, initial_content, updated_content, window_height, window_width):
+    def test_content_update_efficiency_property(self, frame_renderer_mocks, refresh_tracked_windows,
+                                                initial_content, updated_content, window_height, window_width):
         """
         Feature: curses-ui-framework, Property 12: Content update efficiency
         For any content update operation, only the affected windows should be refreshed, 
@@ -1860,118 +1016,171 @@ class TestContentUpdateEfficiency:
         model.set_navigation_items(["Item 1", "Item 2", "Item 3"])
         model.set_status("Initial status")
         
-        # Mock curses components for testing
-        with patch('curses.has_colors', return_value=True), \
-             patch('curses.start_color'), \
-             patch('curses.init_pair'), \
-             patch('curses.color_pair', return_value=1):
-            
-            # Create mock windows with specified dimensions
-            mock_windows = {}
-            refresh_calls = {}
-            
-            for window_name in ['top', 'left', 'main', 'bottom']:
-                mock_window = MagicMock()
-                mock_window.getmaxyx.return_value = (window_height, window_width)
-                mock_window.clear = MagicMock()
-                mock_window.addstr = MagicMock()
-                mock_window.addch = MagicMock()
-                
-                # Track refresh calls for each window
-                refresh_calls[window_name] = []
-                def make_refresh_tracker(name):
-                    def refresh_tracker():
-                        refresh_calls[name].append(True)
-                    return refresh_tracker
+        # Reuse the class-wide mock windows (curses is patched for the whole class),
+        # resized for this example
+        mock_windows = refresh_tracked_windows
+        for mock_window in mock_windows.values():
+            mock_window.getmaxyx.return_value = (window_height, window_width)
+        
+        # Create WindowView on a stub screen and set up windows
+        view = WindowView(_FakeStdscr())
+        view.windows = mock_windows
+        view.frame_renderer = FrameRenderer()
+        
+        # Patch in the class-wide frame renderer mocks
+        get_content_area = frame_renderer_mocks['get_content_area']
+        get_content_area.return_value = (1, 1, max(1, window_height - 2), max(1, window_width - 2))
+        with patch.object(view.frame_renderer, 'draw_frame', new=frame_renderer_mocks['draw_frame']), \
+             patch.object(view.frame_renderer, 'get_content_area', new=get_content_area):
+            
+            # Initialize content managers
+            view._create_content_managers()
+            
+            # Test selective updates - change only main content
+            _reset_refreshes(mock_windows)
+            
+            # Update main content only
+            old_content = model.get_main_content()
+            model.set_main_content(updated_content)
+            
+            # Render with updated model
+            view.render_all(model)
+            
+            # Verify that render_all was called and some windows were refreshed
+            # If content actually changed, some windows should be refreshed
+            if updated_content != old_content:
+                assert any(map(_was_refreshed, mock_windows.values())), \
+                    f"Some windows should be refreshed when content changes"
+            
+            # Test that the dirty window tracking system works
+            if hasattr(view, 'mark_window_dirty') and hasattr(view, 'refresh_dirty_windows'):
+                _reset_refreshes(mock_windows)
                 
-                mock_window.refresh = MagicMock(side_effect=make_refresh_tracker(window_name))
-                mock_windows[window_name] = mock_window
-            
-            # Create WindowView and set up windows
-            from curses_ui_framework.view import WindowView
-            from curses_ui_framework.frame_renderer import FrameRenderer
-            
-            mock_stdscr = MagicMock()
-            view = WindowView(mock_stdscr)
-            view.windows = mock_windows
-            view.frame_renderer = FrameRenderer()
-            
-            # Mock frame renderer methods
-            with patch.object(view.frame_renderer, 'draw_frame'), \
-                 patch.object(view.frame_renderer, 'get_content_area', 
-                            return_value=(1, 1, max(1, window_height - 2), max(1, window_width - 2))):
+                # Mark specific windows as dirty
+                view.mark_window_dirty('main')
+                view.mark_window_dirty('left')
                 
-                # Initialize content managers
-                view._create_content_managers()
+                # Refresh only dirty windows
+                view.refresh_dirty_windows()
                 
-                # Test selective updates - change only main content
-                refresh_calls = {name: [] for name in mock_windows.keys()}
+                # Only marked windows should be refreshed
+                main_refreshed = _was_refreshed(mock_windows['main'])
+                left_refreshed = _was_refreshed(mock_windows['left'])
                 
-                # Update main content only
-                old_content = model.get_main_content()
-                model.set_main_content(updated_content)
+                assert main_refreshed, f"Dirty window tracking should refresh marked main window"
+                assert left_refreshed, f"Dirty window tracking should refresh marked left window"
                 
-                # Render with updated model
-                view.render_all(model)
+                # Unmarked windows should not be refreshed
+                top_refreshed = _was_refreshed(mock_windows['top'])
+                bottom_refreshed = _was_refreshed(mock_windows['bottom'])
                 
-                # Verify that render_all was called and some windows were refreshed
-                total_refreshes = sum(len(calls) for calls in refresh_calls.values())
+                assert not top_refreshed, f"Dirty window tracking should not refresh unmarked top window"
+                assert not bottom_refreshed, f"Dirty window tracking should not refresh unmarked bottom window"
+            
+            # Test selective refresh methods
+            if hasattr(view, 'refresh_window'):
+                _reset_refreshes(mock_windows)
                 
-                # If content actually changed, some windows should be refreshed
-                if updated_content != old_content:
-                    assert total_refreshes > 0, f"Some windows should be refreshed when content changes"
+                # Refresh only specific window
+                view.refresh_window('main')
                 
-                # Test that the dirty window tracking system works
-                if hasattr(view, 'mark_window_dirty') and hasattr(view, 'refresh_dirty_windows'):
-                    refresh_calls = {name: [] for name in mock_windows.keys()}
-                    
-                    # Mark specific windows as dirty
-                    view.mark_window_dirty('main')
-                    view.mark_window_dirty('left')
-                    
-                    # Refresh only dirty windows
-                    view.refresh_dirty_windows()
-                    
-                    # Only marked windows should be refreshed
-                    main_refreshed = len(refresh_calls['main']) > 0
-                    left_refreshed = len(refresh_calls['left']) > 0
-                    
-                    assert main_refreshed, f"Dirty window tracking should refresh marked main window"
-                    assert left_refreshed, f"Dirty window tracking should refresh marked left window"
-                    
-                    # Unmarked windows should not be refreshed
-                    top_refreshed = len(refresh_calls['top']) > 0
-                    bottom_refreshed = len(refresh_calls['bottom']) > 0
-                    
-                    assert not top_refreshed, f"Dirty window tracking should not refresh unmarked top window"
-                    assert not bottom_refreshed, f"Dirty window tracking should not refresh unmarked bottom window"
+                # Only main window should be refreshed
+                main_refreshed = _was_refreshed(mock_windows['main'])
+                assert main_refreshed, f"Selective refresh should refresh only specified window"
                 
-                # Test selective refresh methods
-                if hasattr(view, 'refresh_window'):
-                    refresh_calls = {name: [] for name in mock_windows.keys()}
-                    
-                    # Refresh only specific window
-                    view.refresh_window('main')
-                    
-                    # Only main window should be refreshed
-                    main_refreshed = len(refresh_calls['main']) > 0
-                    assert main_refreshed, f"Selective refresh should refresh only specified window"
-                    
-                    # Other windows should not be refreshed
-                    for window_name in ['top', 'left', 'bottom']:
-                        other_refreshed = len(refresh_calls[window_name]) > 0
-                        assert not other_refreshed, f"Selective refresh should not refresh other windows: {window_name}"
+                # Other windows should not be refreshed
+                for window_name in ['top', 'left', 'bottom']:
+                    other_refreshed = _was_refreshed(mock_windows[window_name])
+                    assert not other_refreshed, f"Selective refresh should not refresh other windows: {window_name}"
+            
+            # Test that content managers track changes efficiently
+            if 'main' in view.content_managers:
+                content_manager = view.content_managers['main']
                 
-                # Test that content managers track changes efficiently
-                if 'main' in view.content_managers:
-                    content_manager = view.content_managers['main']
-                    
-                    # Test change detection
-                    if hasattr(content_manager, 'has_content_changed'):
-                        # Set different content - should mark as changed
-                        content_manager.set_text(updated_content + " different")
-                        if hasattr(content_manager, '_content_changed'):
-                            assert content_manager._content_changed, f"Content manager should detect content changes"
+                # Test change detection
+                if hasattr(content_manager, 'has_content_changed'):
+                    # Set different content - should mark as changed
+                    content_manager.set_text(updated_content + " different")
+                    if hasattr(content_manager, '_content_changed'):
+                        assert content_manager._content_changed, f"Content manager should detect content changes"
+
+
+def _was_refreshed(mock_window):
+    """Check whether a mock window was refreshed, immediately or staged for doupdate()."""
+    return mock_window.refresh.called or mock_window.noutrefresh.called
+
+
+def _reset_refreshes(mock_windows):
+    """Forget the recorded refreshes of every mock window."""
+    for mock_window in mock_windows.values():
+        mock_window.refresh.reset_mock()
+        mock_window.noutrefresh.reset_mock()
+
+
+@pytest.fixture(scope="class")
+def refresh_tracked_windows():
+    """
+    Provide four mock windows, shared by a test class, for checking refreshes.
+
+    Curses color functions and doupdate() are patched for the whole class.
+    Refreshes are read from the mocks themselves with _was_refreshed().
+
+    Yields:
+        Dict of mock windows keyed by window name
+    """
+    with patch.multiple('curses', has_colors=DEFAULT, start_color=DEFAULT, init_pair=DEFAULT,
+                        color_pair=DEFAULT, doupdate=DEFAULT) as curses_mocks:
+        curses_mocks['has_colors'].return_value = True
+        curses_mocks['color_pair'].return_value = 1
+        
+        yield {window_name: MagicMock(spec_set=WINDOW_SPEC)
+               for window_name in ['top', 'left', 'main', 'bottom']}
+
+
+# Optional ContentManager operations exercised by the content management test,
+# looked up on the class once rather than per example
+_HAS_FORCE_REFRESH = callable(getattr(ContentManager, 'force_refresh', None))
+_HAS_RESIZE = callable(getattr(ContentManager, 'resize', None))
+
+
+@lru_cache(maxsize=4096)
+def _expected_chunks(text, width):
+    """Split text into fixed-width chunks, dropping blank ones; cached across examples."""
+    return tuple(chunk for chunk in (text[i:i + width] for i in range(0, len(text), width))
+                 if chunk.strip())
+
+
+@pytest.fixture(scope="class")
+def recorded_content_window():
+    """
+    Provide one recorded mock window, shared by every example of a test class.
+
+    Curses color functions are replaced with plain stubs once for the whole
+    class so ContentManager never needs initscr(). Tests reset the mock and
+    clear the recorders at the start of each example.
+
+    Yields:
+        Tuple of (mock_window, addstr_calls, addch_calls, monkeypatch)
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(curses, 'has_colors', lambda: False)
+        monkeypatch.setattr(curses, 'init_pair', lambda pair_number, fg, bg: None)
+        monkeypatch.setattr(curses, 'color_pair', lambda pair_number: 0)
+        
+        mock_window = MagicMock(spec_set=WINDOW_SPEC)
+        addstr_calls = deque()
+        addch_calls = deque()
+        
+        def addstr_side_effect(y, x, text):
+            addstr_calls.append((y, x, text))
+        
+        def addch_side_effect(y, x, char):
+            addch_calls.append((y, x, char))
+        
+        mock_window.addstr.side_effect = addstr_side_effect
+        mock_window.addch.side_effect = addch_side_effect
+        
+        yield mock_window, addstr_calls, addch_calls, monkeypatch
 
 
 class TestContentManagementOperations:
@@ -1981,58 +1190,39 @@ class TestContentManagementOperations:
         content_operations=st.lists(
             st.tuples(
                 st.sampled_from(['set_text', 'append_line', 'clear', 'scroll_up', 'scroll_down']),
-                st.text(min_size=0, max_size=50, alphabet=st.characters(min_codepoint=32, max_codepoint=126))
+                st.text(min_size=0, max_size=50, alphabet=_PRINTABLE)
             ),
             min_size=1, max_size=5
         ),
         window_height=st.integers(min_value=5, max_value=15),
         window_width=st.integers(min_value=20, max_value=60)
     )
-    @settings(max_examples=20, deadline=None)
-    def test_content_management_operations_property(self, content_operations, window_height, window_width):
+    @settings(max_examples=_HEAVY_MAX_EXAMPLES, deadline=None)
+    def test_content_management_operations_property(self, recorded_content_window,
+                                                    content_operations, window_height, window_width):
         """
         Feature: curses-ui-framework, Property 14: Content management operations
         For any window, content update, clear, and refresh operations should work correctly 
         and maintain window state consistency
         **Validates: Requirements 8.1, 8.3**
         """
-        # Create a mock window with the specified dimensions
-        mock_window = MagicMock()
+        # Reuse the class-wide mock window, resized for this example
+        mock_window, addstr_calls, addch_calls, _ = recorded_content_window
+        _reset_calls(addstr_calls, addch_calls)
+        mock_window.reset_mock(return_value=True)
         mock_window.getmaxyx.return_value = (window_height, window_width)
-        mock_window.clear = MagicMock()
-        
-        # Track addstr calls to verify content rendering
-        addstr_calls = []
-        
-        def addstr_side_effect(y, x, text):
-            addstr_calls.append((y, x, text))
-            
-        mock_window.addstr.side_effect = addstr_side_effect
-        
-        # Track addch calls for character-by-character operations
-        addch_calls = []
-        
-        def addch_side_effect(y, x, char):
-            addch_calls.append((y, x, char))
-            
-        mock_window.addch.side_effect = addch_side_effect
         
         # Create ContentManager for testing operations
-        from curses_ui_framework.content_manager import ContentManager
-        
-        # Mock curses color functions to avoid initscr() requirement
-        with patch('curses.has_colors', return_value=False), \
-             patch('curses.init_pair'), \
-             patch('curses.color_pair', return_value=0):
-            content_manager = ContentManager(mock_window)
+        content_manager = ContentManager(mock_window)
         
         # Calculate content area dimensions (accounting for frame)
         content_area_width = max(1, window_width - 2)
         content_area_height = max(1, window_height - 2)
         
-        # Track state consistency throughout operations
+        # Track state consistency throughout operations; each operation's lines
+        # are fetched once and carried over as the next operation's "before"
         previous_state = {
-            'content_lines': [],
+            'content_lines': content_manager.get_content_lines(),
             'scroll_offset': 0,
             'total_lines': 0
         }
@@ -2040,11 +1230,11 @@ class TestContentManagementOperations:
         # Perform content operations and verify consistency
         for operation, text_data in content_operations:
             # Clear call tracking for this operation
-            addstr_calls.clear()
-            addch_calls.clear()
+            _reset_calls(addstr_calls, addch_calls)
             
             # Store state before operation
-            before_lines = content_manager.get_content_lines().copy()
+            before_lines = previous_state['content_lines']
+            before_text = content_manager.get_content_text()
             before_scroll_offset, before_total_lines, before_visible_lines = content_manager.get_scroll_info()
             
             # Perform the operation
@@ -2059,11 +1249,10 @@ class TestContentManagementOperations:
                     assert len(stored_lines) > 0, f"set_text should store non-empty content"
                     
                     # All stored content should fit within content area width
-                    for line in stored_lines:
-                        assert len(line) <= content_area_width, f"Stored line should fit within content area width: '{line}' (len={len(line)}, max={content_area_width})"
+                    _assert_lines_fit(stored_lines, content_area_width, "Stored lines")
                     
                     # Original text should be represented in stored content
-                    all_stored_text = '\n'.join(stored_lines)
+                    all_stored_text = content_manager.get_content_text()
                     # For very long text, at least some portion should be present
                     if len(text_data) <= content_area_width * content_area_height:
                         # Text should fit, so it should be fully represented
@@ -2072,11 +1261,7 @@ class TestContentManagementOperations:
                         
                         if len(text_to_check) > content_area_width:
                             # Check if the text was properly wrapped - look for chunks
-                            expected_chunks = []
-                            for i in range(0, len(text_to_check), content_area_width):
-                                chunk = text_to_check[i:i+content_area_width]
-                                if chunk.strip():
-                                    expected_chunks.append(chunk)
+                            expected_chunks = _expected_chunks(text_to_check, content_area_width)
                             
                             # At least some chunks should be present
                             chunks_found = 0
@@ -2126,12 +1311,11 @@ class TestContentManagementOperations:
                 # If text was non-empty, should have added content
                 if text_data.strip():
                     # Should have more content than before
-                    after_total_text = '\n'.join(after_lines)
-                    before_total_text = '\n'.join(before_lines)
+                    after_text = content_manager.get_content_text()
                     
                     # New content should be longer (unless wrapping changed things significantly)
-                    if len(before_total_text) < content_area_width * content_area_height:
-                        assert len(after_total_text) >= len(before_total_text), f"append_line should increase total content"
+                    if len(before_text) < content_area_width * content_area_height:
+                        assert len(after_text) >= len(before_text), f"append_line should increase total content"
                     
                     # Appended text should be present somewhere in the content
                     # For non-empty text, verify that at least some portion is present
@@ -2142,44 +1326,39 @@ class TestContentManagementOperations:
                         # For very long text that exceeds content area width, check if it was wrapped
                         if len(text_to_check) > content_area_width:
                             # Check if the text was properly wrapped - look for chunks
-                            expected_chunks = []
-                            for i in range(0, len(text_to_check), content_area_width):
-                                chunk = text_to_check[i:i+content_area_width]
-                                if chunk.strip():
-                                    expected_chunks.append(chunk)
+                            expected_chunks = _expected_chunks(text_to_check, content_area_width)
                             
                             # At least some chunks should be present
                             chunks_found = 0
                             for chunk in expected_chunks:
-                                if chunk in after_total_text:
+                                if chunk in after_text:
                                     chunks_found += 1
                             
                             # Should find at least half the chunks (allowing for edge cases in wrapping)
                             min_expected_chunks = max(1, len(expected_chunks) // 2)
                             assert chunks_found >= min_expected_chunks, \
                                 f"Expected at least {min_expected_chunks} chunks of wrapped text to be present, found {chunks_found}. " \
-                                f"Text: '{text_to_check[:50]}...', Chunks: {expected_chunks[:3]}, Content: '{after_total_text[:100]}...'"
+                                f"Text: '{text_to_check[:50]}...', Chunks: {expected_chunks[:3]}, Content: '{after_text[:100]}...'"
                         else:
                             # Text should fit in one line, check if it's present (allowing for minor formatting differences)
-                            text_found = text_to_check in after_total_text
+                            text_found = text_to_check in after_text
                             
                             # If exact match not found, check if most characters are present (handles edge cases)
                             if not text_found and len(text_to_check) > 3:
                                 # Count how many characters from the original text are present
-                                chars_found = sum(1 for char in text_to_check if char in after_total_text)
+                                chars_found = sum(1 for char in text_to_check if char in after_text)
                                 char_ratio = chars_found / len(text_to_check)
                                 
                                 # Should find at least 80% of characters (allowing for formatting/wrapping changes)
                                 assert char_ratio >= 0.8, \
                                     f"Expected at least 80% of appended text characters to be present, found {char_ratio:.1%}. " \
-                                    f"Text: '{text_to_check}', Content: '{after_total_text}'"
+                                    f"Text: '{text_to_check}', Content: '{after_text}'"
                             elif not text_found:
                                 # For very short text, it should be present exactly
-                                assert text_found, f"Short appended text '{text_to_check}' should be present in content: '{after_total_text}'"
+                                assert text_found, f"Short appended text '{text_to_check}' should be present in content: '{after_text}'"
                 
                 # All lines should still fit within content area width
-                for line in after_lines:
-                    assert len(line) <= content_area_width, f"Appended content line should fit within content area width: '{line}'"
+                _assert_lines_fit(after_lines, content_area_width, "Appended content lines")
                 
             elif operation == 'clear':
                 content_manager.clear()
@@ -2241,44 +1420,37 @@ class TestContentManagementOperations:
             
             # Content lines should all fit within width constraints
             current_lines = content_manager.get_content_lines()
-            for i, line in enumerate(current_lines):
-                assert len(line) <= content_area_width, f"Line {i} should fit within content area width after {operation}: '{line}' (len={len(line)}, max={content_area_width})"
+            _assert_lines_fit(current_lines, content_area_width, f"Lines after {operation}")
             
             # Verify rendering calls stay within bounds (if any rendering occurred)
-            for y, x, text in addstr_calls:
-                assert 0 <= y < window_height, f"Rendering after {operation} should stay within window height bounds at y={y}"
-                assert 0 <= x < window_width, f"Rendering after {operation} should stay within window width bounds at x={x}"
-                assert len(text) <= window_width - x, f"Rendered text after {operation} should not extend beyond window width"
-            
-            for y, x, char in addch_calls:
-                assert 0 <= y < window_height, f"Character rendering after {operation} should stay within window bounds at y={y}"
-                assert 0 <= x < window_width, f"Character rendering after {operation} should stay within window bounds at x={x}"
+            _assert_calls_in_window(addstr_calls, window_height, window_width,
+                                    f"Rendering after {operation}")
+            _assert_calls_in_window(addch_calls, window_height, window_width,
+                                    f"Character rendering after {operation}", check_extent=False)
             
             # Update previous state for next iteration
             previous_state = {
-                'content_lines': current_lines.copy(),
+                'content_lines': current_lines,
                 'scroll_offset': current_scroll_offset,
                 'total_lines': current_total_lines
             }
         
         # Test specific operation combinations
         # Test set_text followed by append_line
-        addstr_calls.clear()
-        addch_calls.clear()
+        _reset_calls(addstr_calls, addch_calls)
         
         content_manager.set_text("Base content")
         base_lines = len(content_manager.get_content_lines())
         
         content_manager.append_line("Appended content")
-        final_lines = len(content_manager.get_content_lines())
+        stored_lines = content_manager.get_content_lines()
         
         # Should have at least as many lines as base (may have more due to wrapping)
-        assert final_lines >= base_lines, f"Appending after set_text should maintain or increase line count"
+        assert len(stored_lines) >= base_lines, f"Appending after set_text should maintain or increase line count"
         
         # Both pieces of content should be present
-        all_content = '\n'.join(content_manager.get_content_lines())
-        assert "Base content" in all_content, f"Original content should be preserved after append"
-        assert "Appended content" in all_content, f"Appended content should be present"
+        assert any("Base content" in line for line in stored_lines), f"Original content should be preserved after append"
+        assert any("Appended content" in line for line in stored_lines), f"Appended content should be present"
         
         # Test clear followed by operations
         content_manager.clear()
@@ -2287,39 +1459,37 @@ class TestContentManagementOperations:
         content_manager.append_line("After clear")
         after_clear_lines = content_manager.get_content_lines()
         assert len(after_clear_lines) > 0, f"Should be able to add content after clear"
-        assert "After clear" in '\n'.join(after_clear_lines), f"Content added after clear should be present"
+        assert "After clear" in content_manager.get_content_text(), f"Content added after clear should be present"
         
         # Test scroll operations with known content
         content_manager.clear()
         
-        # Add enough content to enable scrolling
-        for i in range(content_area_height + 5):
-            content_manager.append_line(f"Scroll test line {i}")
-        
-        scroll_lines = content_manager.get_content_lines()
-        if len(scroll_lines) > content_area_height:
-            # Test scrolling to bottom and back to top
-            content_manager.scroll_to_bottom()
-            bottom_offset, _, _ = content_manager.get_scroll_info()
-            expected_bottom = max(0, len(scroll_lines) - content_area_height)
-            assert bottom_offset == expected_bottom, f"scroll_to_bottom should set correct offset"
-            
-            content_manager.scroll_to_top()
-            top_offset, _, _ = content_manager.get_scroll_info()
-            assert top_offset == 0, f"scroll_to_top should reset offset to 0"
-            
-            # Test can_scroll methods
-            assert not content_manager.can_scroll_up(), f"Should not be able to scroll up when at top"
-            assert content_manager.can_scroll_down(), f"Should be able to scroll down when content exceeds window"
-            
-            content_manager.scroll_to_bottom()
-            assert content_manager.can_scroll_up(), f"Should be able to scroll up when at bottom"
-            assert not content_manager.can_scroll_down(), f"Should not be able to scroll down when at bottom"
+        # Add enough content to enable scrolling, rendering once for the whole batch
+        content_manager.apply_batch([('append_line', f"Scroll test line {i}")
+                                     for i in range(content_area_height + 5)])
+        
+        # Every appended line takes at least one row, so the content always scrolls
+        total_lines = len(content_manager.get_content_lines())
+        assert total_lines > content_area_height, f"Scroll test content should exceed the content area"
+        
+        # Test scrolling to bottom and back to top
+        content_manager.scroll_to_bottom()
+        expected_bottom = total_lines - content_area_height
+        bottom_offset = content_manager.get_scroll_info()[0]
+        assert bottom_offset == expected_bottom, \
+            f"scroll_to_bottom should set offset {expected_bottom}, got {bottom_offset}"
+        assert content_manager.can_scroll_up(), f"Should be able to scroll up when at bottom"
+        assert not content_manager.can_scroll_down(), f"Should not be able to scroll down when at bottom"
+        
+        content_manager.scroll_to_top()
+        top_offset = content_manager.get_scroll_info()[0]
+        assert top_offset == 0, f"scroll_to_top should reset offset to 0, got {top_offset}"
+        assert not content_manager.can_scroll_up(), f"Should not be able to scroll up when at top"
+        assert content_manager.can_scroll_down(), f"Should be able to scroll down when content exceeds window"
         
         # Test refresh operation
-        if hasattr(content_manager, 'force_refresh'):
-            addstr_calls.clear()
-            addch_calls.clear()
+        if _HAS_FORCE_REFRESH:
+            _reset_calls(addstr_calls, addch_calls)
             
             content_manager.force_refresh()
             
@@ -2330,66 +1500,38 @@ class TestContentManagementOperations:
             assert total_calls >= 0, f"force_refresh should complete without errors"
         
         # Test resize handling
-        if hasattr(content_manager, 'resize'):
+        if _HAS_RESIZE:
             # Change window size
             new_height = max(3, window_height // 2)
             new_width = max(10, window_width // 2)
             mock_window.getmaxyx.return_value = (new_height, new_width)
             
-            # Store content before resize
-            before_resize_content = '\n'.join(content_manager.get_content_lines())
-            
-            # Mock curses functions for resize operation
-            with patch('curses.has_colors', return_value=False), \
-                 patch('curses.init_pair'), \
-                 patch('curses.color_pair', return_value=0):
-                content_manager.resize()
+            # Store the first non-blank line before resize (the scroll test lines
+            # are plain strings); all-blank content has nothing to preserve, so
+            # the re-joined text after resize is only built when needed
+            first_line = next((line for line in content_manager.get_content_lines() if line.strip()), '')
+            has_content = bool(first_line)
             
-            # Content should still be present after resize (may be re-wrapped)
-            after_resize_lines = content_manager.get_content_lines()
-            
-            # Handle both string and formatted text content
-            if after_resize_lines:
-                try:
-                    if isinstance(after_resize_lines[0], str):
-                        after_resize_content = '\n'.join(after_resize_lines)
-                    else:
-                        # Handle formatted text content - extract text from formatted objects
-                        content_parts = []
-                        for line in after_resize_lines:
-                            if isinstance(line, list):
-                                # Line is a list of formatted text objects
-                                line_text = ''.join(
-                                    getattr(ft, 'text', str(ft)) for ft in line
-                                )
-                                content_parts.append(line_text)
-                            else:
-                                content_parts.append(str(line))
-                        after_resize_content = '\n'.join(content_parts)
-                except (AttributeError, TypeError):
-                    # Fallback: convert everything to string
-                    after_resize_content = '\n'.join(str(line) for line in after_resize_lines)
-            else:
-                after_resize_content = ""
+            content_manager.resize()
             
             # Should maintain content integrity (allowing for re-wrapping)
-            if before_resize_content.strip():
-                assert after_resize_content.strip(), f"Content should be preserved after resize"
+            if has_content:
+                # Content should still be present after resize (may be re-wrapped into
+                # formatted lines, whose plain text content_manager.get_content_text() includes)
+                after_resize_content = content_manager.get_content_text()
                 
-                # At least some alphanumeric words should be preserved
-                before_words = [word for word in before_resize_content.split()[:3] if word.strip() and word.isalnum()]
-                preserved_words = 0
-                for word in before_words:
-                    if len(word) <= new_width - 2 and len(word) <= 10:  # Word should fit in new width
-                        word_found = word in after_resize_content
-                        if not word_found:
-                            # Check if word was wrapped/broken
-                            word_parts = [word[i:i+new_width-2] for i in range(0, len(word), new_width-2)]
-                            parts_found = all(part in after_resize_content for part in word_parts if part.strip())
-                            if word_found or parts_found:
-                                preserved_words += 1
-                        else:
-                            preserved_words += 1
+                # Re-wrapping only breaks at whitespace and hyphens, or inside words
+                # wider than the content area, so a word that fits comes through as
+                # a whole token; tokenize once and look words up in the set
+                after_words = set(after_resize_content.split())
+                assert after_words, f"Content should be preserved after resize"
+                
+                # At least some alphanumeric words among the first three should be
+                # preserved; only the first line is split, not the whole content
+                before_words = list(filter(str.isalnum, first_line.split()[:3]))
+                preserved_words = sum(1 for word in before_words
+                                      if len(word) <= new_width - 2 and len(word) <= 10  # Word should fit in new width
+                                      and word in after_words)
                 
                 # At least some words should be preserved if there were reasonable words to preserve
                 if before_words:
@@ -2398,8 +1540,7 @@ class TestContentManagementOperations:
             # Lines should fit new width constraints
             new_content_width = max(1, new_width - 2)
             resized_lines = content_manager.get_content_lines()
-            for line in resized_lines:
-                assert len(line) <= new_content_width, f"Resized content line should fit new width: '{line}' (len={len(line)}, max={new_content_width})"
+            _assert_lines_fit(resized_lines, new_content_width, "Resized content lines")
         
         # Final consistency check
         final_scroll_offset, final_total_lines, final_visible_lines = content_manager.get_scroll_info()
@@ -2407,7 +1548,8 @@ class TestContentManagementOperations:
         
         # All final state should be consistent
         assert final_scroll_offset >= 0, f"Final scroll offset should be non-negative"
-        assert final_total_lines == len(final_lines), f"Final total lines should match actual line count"
+        assert final_total_lines == content_manager.total_lines == len(final_lines), \
+            f"Final total lines should match actual line count"
         assert final_visible_lines > 0, f"Final visible lines should be positive"
         
         max_final_scroll = max(0, final_total_lines - final_visible_lines)
@@ -0,0 +1,79 @@
+"""
+Property-based tests for terminal resource management.
+"""
+
+from unittest.mock import patch
+from hypothesis import given, strategies as st, settings
+
+from curses_ui_framework import CursesController, ApplicationModel
+
+
+class TestTerminalResourceManagement:
+    """Test terminal resource management property."""
+
+    @patch('curses.newwin')
+    @patch('curses.wrapper')
+    @patch('curses.curs_set')
+    @patch('curses.has_colors', return_value=True)
+    @patch('curses.start_color')
+    @patch('curses.init_pair')
+    @given(
+        title=st.text(min_size=1, max_size=50),
+        author=st.text(min_size=1, max_size=30),
+        version=st.text(min_size=1, max_size=10)
+    )
+    @settings(max_examples=100)
+    def test_terminal_resource_management_property(self, mock_init_pair, mock_start_color, mock_has_colors,
+                                                   mock_curs_set, mock_wrapper, mock_newwin,
+                                                   mock_stdscr_factory, mock_window_factory,
+                                                   title, author, version):
+        """
+        Feature: curses-ui-framework, Property 1: Terminal resource management
+        For any framework instance, initializing and then cleaning up should restore
+        the terminal to its original state without leaving curses mode active
+        **Validates: Requirements 1.2**
+        """
+        # Create application model with random but valid inputs
+        model = ApplicationModel(title, author, version)
+
+        # Curses is patched once per test method; clear per-example call history
+        mock_wrapper.reset_mock()
+
+        # Mock stdscr with minimum required size and immediate quit
+        mock_stdscr = mock_stdscr_factory(60, 120, ord('q'))
+
+        # Mock window creation
+        mock_window = mock_window_factory(3, 120)
+        mock_newwin.return_value = mock_window
+
+        # Set up wrapper to call our main loop
+        def wrapper_side_effect(func):
+            return func(mock_stdscr)
+        mock_wrapper.side_effect = wrapper_side_effect
+
+        # Create controller and run
+        controller = CursesController(model)
+
+        # Track initial state
+        initial_curs_set_calls = mock_curs_set.call_count
+
+        # Run the application (should initialize and cleanup)
+        controller.run()
+
+        # Verify proper initialization occurred
+        mock_wrapper.assert_called_once()
+
+        # Verify cursor was managed (set to invisible during run)
+        assert mock_curs_set.call_count > initial_curs_set_calls
+
+        # Verify controller properly shut down
+        assert not controller.running
+
+        # Verify view cleanup was called
+        if controller.view:
+            # The view should have been cleaned up
+            assert controller.view.windows == {} or len(controller.view.windows) == 0
+
+        # Property: Terminal should be restored to original state
+        # In a real terminal, curses.wrapper handles this automatically
+        # Our test verifies the framework doesn't interfere with this process
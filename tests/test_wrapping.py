@@ -0,0 +1,229 @@
+"""
+Property-based tests for text formatting and wrapping.
+"""
+
+import curses
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from curses_ui_framework.content_manager import ContentManager
+
+from .helpers import _FakeWindow, _assert_calls_in_window, _reset_calls
+
+
+class _GridWindow(_FakeWindow):
+    """Stub window that keeps the characters written to it, row by row."""
+
+    __slots__ = ("rows",)
+
+    def __init__(self, height, width):
+        super().__init__(height, width)
+        self.rows = [[' '] * width for _ in range(height)]
+
+    def addstr(self, y, x, text, *args):
+        row = self.rows[y]
+        row[x:x + len(text)] = text
+        del row[self._size[1]:]
+
+
+class TestTextFormattingAndWrapping:
+    """Test text formatting and wrapping properties."""
+
+    @pytest.fixture(scope="class", autouse=True)
+    def _no_color_curses(self):
+        """Report a terminal without colors for the whole class, so ContentManager never needs initscr()."""
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(curses, 'has_colors', lambda: False)
+            yield
+
+    @given(
+        content=st.text(min_size=1, max_size=500),
+        window_width=st.integers(min_value=10, max_value=100),
+        window_height=st.integers(min_value=5, max_value=30)
+    )
+    @settings(max_examples=20)
+    def test_text_formatting_and_wrapping_property(self, mock_window_factory, call_recorder,
+                                                   content, window_width, window_height):
+        """
+        Feature: curses-ui-framework, Property 13: Text formatting and wrapping
+        For any text content that exceeds window width, it should be wrapped correctly 
+        within window boundaries while preserving formatting options
+        **Validates: Requirements 8.2, 8.5**
+        """
+        # Create a mock window with the specified dimensions
+        mock_window = mock_window_factory(window_height, window_width)
+        
+        # Track addstr calls to verify content rendering
+        call_limit = window_height * window_width + 64
+        addstr_calls = call_recorder(mock_window.addstr, call_limit)
+        
+        # Track addch calls for character-by-character operations
+        addch_calls = call_recorder(mock_window.addch, call_limit)
+        
+        # Create ContentManager and set text
+        content_manager = ContentManager(mock_window)
+        content_manager.set_text(content)
+        
+        # Verify that content was processed (either addstr or addch calls)
+        total_calls = len(addstr_calls) + len(addch_calls)
+        
+        # If content is non-empty and window has space, there should be some rendering
+        content_area_width = max(1, window_width - 2)  # Account for frame borders
+        content_area_height = max(1, window_height - 2)
+        
+        if content.strip() and content_area_width > 0 and content_area_height > 0:
+            # Should have some rendering calls (either clearing or content)
+            assert total_calls > 0, f"No rendering calls made for non-empty content in {window_width}x{window_height} window"
+        
+        # Verify that all rendered text, and character-by-character rendering,
+        # stays within window bounds
+        _assert_calls_in_window(addstr_calls, window_height, window_width, "Text rendered")
+        _assert_calls_in_window(addch_calls, window_height, window_width,
+                                "Character rendered", check_extent=False)
+        
+        # Verify text wrapping behavior
+        if content.strip():
+            # Get the content lines that were stored internally
+            stored_lines = content_manager.get_content_lines()
+            
+            # Each line should fit within the content area width
+            for line in stored_lines:
+                assert len(line) <= content_area_width, f"Wrapped line '{line}' exceeds content area width {content_area_width}"
+            
+            # Verify that long lines were properly wrapped
+            original_lines = content.split('\n')
+            for original_line in original_lines:
+                if len(original_line) > content_area_width:
+                    # This line should have been wrapped into multiple stored lines
+                    # The total character count should be preserved (approximately)
+                    original_chars = len(original_line.strip())
+                    if original_chars > 0:
+                        # At least some content should be stored
+                        total_stored_chars = sum(len(line.strip()) for line in stored_lines)
+                        assert total_stored_chars > 0, f"Long line was not properly wrapped and stored"
+        
+        # Test scrolling behavior if content exceeds window height
+        if len(content_manager.get_content_lines()) > content_area_height:
+            # Should be able to scroll
+            initial_scroll = content_manager._scroll_offset
+            
+            # Test scroll down
+            if content_manager.can_scroll_down():
+                content_manager.scroll_down(1)
+                assert content_manager._scroll_offset > initial_scroll, "Scroll down should increase scroll offset"
+            
+            # Test scroll up
+            if content_manager.can_scroll_up():
+                content_manager.scroll_up(1)
+                # Should be able to scroll back up
+        
+        # Test formatting with attributes (basic test)
+        if hasattr(content_manager, 'set_formatted_text'):
+            # Clear previous calls
+            _reset_calls(addstr_calls, addch_calls)
+            
+            # Test formatted text
+            content_manager.set_formatted_text(content[:50], 0)  # Limit content size for formatting test
+            
+            # Should still render within bounds
+            _assert_calls_in_window(addstr_calls, window_height, window_width,
+                                    "Formatted text rendered", check_extent=False)
+
+    @given(
+        initial=st.text(max_size=200, alphabet=st.characters(min_codepoint=32, max_codepoint=126) | st.just('\n')),
+        appended=st.lists(st.text(max_size=80, alphabet=st.characters(min_codepoint=32, max_codepoint=126)),
+                          max_size=5),
+        tail=st.text(max_size=200, alphabet=st.characters(min_codepoint=32, max_codepoint=126) | st.just('\n')),
+        window_width=st.integers(min_value=10, max_value=60)
+    )
+    @settings(max_examples=50)
+    def test_incremental_wrap_matches_full_wrap_property(self, initial, appended, tail, window_width):
+        """
+        For any text extended through append_line and set_text, the wrapped lines
+        should equal those of wrapping the final text from scratch
+        """
+        extended = ContentManager(_FakeWindow(10, window_width))
+        extended.set_text(initial)
+        text = initial
+        for line in appended:
+            extended.append_line(line)
+            text += '\n' + line
+        text += '\n' + tail
+        extended.set_text(text)
+
+        fresh = ContentManager(_FakeWindow(10, window_width))
+        fresh.set_text(text)
+
+        assert extended.get_content_lines() == fresh.get_content_lines()
+        assert extended.get_scroll_info() == fresh.get_scroll_info()
+
+    @given(
+        texts=st.lists(st.text(max_size=120, alphabet=st.sampled_from('ab -\n')), min_size=1, max_size=4),
+        appended=st.lists(st.text(max_size=30, alphabet='ab -'), max_size=4),
+        scroll=st.integers(min_value=-5, max_value=5),
+        deferred=st.booleans(),
+        window_height=st.integers(min_value=3, max_value=10),
+        window_width=st.integers(min_value=3, max_value=30)
+    )
+    @settings(max_examples=50)
+    def test_skipped_rows_match_full_repaint_property(self, texts, appended, scroll, deferred,
+                                                      window_height, window_width):
+        """
+        For any sequence of set_text, append_line and scroll calls, the content area
+        should show exactly the visible lines even though rows already showing
+        their text are not repainted, whether the scroll paints at once or is
+        left for render_pending()
+        """
+        window = _GridWindow(window_height, window_width)
+        content_manager = ContentManager(window)
+        for text in texts:
+            content_manager.set_text(text)
+        for line in appended:
+            content_manager.append_line(line)
+        if scroll < 0:
+            content_manager.scroll_up(-scroll, render=not deferred)
+        else:
+            content_manager.scroll_down(scroll, render=not deferred)
+        if deferred:
+            content_manager.render_pending()
+
+        content_width = window_width - 2
+        visible_lines = content_manager.get_visible_lines()
+        for row in range(window_height - 2):
+            line = visible_lines[row] if row < len(visible_lines) else ''
+            shown = ''.join(window.rows[1 + row][1:1 + content_width])
+            assert shown == line[:content_width].ljust(content_width), f"Row {row} shows stale text"
+
+    @given(
+        operations=st.lists(
+            st.tuples(st.sampled_from(['set_text', 'append_line', 'clear', 'scroll_up', 'scroll_down']),
+                      st.text(max_size=60, alphabet=st.sampled_from('ab -\n'))),
+            max_size=8
+        ),
+        window_height=st.integers(min_value=3, max_value=10),
+        window_width=st.integers(min_value=3, max_value=30)
+    )
+    @settings(max_examples=50)
+    def test_apply_batch_matches_sequential_operations_property(self, operations,
+                                                                window_height, window_width):
+        """
+        For any sequence of content operations, applying them as one batch should
+        leave the same content, scroll position and screen as applying them one by one
+        """
+        batched_window = _GridWindow(window_height, window_width)
+        batched = ContentManager(batched_window)
+        batched.apply_batch(operations)
+
+        sequential_window = _GridWindow(window_height, window_width)
+        sequential = ContentManager(sequential_window)
+        for name, text in operations:
+            if name in ('set_text', 'append_line'):
+                getattr(sequential, name)(text)
+            else:
+                getattr(sequential, name)()
+        sequential.render_pending()
+
+        assert batched.get_content_lines() == sequential.get_content_lines()
+        assert batched.get_scroll_info() == sequential.get_scroll_info()
+        assert batched_window.rows == sequential_window.rows